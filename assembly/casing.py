@@ -1,9 +1,11 @@
 # assembly/casing.py
 
 import logging
+from typing import Optional
 
 from build123d import Part, SortBy
 
+from cad.boolean_fusion import part_bbox
 from cad.cases.case_model_base import CasePart
 from cad.cases.case_model_box import CaseBox
 from cad.cases.case_model_cylinder import CaseCylinder
@@ -52,6 +54,53 @@ def puzzle_casing():
     return case_parts, base_parts, cut_shape
 
 
+class PathContactIndex:
+    """
+    Bounding boxes of the standard paths, built once per merge and shared by
+    the mounting ring subtraction and the bridge matching, so only paths a shape
+    can touch take part in distance tests and Booleans.
+    """
+
+    def __init__(self, standard_paths: list[Part], tolerance: float = 0.01):
+        self.standard_paths = standard_paths
+        self.tolerance = tolerance
+        self.boxes = [part_bbox(standard_path) for standard_path in standard_paths]
+
+    def candidates(self, shape: Part) -> list[int]:
+        """Indexes of the paths whose bounding box overlaps the one of shape."""
+        box = part_bbox(shape)
+        return [
+            index
+            for index, path_box in enumerate(self.boxes)
+            if path_box.overlaps(box, self.tolerance)
+        ]
+
+    def merge(self, index: int, fragment: Part) -> None:
+        """Fuse a fragment into a standard path, growing its bounding box."""
+        self.standard_paths[index] = self.standard_paths[index] + fragment
+        self.boxes[index] = self.boxes[index].union(part_bbox(fragment))
+
+    def match(self, bridge: Part) -> Optional[int]:
+        """
+        Index of the first standard path the bridge overlaps, or None. Candidates
+        from the bounding boxes are narrowed down with a distance test, Boolean
+        intersections only run for the paths that touch the bridge. A bridge that
+        only touches a path does not match it.
+        """
+        touching = [
+            index
+            for index in self.candidates(bridge)
+            if bridge.distance_to(self.standard_paths[index]) <= self.tolerance
+        ]
+
+        for index in touching:
+            # Check overlap, can only be with one, break once found
+            overlap = self.standard_paths[index] & bridge
+            if overlap is not None and overlap.solids():
+                return index
+        return None
+
+
 def merge_standard_paths_with_case(
     case_parts: list[Part], standard_paths: list[Part]
 ) -> None:
@@ -62,6 +111,8 @@ def merge_standard_paths_with_case(
     if not standard_paths:
         return
 
+    path_index = PathContactIndex(standard_paths)
+
     for idx, part in enumerate(case_parts):
         # Subtract the standard path for physical bridge
         if part.label == CasePart.MOUNTING_RING.value:
@@ -69,8 +120,12 @@ def merge_standard_paths_with_case(
             label = part.label
             color = part.color
 
-            # Subtract all paths from the mounting ring
-            case_parts[idx] = case_parts[idx] - standard_paths
+            # Subtract all paths that can reach the mounting ring
+            ring_paths = [
+                standard_paths[index] for index in path_index.candidates(part)
+            ]
+            if ring_paths:
+                case_parts[idx] = case_parts[idx] - ring_paths
 
             # Extract and sort the solids by volume
             sorted_solids = case_parts[idx].solids().sort_by(SortBy.VOLUME)
@@ -91,15 +146,7 @@ def merge_standard_paths_with_case(
 
             # Match bridge with standard path
             for bridge in bridge_solids:
-                matched_sp_idx = None
-                for standard_path_idx, standard_path in enumerate(standard_paths):
-                    # Check overlap, can only be with one, break once found
-                    overlap = standard_path & bridge
-                    if overlap is None:
-                        continue  # Check next combination
-                    if overlap.solids():
-                        matched_sp_idx = standard_path_idx
-                        break
+                matched_sp_idx = path_index.match(bridge)
 
                 # If we can't find a match, something went wrong
                 # and bridge does not connect to path.
@@ -121,9 +168,7 @@ def merge_standard_paths_with_case(
 
                 # Take the smallest remaining fragment and merge it back
                 smallest_fragment = fragments[0]
-                standard_paths[matched_sp_idx] = (
-                    standard_paths[matched_sp_idx] + smallest_fragment
-                )
+                path_index.merge(matched_sp_idx, smallest_fragment)
 
             # Remove the original bridge part from case_parts,
             # since its absorbed into standard_paths
@@ -0,0 +1,158 @@
+# cad/boolean_fusion.py
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Optional
+
+import numpy as np
+from build123d import Part
+
+from cad.intersection_check import BBox, overlapping_pairs
+from logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FusionLevelStats:
+    """Timing and size of one level of a fusion reduction tree."""
+
+    level: int
+    parts_in: int
+    parts_out: int
+    seconds: float
+    faces: int
+
+
+def part_bbox(part: Part) -> BBox:
+    """Fast, possibly loose, bounding box, enough for broad phase overlap tests."""
+    box = part.bounding_box(optimal=False)
+    return BBox(box.min.X, box.min.Y, box.min.Z, box.max.X, box.max.Y, box.max.Z)
+
+
+def touching_clusters(boxes: list[BBox], tolerance: float) -> list[list[int]]:
+    """
+    Group part indexes into clusters of transitively touching bounding boxes,
+    from the overlapping pairs of the sweep and prune broad phase. Clusters and
+    the indexes within them keep the input order.
+    """
+    parent = list(range(len(boxes)))
+    box_array = np.array(
+        [(b.xmin, b.ymin, b.zmin, b.xmax, b.ymax, b.zmax) for b in boxes]
+    ).reshape(-1, 6)
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for i, j in overlapping_pairs(box_array, tolerance).tolist():
+        parent[find(j)] = find(i)
+
+    clusters: dict[int, list[int]] = {}
+    for index in range(len(boxes)):
+        clusters.setdefault(find(index), []).append(index)
+    return list(clusters.values())
+
+
+def _fuse_group(parts: list[Part], fuzzy_value: float) -> Part:
+    """Fuse parts in one Boolean, worker process entry point for parallel levels."""
+    if len(parts) == 1:
+        return parts[0]
+    return parts[0].fuse(*parts[1:], tol=fuzzy_value or None)
+
+
+def fuse_parts(
+    parts: list[Part],
+    label: str,
+    workers: int = 1,
+    fuzzy_value: float = 0.0,
+    leaf_size: int = 32,
+    touch_tolerance: float = 0.01,
+) -> Part:
+    """
+    Fuse parts into one with a balanced reduction tree of unions.
+
+    Parts are first grouped into clusters whose bounding boxes touch, so parts
+    that cannot meet never share a Boolean. Every level fuses up to leaf_size
+    neighbouring parts of a cluster in one Boolean, until one part per cluster
+    is left, the clusters are then fused together. The unions of a level are
+    independent, with workers above 1 they run in worker processes of one pool
+    shared by all levels. Timing and face counts are logged per level.
+    """
+    if not parts:
+        raise ValueError(f"No parts to fuse for {label}")
+
+    clusters = [
+        [parts[index] for index in cluster]
+        for cluster in touching_clusters(
+            [part_bbox(part) for part in parts], touch_tolerance
+        )
+    ]
+
+    stats: list[FusionLevelStats] = []
+    executor: Optional[ProcessPoolExecutor] = None
+    try:
+        while len(clusters) > 1 or len(clusters[0]) > 1:
+            start_time = time.perf_counter()
+            parts_in = sum(len(cluster) for cluster in clusters)
+
+            if all(len(cluster) == 1 for cluster in clusters):
+                # Top of the tree, the remaining disjoint clusters
+                clusters = [[cluster[0] for cluster in clusters]]
+
+            groups = [
+                (cluster_index, cluster[start : start + leaf_size])
+                for cluster_index, cluster in enumerate(clusters)
+                for start in range(0, len(cluster), leaf_size)
+            ]
+            group_parts = [group for _, group in groups]
+            parallel_groups = sum(len(group) > 1 for group in group_parts)
+            if workers > 1 and parallel_groups > 1:
+                if executor is None:
+                    # The first parallel level has the most groups
+                    executor = ProcessPoolExecutor(
+                        max_workers=min(workers, parallel_groups)
+                    )
+                fused = list(
+                    executor.map(_fuse_group, group_parts, repeat(fuzzy_value))
+                )
+            else:
+                fused = list(map(_fuse_group, group_parts, repeat(fuzzy_value)))
+
+            next_clusters: list[list[Part]] = [[] for _ in clusters]
+            for (cluster_index, _), part in zip(groups, fused):
+                next_clusters[cluster_index].append(part)
+            clusters = next_clusters
+
+            stats.append(
+                FusionLevelStats(
+                    level=len(stats),
+                    parts_in=parts_in,
+                    parts_out=len(fused),
+                    seconds=time.perf_counter() - start_time,
+                    faces=sum(len(part.faces()) for part in fused),
+                )
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for level_stats in stats:
+        logger.info(
+            "Fusion %s level %d: %d -> %d parts in %.2f s, %d faces",
+            label,
+            level_stats.level,
+            level_stats.parts_in,
+            level_stats.parts_out,
+            level_stats.seconds,
+            level_stats.faces,
+        )
+    return clusters[0][0]
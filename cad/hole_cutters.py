@@ -0,0 +1,89 @@
+# cad/hole_cutters.py
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+from build123d import (
+    BuildPart,
+    BuildSketch,
+    Circle,
+    Compound,
+    Edge,
+    GeomType,
+    Location,
+    Part,
+    Plane,
+    Vector,
+    Wire,
+    extrude,
+)
+
+
+@lru_cache(maxsize=None)
+def hole_cutter_template(
+    diameter: float,
+    half_height: float,
+    z_dir: tuple[float, float, float] = (0, 0, 1),
+    x_dir: tuple[float, float, float] = (1, 0, 0),
+) -> Part:
+    """
+    Cutting cylinder centred on the origin along z_dir, extruded half_height to both
+    sides. Shared between callers, place copies with ``located_cutters``.
+    """
+    with BuildPart() as cutter:
+        with BuildSketch(Plane(origin=(0, 0, 0), x_dir=x_dir, z_dir=z_dir)):
+            Circle(diameter / 2)
+        extrude(amount=half_height, both=True)
+    return cutter.part
+
+
+def located_cutters(template: Part, locations: list[Location]) -> Compound:
+    """All cutters in one compound, to subtract with a single Boolean."""
+    return Compound(children=[template.moved(location) for location in locations])
+
+
+def _line_segments(edges: list[Edge]) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end points of straight edges."""
+    starts = [tuple(edge.position_at(0)) for edge in edges]
+    ends = [tuple(edge.position_at(1)) for edge in edges]
+    return np.array(starts).reshape(-1, 3), np.array(ends).reshape(-1, 3)
+
+
+def points_on_path(
+    path: Wire | Edge, points: list[Vector], tolerance: float = 1e-3
+) -> np.ndarray:
+    """
+    For each point, whether it lies on the path. Points are projected onto all
+    straight edges at once, curved edges are checked exactly, only for the points
+    within their bounding box.
+    """
+    if not points:
+        return np.zeros(0, dtype=bool)
+
+    query = np.array([tuple(point) for point in points])
+    lines = [edge for edge in path.edges() if edge.geom_type == GeomType.LINE]
+    curves = [edge for edge in path.edges() if edge.geom_type != GeomType.LINE]
+
+    on_path = np.zeros(len(query), dtype=bool)
+    if lines:
+        starts, ends = _line_segments(lines)
+        directions = ends - starts
+        lengths_squared = (directions * directions).sum(axis=1)
+        lengths_squared[lengths_squared == 0] = 1.0
+
+        offsets = query[:, None, :] - starts[None, :, :]
+        t = (offsets * directions[None]).sum(axis=2) / lengths_squared
+        closest = starts[None] + np.clip(t, 0.0, 1.0)[..., None] * directions[None]
+        distances = np.linalg.norm(query[:, None, :] - closest, axis=2)
+        on_path = distances.min(axis=1) <= tolerance
+
+    for edge in curves:
+        box = edge.bounding_box()
+        lower = np.array(tuple(box.min)) - tolerance
+        upper = np.array(tuple(box.max)) + tolerance
+        near = ~on_path & np.all((query >= lower) & (query <= upper), axis=1)
+        for index in np.flatnonzero(near):
+            on_path[index] = edge.distance_to(points[index]) <= tolerance
+    return on_path
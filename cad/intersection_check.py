@@ -2,14 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from itertools import combinations
-from typing import Iterator, List, Sequence, Tuple
+from typing import Tuple
 
+import numpy as np
 from build123d import Face, Shape
+
+from cad.mesh_intersection import flag_face_pairs, tessellate_faces
 from OCP.Bnd import Bnd_Box
 from OCP.BRepAlgoAPI import BRepAlgoAPI_Section
 from OCP.BRepBndLib import BRepBndLib
-from OCP.TopAbs import TopAbs_EDGE
-from OCP.TopExp import TopExp_Explorer
+from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE
+from OCP.TopExp import TopExp, TopExp_Explorer
+from OCP.TopTools import TopTools_IndexedDataMapOfShapeListOfShape
+
+
+# Bump when do_faces_intersect changes its verdicts, cached verdicts are keyed by it
+FACES_INTERSECT_CHECK_VERSION = 3
 
 
 @dataclass(frozen=True)
@@ -82,115 +90,57 @@ def face_bbox(face: Face) -> BBox:
     return BBox(xmin, ymin, zmin, xmax, ymax, zmax)
 
 
-@dataclass
-class BVHNode:
-    """Node in a Bounding Volume Hierarchy (BVH) over face bounding boxes."""
-
-    bbox: BBox
-    idxs: List[int]  # leaf indices (faces) when non-empty
-    left: "BVHNode | None" = None
-    right: "BVHNode | None" = None
-    count: int = 0  # number of faces under this node (leaf or subtree)
-
-    @property
-    def is_leaf(self) -> bool:
-        return self.left is None and self.right is None
-
-
-def _union_all(bboxes: Sequence[BBox], idxs: Sequence[int]) -> BBox:
-    bb = bboxes[idxs[0]]
-    for i in idxs[1:]:
-        bb = bb.union(bboxes[i])
-    return bb
-
+def overlapping_pairs(boxes: np.ndarray, tol: float = 0.0) -> np.ndarray:
+    """Sweep and prune along X over an (N, 6) array of bounding boxes.
 
-def build_bvh(
-    bboxes: Sequence[BBox], idxs: Sequence[int] | None = None, leaf_size: int = 4
-) -> BVHNode:
-    """Recursively build a median-split Bounding Volume Hierarchy (BVH).
-
-    Splits by the longest axis using the median of face centers.
+    Returns an (M, 2) array of index pairs ``i < j`` whose boxes overlap
+    within ``tol``.
     """
-    if not bboxes:
-        raise ValueError("build_bvh: 'bboxes' must be non-empty")
-
-    if idxs is None:
-        idxs = list(range(len(bboxes)))
-    else:
-        idxs = list(idxs)  # copy (we sort)
-
-    node_bb = _union_all(bboxes, idxs)
-
-    if len(idxs) <= leaf_size:
-        return BVHNode(
-            bbox=node_bb, idxs=list(idxs), left=None, right=None, count=len(idxs)
-        )
-
-    # split by largest axis of the node bbox, median on centers
-    axis = node_bb.longest_axis()
-    idxs.sort(key=lambda i: bboxes[i].center[axis])
-    mid = len(idxs) // 2
-
-    left = build_bvh(bboxes, idxs[:mid], leaf_size)
-    right = build_bvh(bboxes, idxs[mid:], leaf_size)
-
-    return BVHNode(
-        bbox=node_bb, idxs=[], left=left, right=right, count=left.count + right.count
+    count = len(boxes)
+    order = np.argsort(boxes[:, 0], kind="stable")
+    swept = boxes[order]
+
+    # Boxes after k in sweep order that start before box k ends along X
+    ends = np.searchsorted(swept[:, 0], swept[:, 3] + tol, side="right")
+    spans = np.maximum(ends - np.arange(count) - 1, 0)
+    first = np.repeat(np.arange(count), spans)
+    second = (
+        first + 1 + np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
     )
 
-
-def _pairs_within_node(node: BVHNode) -> Iterator[Tuple[int, int]]:
-    """Generate candidate pairs where boxes overlap (self-traversal)."""
-    if node.is_leaf:
-        # all pairs in the leaf (i < j by construction from combinations)
-        yield from combinations(node.idxs, 2)
-        return
-
-    # pairs from children individually
-    if node.left is not None:
-        yield from _pairs_within_node(node.left)
-    if node.right is not None:
-        yield from _pairs_within_node(node.right)
-
-    # cross pairs: recurse with overlap pruning
-    if node.left is not None and node.right is not None:
-        yield from _cross_pairs(node.left, node.right)
-
-
-def _cross_pairs(a: BVHNode, b: BVHNode) -> Iterator[Tuple[int, int]]:
-    """Iteratively traverse two BVH subtrees and yield overlapping leaf pairs.
-
-    Uses a heuristic to descend the larger subtree first and avoids Python
-    recursion depth limits.
-    """
-    stack: List[Tuple[BVHNode, BVHNode]] = [(a, b)]
-    while stack:
-        na, nb = stack.pop()
-        if not na.bbox.overlaps(nb.bbox):
-            continue
-
-        if na.is_leaf and nb.is_leaf:
-            for i in na.idxs:
-                for j in nb.idxs:
-                    if i < j:
-                        yield (i, j)
-            continue
-
-        # Descend the larger subtree to keep traversal shallow
-        if (not na.is_leaf) and (nb.is_leaf or na.count >= nb.count):
-            stack.append((na.left, nb))
-            stack.append((na.right, nb))
-        else:
-            stack.append((na, nb.left))
-            stack.append((na, nb.right))
+    a, b = swept[first], swept[second]
+    overlap = np.all(
+        (a[:, 3:] >= b[:, :3] - tol) & (b[:, 3:] >= a[:, :3] - tol), axis=1
+    )
+    pairs = np.stack([order[first[overlap]], order[second[overlap]]], axis=1)
+    pairs.sort(axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def adjacent_face_pairs(
+    shape: Shape, face_index: dict[int, int]
+) -> set[Tuple[int, int]]:
+    """Index pairs ``i < j`` of faces that share an edge, from the shape topology."""
+    edge_faces = TopTools_IndexedDataMapOfShapeListOfShape()
+    TopExp.MapShapesAndAncestors_s(shape.wrapped, TopAbs_EDGE, TopAbs_FACE, edge_faces)
+
+    pairs = set()
+    for edge_idx in range(1, edge_faces.Extent() + 1):
+        idxs = sorted(
+            {face_index[hash(face)] for face in edge_faces.FindFromIndex(edge_idx)}
+        )
+        pairs.update(combinations(idxs, 2))
+    return pairs
 
 
 def do_faces_intersect(
     shape: Shape,
     *,
-    skip_broad_phase: bool = True,
+    mesh_tolerance: float | None = 0.1,
+    mesh_angular_tolerance: float = 0.5,
+    skip_broad_phase: bool = False,
+    skip_adjacent: bool = False,
     skip_aabb_precheck: bool = False,
-    leaf_size: int = 4,
     aabb_tol: float = 1e-9,
 ) -> bool:
     """Return True if *any* pair of faces in the shape intersect.
@@ -199,23 +149,33 @@ def do_faces_intersect(
     self intersections and can thus be properly 3D printed.
 
     Check normally works in two phases:
-      - Broad-phase uses an axis-aligned Bounding Volume Hierarchy (BVH);
-      - Narrow-phase uses OCCT's ``BRepAlgoAPI_Section``.
-    You can skip the broad-phase (and optionally the AABB precheck) to
-    run the narrow-phase only on all face pairs for debugging.
+      - Mesh stage tessellates the shape once at ``mesh_tolerance`` and flags
+        face pairs whose triangles intersect, see ``flag_face_pairs``. Without
+        a mesh stage, the broad-phase uses a NumPy sweep and prune over the
+        face bounding boxes instead;
+      - Narrow-phase uses OCCT's ``BRepAlgoAPI_Section``, on pairs of faces
+        that share an edge last, as their sections are the expensive ones.
+    You can skip the mesh stage, the broad-phase (and optionally the AABB
+    precheck) to run the narrow-phase only on all face pairs for debugging.
 
     Parameters
     ----------
     shape : Shape
         Source shape whose faces are tested pairwise.
+    mesh_tolerance : float or None, default 0.1
+        Linear deflection of the mesh stage in mm, None to skip it and section
+        all broad-phase candidates.
+    mesh_angular_tolerance : float, default 0.5
+        Angular deflection of the mesh stage in radians.
     skip_broad_phase : bool, default False
-        If True, bypass BVH candidate generation and test all face pairs.
+        If True, bypass sweep and prune candidate generation and test all face pairs.
+    skip_adjacent : bool, default False
+        If True, do not test faces that share an edge at all. Only safe for
+        shapes that cannot fold over, a swept face can cross its neighbour.
     skip_aabb_precheck : bool, default False
         If True, do not require AABB overlap before running the section test.
-    leaf_size : int, default 4
-        Leaf size used if building the BVH.
     aabb_tol : float, default 1e-9
-        Overlap tolerance used by the AABB precheck when enabled.
+        Overlap tolerance of the broad-phase and the AABB precheck.
     """
     faces = list(shape.faces())
     if len(faces) < 2:
@@ -232,14 +192,28 @@ def do_faces_intersect(
         candidate_pairs = (
             (i, j) for i in range(len(faces)) for j in range(i + 1, len(faces))
         )
+    elif mesh_tolerance is None:
+        boxes = np.array(
+            [(b.xmin, b.ymin, b.zmin, b.xmax, b.ymax, b.zmax) for b in bboxes]
+        )
+        candidate_pairs = map(tuple, overlapping_pairs(boxes, aabb_tol).tolist())
+    else:
+        # Only face pairs whose mesh triangles intersect
+        triangles, face_ids = tessellate_faces(
+            shape, faces, mesh_tolerance, mesh_angular_tolerance
+        )
+        candidate_pairs = sorted(flag_face_pairs(triangles, face_ids, mesh_tolerance))
+
+    face_index = {hash(face.wrapped): idx for idx, face in enumerate(faces)}
+    adjacent = adjacent_face_pairs(shape, face_index)
+    if skip_adjacent:
+        candidate_pairs = (pair for pair in candidate_pairs if pair not in adjacent)
     else:
-        # BVH broad-phase
-        root = build_bvh(bboxes, leaf_size=leaf_size)
-        candidate_pairs = _pairs_within_node(root)
+        candidate_pairs = sorted(candidate_pairs, key=lambda pair: pair in adjacent)
 
     # Narrow-phase on candidates (optionally without AABB precheck)
     for i, j in candidate_pairs:
-        if not skip_aabb_precheck:
+        if skip_broad_phase and not skip_aabb_precheck:
             bbox_i, bbox_j = bboxes[i], bboxes[j]
             if not bbox_i.overlaps(bbox_j, aabb_tol):
                 continue
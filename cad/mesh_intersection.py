@@ -0,0 +1,256 @@
+# cad/mesh_intersection.py
+
+from __future__ import annotations
+
+from typing import Sequence, Set, Tuple
+
+import numpy as np
+from build123d import Face, Shape
+from OCP.BRep import BRep_Tool
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.BRepTools import BRepTools
+from OCP.TopLoc import TopLoc_Location
+
+# Vertices closer than this are merged, so triangles of faces that share an edge
+# are recognised as neighbours
+_WELD_TOLERANCE = 1e-6
+
+# Slack on the barycentric and segment parameter bounds, so triangles that only
+# touch numerically are still flagged for the exact check
+_EPSILON = 1e-9
+
+
+def tessellate_faces(
+    shape: Shape,
+    faces: Sequence[Face],
+    tolerance: float,
+    angular_tolerance: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mesh the shape once and return its triangles with the index of their face.
+
+    Returns an (N, 3, 3) array of triangle corners and an (N,) array of face
+    indexes into ``faces``. A triangulation that was not on the shape before is
+    removed again, it would otherwise end up in BREP exports and digests.
+    """
+    was_meshed = any(
+        BRep_Tool.Triangulation_s(face.wrapped, TopLoc_Location()) is not None
+        for face in faces
+    )
+    BRepMesh_IncrementalMesh(shape.wrapped, tolerance, False, angular_tolerance, True)
+
+    triangles, face_ids = [], []
+    for face_idx, face in enumerate(faces):
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation_s(face.wrapped, location)
+        if triangulation is None:
+            continue
+
+        transformation = location.Transformation()
+        nodes = np.array(
+            [
+                triangulation.Node(i).Transformed(transformation).Coord()
+                for i in range(1, triangulation.NbNodes() + 1)
+            ]
+        )
+        corners = np.array(
+            [
+                triangulation.Triangle(i).Get()
+                for i in range(1, triangulation.NbTriangles() + 1)
+            ]
+        )
+        triangles.append(nodes[corners - 1])
+        face_ids.append(np.full(len(corners), face_idx))
+
+    if not was_meshed:
+        BRepTools.Clean_s(shape.wrapped)
+
+    if not triangles:
+        return np.empty((0, 3, 3)), np.empty(0, dtype=int)
+    return np.concatenate(triangles), np.concatenate(face_ids)
+
+
+def _grid_pairs(lower: np.ndarray, upper: np.ndarray, cell_size: float) -> np.ndarray:
+    """Unique index pairs ``i < j`` of boxes that share a uniform grid cell."""
+    count = len(lower)
+    first_cell = np.floor(lower / cell_size).astype(np.int64)
+    spans = np.floor(upper / cell_size).astype(np.int64) - first_cell + 1
+    cells_per_box = spans.prod(axis=1)
+
+    # One entry per (box, covered cell)
+    box = np.repeat(np.arange(count), cells_per_box)
+    local = np.arange(cells_per_box.sum()) - np.repeat(
+        np.cumsum(cells_per_box) - cells_per_box, cells_per_box
+    )
+    span = spans[box]
+    offset = np.stack(
+        [
+            local % span[:, 0],
+            (local // span[:, 0]) % span[:, 1],
+            local // (span[:, 0] * span[:, 1]),
+        ],
+        axis=1,
+    )
+    cell = first_cell[box] + offset
+    cell -= cell.min(axis=0)
+    size = cell.max(axis=0) + 1
+    key = (cell[:, 0] * size[1] + cell[:, 1]) * size[2] + cell[:, 2]
+
+    # Pair every entry with the later entries of the same cell
+    order = np.argsort(key, kind="stable")
+    key, box = key[order], box[order]
+    ends = np.searchsorted(key, key, side="right")
+    pair_counts = ends - np.arange(len(key)) - 1
+    first = np.repeat(np.arange(len(key)), pair_counts)
+    second = first + 1 + np.arange(pair_counts.sum()) - np.repeat(
+        np.cumsum(pair_counts) - pair_counts, pair_counts
+    )
+
+    pairs = np.sort(np.stack([box[first], box[second]], axis=1), axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    return np.unique(pairs, axis=0)
+
+
+def _segments_cross_triangles(
+    start: np.ndarray, end: np.ndarray, triangles: np.ndarray
+) -> np.ndarray:
+    """Vectorised Moller-Trumbore test of segments against triangles, row by row."""
+    direction = end - start
+    edge_1 = triangles[:, 1] - triangles[:, 0]
+    edge_2 = triangles[:, 2] - triangles[:, 0]
+
+    p = np.cross(direction, edge_2)
+    determinant = (edge_1 * p).sum(axis=1)
+    parallel = np.abs(determinant) < 1e-12
+    inverse = 1.0 / np.where(parallel, 1.0, determinant)
+
+    offset = start - triangles[:, 0]
+    u = (offset * p).sum(axis=1) * inverse
+    q = np.cross(offset, edge_1)
+    v = (direction * q).sum(axis=1) * inverse
+    t = (edge_2 * q).sum(axis=1) * inverse
+
+    return (
+        ~parallel
+        & (u >= -_EPSILON)
+        & (v >= -_EPSILON)
+        & (u + v <= 1 + _EPSILON)
+        & (t >= -_EPSILON)
+        & (t <= 1 + _EPSILON)
+    )
+
+
+def _orientation(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Twice the signed area of the 2D triangles ``p, q, r``, row by row."""
+    return (q[:, 0] - p[:, 0]) * (r[:, 1] - p[:, 1]) - (q[:, 1] - p[:, 1]) * (
+        r[:, 0] - p[:, 0]
+    )
+
+
+def _coplanar_triangles_overlap(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise overlap test of coplanar (N, 3, 3) triangles, touching included.
+
+    The triangles are projected onto the coordinate plane their normal is most
+    perpendicular to. They overlap when two edges cross or one triangle holds a
+    corner of the other.
+    """
+    normal = np.cross(a[:, 1] - a[:, 0], a[:, 2] - a[:, 0])
+    dropped = np.abs(normal).argmax(axis=1)
+    kept = np.array([[1, 2], [0, 2], [0, 1]])[dropped]
+    rows = np.arange(len(a))[:, None, None]
+    a_2d = a[rows, np.arange(3)[None, :, None], kept[:, None, :]]
+    b_2d = b[rows, np.arange(3)[None, :, None], kept[:, None, :]]
+
+    hit = np.zeros(len(a), dtype=bool)
+    for i in range(3):
+        p, p_next = a_2d[:, i], a_2d[:, (i + 1) % 3]
+        for j in range(3):
+            q, q_next = b_2d[:, j], b_2d[:, (j + 1) % 3]
+            straddle_p = (
+                _orientation(q, q_next, p) * _orientation(q, q_next, p_next)
+                <= _EPSILON
+            )
+            straddle_q = (
+                _orientation(p, p_next, q) * _orientation(p, p_next, q_next)
+                <= _EPSILON
+            )
+            # Collinear edges straddle each other, their extents must overlap too
+            boxes = np.all(
+                (np.maximum(p, p_next) >= np.minimum(q, q_next) - _EPSILON)
+                & (np.maximum(q, q_next) >= np.minimum(p, p_next) - _EPSILON),
+                axis=1,
+            )
+            hit |= straddle_p & straddle_q & boxes
+
+    # Without crossing edges, the triangles overlap when one contains the other
+    for inner, outer in ((a_2d, b_2d), (b_2d, a_2d)):
+        sides = np.stack(
+            [
+                _orientation(outer[:, k], outer[:, (k + 1) % 3], inner[:, 0])
+                for k in range(3)
+            ],
+            axis=1,
+        )
+        hit |= np.all(sides >= -_EPSILON, axis=1) | np.all(sides <= _EPSILON, axis=1)
+    return hit
+
+
+def triangles_intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise intersection test of two (N, 3, 3) triangle arrays.
+
+    Two triangles that are not coplanar intersect when an edge of one crosses
+    the other, so the six edge against triangle tests decide the pair. The edges
+    of coplanar triangles are parallel to the other triangle and never cross it,
+    those pairs are tested for overlap in their common plane instead.
+    """
+    hit = np.zeros(len(a), dtype=bool)
+    for first, second in ((a, b), (b, a)):
+        for corner in range(3):
+            hit |= _segments_cross_triangles(
+                first[:, corner], first[:, (corner + 1) % 3], second
+            )
+
+    normal = np.cross(a[:, 1] - a[:, 0], a[:, 2] - a[:, 0])
+    length = np.linalg.norm(normal, axis=1)
+    unit_normal = normal / np.where(length > 0, length, 1.0)[:, None]
+    distance = ((b - a[:, :1]) * unit_normal[:, None, :]).sum(axis=2)
+    coplanar = (length > 0) & np.all(np.abs(distance) <= _WELD_TOLERANCE, axis=1)
+    hit[coplanar] |= _coplanar_triangles_overlap(a[coplanar], b[coplanar])
+    return hit
+
+
+def flag_face_pairs(
+    triangles: np.ndarray, face_ids: np.ndarray, tolerance: float
+) -> Set[Tuple[int, int]]:
+    """Face index pairs ``i < j`` whose mesh triangles intersect.
+
+    Candidate triangle pairs come from a uniform grid, triangles of the same
+    face and triangles sharing a corner (neighbours in the mesh) are not tested.
+    """
+    if len(triangles) < 2:
+        return set()
+
+    lower = triangles.min(axis=1) - tolerance
+    upper = triangles.max(axis=1) + tolerance
+    cell_size = max(float(np.median((upper - lower).max(axis=1))), tolerance)
+    pairs = _grid_pairs(lower, upper, cell_size)
+
+    # Only triangles of different faces, with overlapping boxes
+    pairs = pairs[face_ids[pairs[:, 0]] != face_ids[pairs[:, 1]]]
+    i, j = pairs[:, 0], pairs[:, 1]
+    overlap = np.all((upper[i] >= lower[j]) & (upper[j] >= lower[i]), axis=1)
+    pairs = pairs[overlap]
+
+    # Weld corners to detect triangles that share one, across faces too
+    _, corner_ids = np.unique(
+        np.round(triangles.reshape(-1, 3) / _WELD_TOLERANCE),
+        axis=0,
+        return_inverse=True,
+    )
+    corner_ids = corner_ids.reshape(-1, 3)
+    i, j = pairs[:, 0], pairs[:, 1]
+    shared = (corner_ids[i][:, :, None] == corner_ids[j][:, None, :]).any(axis=(1, 2))
+    pairs = pairs[~shared]
+
+    hit = triangles_intersect(triangles[pairs[:, 0]], triangles[pairs[:, 1]])
+    face_pairs = np.sort(face_ids[pairs[hit]], axis=1)
+    return {tuple(pair) for pair in np.unique(face_pairs, axis=0).tolist()}
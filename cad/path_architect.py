@@ -219,6 +219,11 @@ class PathArchitect:
         """Create [entry SINGLE] → [main locked] → [exit SINGLE] for one obstacle."""
         segments: list[PathSegment] = []
 
+        # Instances share the cached nodes of their class, the helper and main
+        # segments are only built here
+        if obstacle.main_path_segment.path is None:
+            obstacle.create_obstacle_geometry()
+
         entry_world = obstacle.world_nodes(
             obstacle.entry_path_segment.nodes, snap_to_grid=True
         )
@@ -239,8 +244,6 @@ class PathArchitect:
             segments.append(entry_seg)
 
         # Main segment, the obstacle path
-        if obstacle.main_path_segment.path is None:
-            obstacle.create_obstacle_geometry()
         located_path = obstacle.main_path_segment.path
         # TODO, check this located stuff
         if obstacle.location is not None and hasattr(located_path, "located"):
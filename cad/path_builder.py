@@ -3,8 +3,10 @@
 import logging
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from build123d import (
     Bezier,
@@ -27,7 +29,6 @@ from build123d import (
     Spline,
     Transition,
     Vector,
-    Vertex,
     Wire,
     add,
     extrude,
@@ -36,14 +37,33 @@ from build123d import (
     sweep,
 )
 
-from cad.intersection_check import do_faces_intersect
+from cad.boolean_fusion import fuse_parts
+from cad.hole_cutters import (
+    hole_cutter_template,
+    located_cutters,
+    points_on_path,
+)
+from cad.intersection_check import FACES_INTERSECT_CHECK_VERSION, do_faces_intersect
 from cad.path_profile_type_shapes import (
-    PROFILE_TYPE_FUNCTIONS,
     PathProfileType,
-    create_u_shape,
-    create_u_shape_path_color,
+    create_path_profile,
+    get_profile_sketch_cache,
 )
 from cad.path_segment import PathSegment, _node_to_vector, is_same_location
+from cad.spline_prescreen import (
+    SplinePrescreenStats,
+    profile_half_width,
+    screen_spline,
+)
+from cad.sweep_cache import (
+    InvalidSweepError,
+    cached_check,
+    cached_sweep,
+    get_sweep_cache,
+    is_sweep_failure,
+    shape_digest,
+    wrap_part,
+)
 from config import Config, PathCurveType, PathSegmentDesignStrategy
 from logging_config import configure_logging
 from puzzle.puzzle import Node, Puzzle
@@ -64,6 +84,72 @@ class PathTypes(Enum):
     ACCENT_COLOR = "Accent Color Path"
 
 
+@dataclass
+class SweepJob:
+    """
+    A profile sweep whose orientation is already resolved, deferred to the
+    second sweep pass. The result is stored on the segment under body_attr_name.
+    """
+
+    segment: PathSegment
+    profile: Sketch
+    body_attr_name: str
+    sweep_label: str
+
+
+@dataclass
+class SweepJobPayload:
+    """
+    Picklable part of a SweepJob sent to a worker process. Carries the segment
+    attributes sweep_single_profile reads, so it can stand in for the segment.
+    """
+
+    path: Any
+    path_profile_type: PathProfileType
+    main_index: int
+    secondary_index: int
+    profile: Sketch
+    transition_type: Transition
+    sweep_label: str
+    is_frenet: bool
+
+
+@dataclass
+class SplineOption:
+    """A spline path option of a segment, with its start and end profile angles."""
+
+    index: int
+    path: Spline
+    start_angle: float
+    end_angle: float
+
+
+@dataclass
+class SplineOptionPayload:
+    """
+    Picklable stand-in for a spline segment sent to a worker process. Carries
+    the segment attributes _sweep_spline_option reads, and receives the
+    profiles and bodies it stores.
+    """
+
+    option: SplineOption
+    path_profile_type_parameters: dict
+    path: Any
+    path_profile_type: PathProfileType
+    accent_profile_type: Optional[PathProfileType]
+    support_profile_type: Optional[PathProfileType]
+    main_index: int
+    secondary_index: int
+    transition_type: Transition
+    use_frenet: bool
+    path_profile: Optional[Sketch] = None
+    path_body: Optional[BuildPart] = None
+    accent_profile: Optional[Sketch] = None
+    accent_body: Optional[BuildPart] = None
+    support_profile: Optional[Sketch] = None
+    support_body: Optional[BuildPart] = None
+
+
 class PathBuilder:
     """
     Handles the creation of segment shapes using profiles, sweeping along paths, and building the final path body.
@@ -79,6 +165,9 @@ class PathBuilder:
         self.path_profile_type_parameters = Config.Path.PATH_PROFILE_TYPE_PARAMETERS
         self.seed = Config.Puzzle.SEED
         random.seed(self.seed)  # Set the random seed for reproducibility
+        self.spline_prescreen_stats = SplinePrescreenStats()
+        # Worker pool for spline options, shared by all spline segments
+        self._spline_option_executor: Optional[ProcessPoolExecutor] = None
 
         # Create the start area based on the first segment
         self.start_area = self.create_start_area_funnel(self.path_architect.segments[0])
@@ -111,15 +200,38 @@ class PathBuilder:
         )
 
         # Sweep segments
-        swept_segments: list[PathSegment] = self.sweep_segments(combine_segments)
+        try:
+            swept_segments: list[PathSegment] = self.sweep_segments(combine_segments)
+        finally:
+            if self._spline_option_executor is not None:
+                self._spline_option_executor.shutdown(cancel_futures=True)
+                self._spline_option_executor = None
+
+        sweep_cache = get_sweep_cache()
+        if sweep_cache is not None:
+            sweep_cache.log_stats()
+        get_profile_sketch_cache().log_stats()
+        if Config.Path.SPLINE_PRESCREEN_ENABLED:
+            self.spline_prescreen_stats.log_stats()
 
         # Store segments in path architect again
         self.path_architect.segments = swept_segments
 
     def sweep_segments(self, segments: list[PathSegment]) -> list[PathSegment]:
+        """
+        Sweep the segments in two passes.
+
+        The first pass walks the segments in path order and sweeps everything the
+        orientation of the following segment depends on: the main path body of
+        standard segments, and spline segments as a whole, as their option choice
+        depends on all of their bodies being valid. Accent and support sweeps of
+        standard segments only need the resolved profile angle, the second pass
+        sweeps them, across Config.Path.SWEEP_WORKERS processes when above 1.
+        """
         # Sweep the segments, with information of which ever segment comes previous
         previous_segment: Optional[PathSegment] = None
         previous_swept_segment: Optional[PathSegment] = None
+        sweep_jobs: list[SweepJob] = []
 
         # Iterate with an index so we can look ahead one element
         for idx, segment in enumerate(segments):
@@ -140,11 +252,12 @@ class PathBuilder:
                 PathSegmentDesignStrategy.SINGLE,
                 PathSegmentDesignStrategy.OBSTACLE,
             ):
-                # Sweep the segment.
+                # Sweep the segment, accent and support sweeps are deferred
                 segment = self.sweep_standard_segment(
                     segment=segment,
                     previous_segment=previous_segment,
                     previous_swept_segment=previous_swept_segment,
+                    sweep_jobs=sweep_jobs,
                 )
 
             # Create a spline segment, trying different path combinations.
@@ -170,8 +283,92 @@ class PathBuilder:
             if segment.path_body is not None:
                 previous_swept_segment = segment
 
+        self._run_sweep_jobs(sweep_jobs)
+
         return segments
 
+    def _run_sweep_jobs(self, sweep_jobs: list[SweepJob]) -> None:
+        """
+        Sweep the deferred profile sweeps and store the bodies on their segments.
+
+        With Config.Path.SWEEP_WORKERS above 1 the sweeps run in worker processes,
+        the resulting parts travel back BREP-serialized and are stored in path order.
+        """
+        if not sweep_jobs:
+            return
+
+        workers = Config.Path.SWEEP_WORKERS
+        if workers <= 1 or len(sweep_jobs) == 1:
+            for job in sweep_jobs:
+                body = sweep_single_profile(
+                    job.segment,
+                    job.profile,
+                    job.segment.transition_type,
+                    job.sweep_label,
+                    is_frenet=job.segment.use_frenet,
+                )
+                setattr(job.segment, job.body_attr_name, body)
+            return
+
+        # Cache lookups happen here, only the misses go to the workers
+        sweep_cache = get_sweep_cache()
+        pending: list[tuple[SweepJob, Optional[str]]] = []
+        for job in sweep_jobs:
+            key: Optional[str] = None
+            if sweep_cache is not None:
+                key = sweep_cache.key(
+                    "single_profile",
+                    *_single_profile_sweep_inputs(
+                        job.segment,
+                        job.profile,
+                        job.segment.transition_type,
+                        job.segment.use_frenet,
+                    ),
+                )
+                found, body = sweep_cache.lookup(key)
+                if found:
+                    setattr(job.segment, job.body_attr_name, body)
+                    continue
+            pending.append((job, key))
+
+        if not pending:
+            return
+
+        payloads = [
+            SweepJobPayload(
+                path=job.segment.path,
+                path_profile_type=job.segment.path_profile_type,
+                main_index=job.segment.main_index,
+                secondary_index=job.segment.secondary_index,
+                profile=job.profile,
+                transition_type=job.segment.transition_type,
+                sweep_label=job.sweep_label,
+                is_frenet=job.segment.use_frenet,
+            )
+            for job, _ in pending
+        ]
+
+        logger.info(
+            "Sweeping %d accent and support bodies with %d worker processes",
+            len(payloads),
+            min(workers, len(payloads)),
+        )
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(payloads))) as executor:
+            parts = list(executor.map(_sweep_job_payload, payloads))
+
+        for (job, key), part in zip(pending, parts):
+            if isinstance(part, Exception):
+                # All attempts failed, only known sweep failures are cached
+                if key is not None and is_sweep_failure(part):
+                    sweep_cache.store(key, None)
+                setattr(job.segment, job.body_attr_name, None)
+                continue
+            body = wrap_part(part) if part is not None else None
+            if sweep_cache is not None and key is not None:
+                sweep_cache.store(key, body)
+            setattr(job.segment, job.body_attr_name, body)
+
     def _define_segment_paths(self, segments: list[PathSegment]) -> None:
         """
         Process each (sub) segment to define its path.
@@ -367,11 +564,14 @@ class PathBuilder:
         segment: PathSegment,
         previous_segment: Optional[PathSegment],
         previous_swept_segment: Optional[PathSegment],
+        sweep_jobs: Optional[list[SweepJob]] = None,
     ) -> PathSegment:
         """
         Sweeps the segment based on its defined path and profile.
         Uses the previous segment for it's start orienation
         Creates the main path body, accent body, and support body.
+        When sweep_jobs is given, the accent and support sweeps are appended to
+        it instead of being swept here.
         """
 
         # Profile
@@ -406,11 +606,10 @@ class PathBuilder:
         )
 
         # Store path profile sketch based on path profile registry
-        path_profile_function = PROFILE_TYPE_FUNCTIONS.get(
-            segment.path_profile_type, create_u_shape
-        )
-        segment.path_profile = path_profile_function(
-            **path_parameters, rotation_angle=path_line_angle + profile_angle
+        segment.path_profile = create_path_profile(
+            segment.path_profile_type,
+            path_parameters,
+            rotation_angle=path_line_angle + profile_angle,
         )
 
         # Sweep for the main path body
@@ -429,20 +628,24 @@ class PathBuilder:
                 segment.accent_profile_type.value, {}
             )
             # Store accent color profile sketch based on path profile registry
-            accent_profile_function = PROFILE_TYPE_FUNCTIONS.get(
-                segment.accent_profile_type, create_u_shape
-            )
-            segment.accent_profile = accent_profile_function(
-                **accent_path_parameters, rotation_angle=path_line_angle + profile_angle
+            segment.accent_profile = create_path_profile(
+                segment.accent_profile_type,
+                accent_path_parameters,
+                rotation_angle=path_line_angle + profile_angle,
             )
             # Sweep for the accent body
-            segment.accent_body = sweep_single_profile(
-                segment,
-                segment.accent_profile,
-                segment.transition_type,
-                "Accent",
-                is_frenet=segment.use_frenet,
-            )
+            if sweep_jobs is not None:
+                sweep_jobs.append(
+                    SweepJob(segment, segment.accent_profile, "accent_body", "Accent")
+                )
+            else:
+                segment.accent_body = sweep_single_profile(
+                    segment,
+                    segment.accent_profile,
+                    segment.transition_type,
+                    "Accent",
+                    is_frenet=segment.use_frenet,
+                )
 
         # Create the support profile if the segment has a support profile type
         if segment.support_profile_type is not None:
@@ -451,21 +654,26 @@ class PathBuilder:
                 segment.support_profile_type.value, {}
             )
             # Store support profile sketch based on path profile registry
-            support_profile_function = PROFILE_TYPE_FUNCTIONS.get(
-                segment.support_profile_type, create_u_shape
-            )
-            segment.support_profile = support_profile_function(
-                **support_path_parameters,
+            segment.support_profile = create_path_profile(
+                segment.support_profile_type,
+                support_path_parameters,
                 rotation_angle=path_line_angle + profile_angle,
             )
             # Sweep for the support body
-            segment.support_body = sweep_single_profile(
-                segment,
-                segment.support_profile,
-                segment.transition_type,
-                "Support",
-                is_frenet=segment.use_frenet,
-            )
+            if sweep_jobs is not None:
+                sweep_jobs.append(
+                    SweepJob(
+                        segment, segment.support_profile, "support_body", "Support"
+                    )
+                )
+            else:
+                segment.support_body = sweep_single_profile(
+                    segment,
+                    segment.support_profile,
+                    segment.transition_type,
+                    "Support",
+                    is_frenet=segment.use_frenet,
+                )
 
         return segment
 
@@ -621,10 +829,12 @@ class PathBuilder:
 
         path_parameters = self.path_profile_type_parameters.get(profile_type.value, {})
         # Store profile sketch based on path profile registry
-        profile_function = PROFILE_TYPE_FUNCTIONS.get(profile_type, create_u_shape)
-
-        profile_start = profile_function(**path_parameters, rotation_angle=start_angle)
-        profile_end = profile_function(**path_parameters, rotation_angle=end_angle)
+        profile_start = create_path_profile(
+            profile_type, path_parameters, rotation_angle=start_angle
+        )
+        profile_end = create_path_profile(
+            profile_type, path_parameters, rotation_angle=end_angle
+        )
 
         setattr(segment, profile_attr_name, profile_start)
 
@@ -640,23 +850,15 @@ class PathBuilder:
                 is_frenet=segment.use_frenet,
             )
         else:
-            with BuildPart() as body:
-                with BuildLine() as segment_path_line:
-                    add(segment.path)
-                with BuildSketch(
-                    segment.path.location_at(0, frame_method=FrameMethod.CORRECTED)
-                ) as start_section:
-                    add(profile_start)
-                with BuildSketch(
-                    segment.path.location_at(1, frame_method=FrameMethod.CORRECTED)
-                ) as end_section:
-                    add(profile_end)
-
-                sweep(
-                    sections=[start_section.sketch, end_section.sketch],
-                    path=segment_path_line.line,
-                    multisection=True,
-                )
+            body = cached_sweep(
+                "multisection",
+                (
+                    shape_digest(segment.path),
+                    shape_digest(profile_start),
+                    shape_digest(profile_end),
+                ),
+                lambda: _multisection_sweep(segment.path, profile_start, profile_end),
+            )
 
         setattr(segment, body_attr_name, body)
         return body
@@ -680,22 +882,20 @@ class PathBuilder:
 
         main_params = self.path_profile_type_parameters.get(segment.path_profile_type.value, {})
         accent_params = self.path_profile_type_parameters.get(segment.accent_profile_type.value, {})
-        main_fn = PROFILE_TYPE_FUNCTIONS.get(segment.path_profile_type, create_u_shape)
-        accent_fn = PROFILE_TYPE_FUNCTIONS.get(segment.accent_profile_type, create_u_shape)
 
         loc_t0 = segment.path.location_at(0, frame_method=FrameMethod.CORRECTED)
         loc_t1 = segment.path.location_at(1, frame_method=FrameMethod.CORRECTED)
 
         with BuildSketch(loc_t0) as main_sketch_start:
-            add(main_fn(**main_params, rotation_angle=angle_start))
+            add(create_path_profile(segment.path_profile_type, main_params, angle_start))
         with BuildSketch(loc_t0) as accent_sketch_start:
-            add(accent_fn(**accent_params, rotation_angle=angle_start))
+            add(create_path_profile(segment.accent_profile_type, accent_params, angle_start))
         shared_vertex_start = _find_shared_vertex(main_sketch_start, accent_sketch_start)
 
         with BuildSketch(loc_t1) as main_sketch_end:
-            add(main_fn(**main_params, rotation_angle=angle_end))
+            add(create_path_profile(segment.path_profile_type, main_params, angle_end))
         with BuildSketch(loc_t1) as accent_sketch_end:
-            add(accent_fn(**accent_params, rotation_angle=angle_end))
+            add(create_path_profile(segment.accent_profile_type, accent_params, angle_end))
         shared_vertex_end = _find_shared_vertex(main_sketch_end, accent_sketch_end)
 
         if shared_vertex_start is None or shared_vertex_end is None:
@@ -703,24 +903,270 @@ class PathBuilder:
 
         return Spline([shared_vertex_start, shared_vertex_end], tangents=[segment.path % 0, segment.path % 1])
 
-    def create_spline_segment(
+    def _sweep_spline_option(self, segment: PathSegment, option: SplineOption) -> bool:
+        """
+        Sweep the main, accent and support bodies of one spline option and store
+        the spline path, profiles and bodies on the segment.
+
+        Returns True when all bodies are valid and free of self-intersections.
+        """
+        opt_idx = option.index
+        angle_sketch_1_final = option.start_angle
+        angle_sketch_2_final = option.end_angle
+        segment.path = option.path
+
+        try:
+            path_body: Optional[BuildPart] = None
+            accent_body: Optional[BuildPart] = None
+
+            # When both main and accent profiles exist, try shared-vertex guide wire first
+            _guide_wire: Optional[Spline] = None
+            if segment.accent_profile_type is not None:
+                _guide_wire = self._build_guide_wire_from_shared_vertex(
+                    segment, angle_sketch_1_final, angle_sketch_2_final
+                )
+
+            if _guide_wire is not None:
+                main_params = self.path_profile_type_parameters.get(
+                    segment.path_profile_type.value, {}
+                )
+                profile_main_start = create_path_profile(
+                    segment.path_profile_type,
+                    main_params,
+                    rotation_angle=angle_sketch_1_final,
+                )
+                segment.path_profile = profile_main_start
+                path_body = _cached_guide_wire_sweep(
+                    segment, profile_main_start, _guide_wire
+                )
+                segment.path_body = path_body
+
+                accent_params = self.path_profile_type_parameters.get(
+                    segment.accent_profile_type.value, {}
+                )
+                profile_accent_start = create_path_profile(
+                    segment.accent_profile_type,
+                    accent_params,
+                    rotation_angle=angle_sketch_1_final,
+                )
+                segment.accent_profile = profile_accent_start
+                accent_body = _cached_guide_wire_sweep(
+                    segment, profile_accent_start, _guide_wire
+                )
+                segment.accent_body = accent_body
+            else:
+                # No shared vertex (e.g. O-shape) — fall back to multi-section sweep
+                path_body = self._build_start_and_end_profile_and_sweep(
+                    segment=segment,
+                    profile_type=segment.path_profile_type,
+                    start_angle=angle_sketch_1_final,
+                    end_angle=angle_sketch_2_final,
+                    profile_attr_name="path_profile",
+                    body_attr_name="path_body",
+                    sweep_label="Path",
+                )
+
+                if segment.accent_profile_type is not None:
+                    accent_body = self._build_start_and_end_profile_and_sweep(
+                        segment=segment,
+                        profile_type=segment.accent_profile_type,
+                        start_angle=angle_sketch_1_final,
+                        end_angle=angle_sketch_2_final,
+                        profile_attr_name="accent_profile",
+                        body_attr_name="accent_body",
+                        sweep_label="Accent",
+                    )
+
+            # Check if main body is valid
+            if path_body is None or not path_body.part.is_valid:
+                logger.warning(
+                    "Segment %s.%s spline option %d produced an invalid path body.",
+                    segment.main_index,
+                    segment.secondary_index,
+                    opt_idx,
+                )
+                return False
+
+            if _faces_intersect(path_body.part):
+                logger.warning(
+                    "Segment %s.%s spline option %d encountered a main body self-intersection.",
+                    segment.main_index,
+                    segment.secondary_index,
+                    opt_idx,
+                )
+                return False
+
+            # Check accent body validity
+            if accent_body is not None:
+                if not accent_body.part.is_valid:
+                    logger.warning(
+                        "Segment %s.%s spline option %d produced an invalid accent body.",
+                        segment.main_index,
+                        segment.secondary_index,
+                        opt_idx,
+                    )
+                    return False
+
+                if _faces_intersect(accent_body.part):
+                    logger.warning(
+                        "Segment %s.%s spline option %d encountered an accent body self-intersection.",
+                        segment.main_index,
+                        segment.secondary_index,
+                        opt_idx,
+                    )
+                    return False
+
+            # Support body always uses multi-section sweep
+            if segment.support_profile_type is not None:
+                support_body = self._build_start_and_end_profile_and_sweep(
+                    segment=segment,
+                    profile_type=segment.support_profile_type,
+                    start_angle=angle_sketch_1_final,
+                    end_angle=angle_sketch_2_final,
+                    profile_attr_name="support_profile",
+                    body_attr_name="support_body",
+                    sweep_label="Support",
+                )
+
+                # Check if support body is valid, try other approach if fail
+                if support_body is None or not support_body.part.is_valid:
+                    logger.warning(
+                        "Segment %s.%s spline option %d produced an invalid support body.",
+                        segment.main_index,
+                        segment.secondary_index,
+                        opt_idx,
+                    )
+                    return False
+
+                if _faces_intersect(support_body.part):
+                    logger.warning(
+                        "Segment %s.%s spline option %d encountered a support body self-intersection.",
+                        segment.main_index,
+                        segment.secondary_index,
+                        opt_idx,
+                    )
+                    return False
+
+            return True
+
+        except Exception as e:
+            # The spline sweep failed, the next option is tried
+            logger.warning(
+                "Segment %s.%s spline option %d sweep failed with error: %s",
+                segment.main_index,
+                segment.secondary_index,
+                opt_idx,
+                e,
+            )
+            return False
+
+    def _sweep_spline_options_concurrently(
+        self, segment: PathSegment, options: list[SplineOption]
+    ) -> Optional[SplineOption]:
+        """
+        Sweep the spline options in worker processes and keep the lowest index
+        option that validates, the option the serial loop would choose. Its
+        profiles and bodies are stored on the segment, options that have not
+        started by then are cancelled and the remaining results are discarded.
+
+        The pool is shared by all spline segments, options of the previous segment
+        still running hold on to their workers rather than compete with new ones.
+        """
+        if len(options) <= 1:
+            return next(
+                (
+                    option
+                    for option in options
+                    if self._sweep_spline_option(segment, option)
+                ),
+                None,
+            )
+
+        payloads = [
+            SplineOptionPayload(
+                option=option,
+                path_profile_type_parameters=self.path_profile_type_parameters,
+                path=option.path,
+                path_profile_type=segment.path_profile_type,
+                accent_profile_type=segment.accent_profile_type,
+                support_profile_type=segment.support_profile_type,
+                main_index=segment.main_index,
+                secondary_index=segment.secondary_index,
+                transition_type=segment.transition_type,
+                use_frenet=segment.use_frenet,
+            )
+            for option in options
+        ]
+
+        workers = Config.Path.SPLINE_OPTION_WORKERS
+        logger.info(
+            "Sweeping %d spline options of segment %s.%s with %d worker processes",
+            len(payloads),
+            segment.main_index,
+            segment.secondary_index,
+            workers,
+        )
+
+        if self._spline_option_executor is None:
+            self._spline_option_executor = ProcessPoolExecutor(max_workers=workers)
+        executor = self._spline_option_executor
+        futures = []
+        try:
+            futures = [
+                executor.submit(_sweep_spline_option_payload, payload)
+                for payload in payloads
+            ]
+            # Wait in option order, a later option only counts once all
+            # earlier options have failed
+            for option, future in zip(options, futures):
+                results = future.result()
+                if results is None:
+                    continue
+
+                segment.path = option.path
+                for attr_name, value in results.items():
+                    if attr_name.endswith("_body"):
+                        value = wrap_part(value)
+                    setattr(segment, attr_name, value)
+                return option
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _spline_option_candidates(
         self,
         segment: PathSegment,
         previous_segment: PathSegment,
         next_segment: PathSegment,
         previous_swept_segment: Optional[PathSegment],
-    ):
+    ) -> Iterator[SplineOption]:
         """
-        Creates a spline segment.
+        Yield the spline options of a segment in order, with their profile angles.
+        Options without enough points, or rejected by the pre-screen, are skipped.
 
-        Tries different spline point combinations to create a valid path and profile for a 
-        SPLINE design strategy segment. Falls back to a polyline path if no valid path can be created.
+        Sets segment.path to the spline of each option as it is yielded.
         """
         # Get the sub path points (positions of nodes in the segment)
         sub_path_points = [Vector(node.x, node.y, node.z) for node in segment.nodes]
         options = self._generate_spline_control_point_options(sub_path_points)
         help_path = Polyline(sub_path_points)
 
+        # Profile size and sweeps per option, for the spline pre-screen
+        half_width = profile_half_width(
+            create_path_profile(
+                segment.path_profile_type,
+                self.path_profile_type_parameters.get(
+                    segment.path_profile_type.value, {}
+                ),
+            )
+        )
+        sweep_count = (
+            1
+            + (segment.accent_profile_type is not None)
+            + (segment.support_profile_type is not None)
+        )
+
         # Try each option
         for opt_idx, spline_points in enumerate(options, 1):
             logger.debug(
@@ -746,6 +1192,33 @@ class PathBuilder:
                 tangents=[previous_segment.path % 1, next_segment.path % 0],
             )
 
+            # Reject options that cannot sweep cleanly before any OCCT sweep
+            if Config.Path.SPLINE_PRESCREEN_ENABLED:
+                screen = screen_spline(
+                    segment.path,
+                    segment.nodes,
+                    half_width=half_width,
+                    node_size=self.node_size,
+                    min_radius_factor=Config.Path.SPLINE_PRESCREEN_MIN_RADIUS_FACTOR,
+                    max_corridor_deviation_nodes=(
+                        Config.Path.SPLINE_PRESCREEN_MAX_CORRIDOR_DEVIATION
+                    ),
+                )
+                self.spline_prescreen_stats.record(screen, sweep_count)
+                if screen.rejected_by is not None:
+                    logger.info(
+                        "Segment %s.%s spline option %d rejected by the %s pre-screen "
+                        "(radius %.2f, self distance %.2f, corridor deviation %.2f).",
+                        segment.main_index,
+                        segment.secondary_index,
+                        opt_idx,
+                        screen.rejected_by,
+                        screen.min_radius,
+                        screen.min_self_distance,
+                        screen.max_corridor_deviation,
+                    )
+                    continue
+
             # Determine final angles for start and end sketch
             angle_sketch_1_final, angle_sketch_2_final = (
                 self._compute_spline_orientation(
@@ -756,164 +1229,54 @@ class PathBuilder:
                 )
             )
 
-            try:
-                path_body: Optional[BuildPart] = None
-                accent_body: Optional[BuildPart] = None
-
-                # When both main and accent profiles exist, try shared-vertex guide wire first
-                _guide_wire: Optional[Spline] = None
-                if segment.accent_profile_type is not None:
-                    _guide_wire = self._build_guide_wire_from_shared_vertex(
-                        segment, angle_sketch_1_final, angle_sketch_2_final
-                    )
+            yield SplineOption(
+                opt_idx, segment.path, angle_sketch_1_final, angle_sketch_2_final
+            )
 
-                if _guide_wire is not None:
-                    main_params = self.path_profile_type_parameters.get(
-                        segment.path_profile_type.value, {}
-                    )
-                    main_fn = PROFILE_TYPE_FUNCTIONS.get(segment.path_profile_type, create_u_shape)
-                    profile_main_start = main_fn(**main_params, rotation_angle=angle_sketch_1_final)
-                    segment.path_profile = profile_main_start
-                    with BuildPart() as path_body:
-                        with BuildLine():
-                            add(segment.path)
-                        with BuildSketch(segment.path.location_at(0, frame_method=FrameMethod.CORRECTED)):
-                            add(profile_main_start)
-                        sweep(binormal=_guide_wire, transition=segment.transition_type)
-                    segment.path_body = path_body
-
-                    accent_params = self.path_profile_type_parameters.get(
-                        segment.accent_profile_type.value, {}
-                    )
-                    accent_fn = PROFILE_TYPE_FUNCTIONS.get(segment.accent_profile_type, create_u_shape)
-                    profile_accent_start = accent_fn(
-                        **accent_params, rotation_angle=angle_sketch_1_final
-                    )
-                    segment.accent_profile = profile_accent_start
-                    with BuildPart() as accent_body:
-                        with BuildLine():
-                            add(segment.path)
-                        with BuildSketch(segment.path.location_at(0, frame_method=FrameMethod.CORRECTED)):
-                            add(profile_accent_start)
-                        sweep(binormal=_guide_wire, transition=segment.transition_type)
-                    segment.accent_body = accent_body
-                else:
-                    # No shared vertex (e.g. O-shape) — fall back to multi-section sweep
-                    path_body = self._build_start_and_end_profile_and_sweep(
-                        segment=segment,
-                        profile_type=segment.path_profile_type,
-                        start_angle=angle_sketch_1_final,
-                        end_angle=angle_sketch_2_final,
-                        profile_attr_name="path_profile",
-                        body_attr_name="path_body",
-                        sweep_label="Path",
-                    )
+    def create_spline_segment(
+        self,
+        segment: PathSegment,
+        previous_segment: PathSegment,
+        next_segment: PathSegment,
+        previous_swept_segment: Optional[PathSegment],
+    ):
+        """
+        Creates a spline segment.
 
-                    if segment.accent_profile_type is not None:
-                        accent_body = self._build_start_and_end_profile_and_sweep(
-                            segment=segment,
-                            profile_type=segment.accent_profile_type,
-                            start_angle=angle_sketch_1_final,
-                            end_angle=angle_sketch_2_final,
-                            profile_attr_name="accent_profile",
-                            body_attr_name="accent_body",
-                            sweep_label="Accent",
-                        )
-
-                # Check if main body is valid
-                if path_body is None or not path_body.part.is_valid:
-                    logger.warning(
-                        "Segment %s.%s spline option %d produced an invalid path body.",
-                        segment.main_index,
-                        segment.secondary_index,
-                        opt_idx,
-                    )
-                    continue
+        Tries different spline point combinations to create a valid path and profile for a 
+        SPLINE design strategy segment. Falls back to a polyline path if no valid path can be created.
+        """
+        options = self._spline_option_candidates(
+            segment, previous_segment, next_segment, previous_swept_segment
+        )
 
-                if do_faces_intersect(path_body.part):
-                    logger.warning(
-                        "Segment %s.%s spline option %d encountered a main body self-intersection.",
-                        segment.main_index,
-                        segment.secondary_index,
-                        opt_idx,
-                    )
-                    continue
+        # Sweep the options in order, the first option that validates is used
+        if Config.Path.SPLINE_OPTION_WORKERS > 1:
+            chosen_option = self._sweep_spline_options_concurrently(
+                segment, list(options)
+            )
+        else:
+            chosen_option = next(
+                (
+                    option
+                    for option in options
+                    if self._sweep_spline_option(segment, option)
+                ),
+                None,
+            )
 
-                # Check accent body validity
-                if accent_body is not None:
-                    if not accent_body.part.is_valid:
-                        logger.warning(
-                            "Segment %s.%s spline option %d produced an invalid accent body.",
-                            segment.main_index,
-                            segment.secondary_index,
-                            opt_idx,
-                        )
-                        continue
-
-                    if do_faces_intersect(accent_body.part):
-                        logger.warning(
-                            "Segment %s.%s spline option %d encountered an accent body self-intersection.",
-                            segment.main_index,
-                            segment.secondary_index,
-                            opt_idx,
-                        )
-                        continue
-
-                # Support body always uses multi-section sweep
-                if segment.support_profile_type is not None:
-                    support_body = self._build_start_and_end_profile_and_sweep(
-                        segment=segment,
-                        profile_type=segment.support_profile_type,
-                        start_angle=angle_sketch_1_final,
-                        end_angle=angle_sketch_2_final,
-                        profile_attr_name="support_profile",
-                        body_attr_name="support_body",
-                        sweep_label="Support",
-                    )
+        if chosen_option is not None:
+            """        
+            # Debug, uncomment to see line, sweep face, sweep and path orientations
+            show_object(l, f"Spline Line - segment {segment.main_index}.{segment.secondary_index}")
+            show_object(help_path, f"Help path - segment {segment.main_index}.{segment.secondary_index}")
+            path_increments = [0.1, 0.5, 0.9]
+            for val in path_increments:
+                show_object(l.line ^ val, name=f"Spline Line - {val:.2f} - segment {segment.main_index}.{segment.secondary_index}")  
+                show_object(help_path ^ val, name=f"Help path - segment {segment.main_index}.{segment.secondary_index}")      
+            """
 
-                    # Check if support body is valid, try other approach if fail
-                    if support_body is None or not support_body.part.is_valid:
-                        logger.warning(
-                            "Segment %s.%s spline option %d produced an invalid support body.",
-                            segment.main_index,
-                            segment.secondary_index,
-                            opt_idx,
-                        )
-                        continue
-
-                    if do_faces_intersect(support_body.part):
-                        logger.warning(
-                            "Segment %s.%s spline option %d encountered a support body self-intersection.",
-                            segment.main_index,
-                            segment.secondary_index,
-                            opt_idx,
-                        )
-                        continue
-
-                # If we reach this point, the sweep succeeded, return segment
-
-                """        
-                # Debug, uncomment to see line, sweep face, sweep and path orientations
-                show_object(l, f"Spline Line - segment {segment.main_index}.{segment.secondary_index}")
-                show_object(help_path, f"Help path - segment {segment.main_index}.{segment.secondary_index}")
-                path_increments = [0.1, 0.5, 0.9]
-                for val in path_increments:
-                    show_object(l.line ^ val, name=f"Spline Line - {val:.2f} - segment {segment.main_index}.{segment.secondary_index}")  
-                    show_object(help_path ^ val, name=f"Help path - segment {segment.main_index}.{segment.secondary_index}")      
-                """
-
-                return segment
-
-            except Exception as e:
-                # The spline creation failed, try the next option
-                logger.warning(
-                    "Segment %s.%s spline option %d sweep failed with error: %s",
-                    segment.main_index,
-                    segment.secondary_index,
-                    opt_idx,
-                    e,
-                )
-                continue
+            return segment
 
         # Fallback, build as a COMPOUND of standard sub‐segments
         logger.info(
@@ -969,26 +1332,31 @@ class PathBuilder:
 
             groups.setdefault(segment.main_index, []).append(path_part)
 
-        # Fuse each group into one Part using a multi-union
-        fused_by_main: Dict[int, Part] = {}
-        for main_index, parts in groups.items():
-            fused_by_main[main_index] = Part() + parts
+        # Fuse with balanced reduction trees, touching neighbours first
+        fusion_options = {
+            "workers": Config.Path.FUSION_WORKERS,
+            "fuzzy_value": Config.Path.FUSION_FUZZY_VALUE,
+        }
 
         # Distribute into buckets based on division count
         if num_divisions == 0:
             # special case: keep each main_index separate
-            standard_list = list(fused_by_main.values())
+            standard_list = [
+                fuse_parts(parts, f"path {main_index}", **fusion_options)
+                for main_index, parts in groups.items()
+            ]
         else:
             # Prepare empty buckets for each division
             buckets: list[list[Part]] = [[] for _ in range(num_divisions)]
-            bucket_counter = 0
-            for main_index in sorted(fused_by_main):
-                current_part = fused_by_main[main_index]
+            for bucket_counter, main_index in enumerate(sorted(groups)):
                 bucket_index = bucket_counter % num_divisions
-                buckets[bucket_index].append(current_part)
-                bucket_counter += 1
-            # Union each bucket in one go
-            standard_list = [Part() + bucket for bucket in buckets if bucket]
+                buckets[bucket_index].extend(groups[main_index])
+            # Union each bucket in one tree
+            standard_list = [
+                fuse_parts(bucket, f"path bucket {bucket_index}", **fusion_options)
+                for bucket_index, bucket in enumerate(buckets)
+                if bucket
+            ]
 
         # Combine accent and support bodies all at once
         all_support_bodies: list[Part] = []
@@ -1004,8 +1372,16 @@ class PathBuilder:
             if segment.accent_body:
                 all_accent_bodies.append(segment.accent_body.part)
 
-        support_body = Part() + all_support_bodies if all_support_bodies else None
-        accent_body = Part() + all_accent_bodies if all_accent_bodies else None
+        support_body = (
+            fuse_parts(all_support_bodies, "support", **fusion_options)
+            if all_support_bodies
+            else None
+        )
+        accent_body = (
+            fuse_parts(all_accent_bodies, "accent", **fusion_options)
+            if all_accent_bodies
+            else None
+        )
 
         return {
             PathTypes.STANDARD: standard_list,
@@ -1042,9 +1418,13 @@ class PathBuilder:
                 Line(first_coordinate, second_coordinate)
             # Create the two U-shaped profiles
             with BuildSketch(start_area_line.line ^ 0):
-                add(create_u_shape(factor=1.3, **u_shape_params, rotation_angle=-90))
+                add(
+                    create_path_profile(
+                        PathProfileType.U_SHAPE, {**u_shape_params, "factor": 1.3}
+                    )
+                )
             with BuildSketch(start_area_line.line ^ 1):
-                add(create_u_shape(**u_shape_params, rotation_angle=-90))
+                add(create_path_profile(PathProfileType.U_SHAPE, u_shape_params))
             loft()
 
         # Create the accent coloring path start area funnel
@@ -1058,14 +1438,15 @@ class PathBuilder:
             # Create the two color profiles
             with BuildSketch(start_area_line.line ^ 0):
                 add(
-                    create_u_shape_path_color(
-                        factor=1.3, **u_shape_color_params, rotation_angle=-90
+                    create_path_profile(
+                        PathProfileType.U_SHAPE_PATH_COLOR,
+                        {**u_shape_color_params, "factor": 1.3},
                     )
                 )
             with BuildSketch(start_area_line.line ^ 1):
                 add(
-                    create_u_shape_path_color(
-                        **u_shape_color_params, rotation_angle=-90
+                    create_path_profile(
+                        PathProfileType.U_SHAPE_PATH_COLOR, u_shape_color_params
                     )
                 )
             loft()
@@ -1132,40 +1513,35 @@ class PathBuilder:
                 else:
                     end_idx = total_nodes - 1
 
-                for idx in range(start_idx, end_idx):
-                    node = segment.nodes[idx]
-                    # Adjust the index to align with the interval 'n'
-                    adjusted_idx = idx - start_idx
-                    if adjusted_idx % n != 0:
-                        continue  # Skip this node
-
-                    # Skip nodes that do not lie on the path, ie on curves
-                    hole_vertex = Vertex(Vector(node.x, node.y, node.z))
-                    common = segment.path.intersect(hole_vertex)
-                    if not common:
-                        continue  # off the path, omit this hole
-
-                    # Create the cutting cylinder based on work plane direction
-                    with BuildPart() as cutting_cylinder:
-                        with BuildSketch(work_plane):
-                            Circle(hole_size / 2)
-                        extrude(
-                            amount=self.node_size / 2 + self.node_size * 0.1, both=True
-                        )
-
-                    # Move the cutting cylinder to the node position
-                    cutting_cylinder.part.position = (node.x, node.y, node.z)
-
-                    # show_object(cutting_cylinder, name=f"Cutting Cylinder at Node {idx}")
-
-                    if segment.path_body and segment.path_body.part.is_valid:
-                        segment.path_body.part = (
-                            segment.path_body.part - cutting_cylinder.part
-                        )
-                    if segment.support_body and cut_support_holes:
-                        segment.support_body.part = (
-                            segment.support_body.part - cutting_cylinder.part
-                        )
+                # Every n-th node, skipping nodes that do not lie on the path, ie on curves
+                positions = [
+                    Vector(node.x, node.y, node.z)
+                    for node in segment.nodes[start_idx:end_idx:n]
+                ]
+                on_path = points_on_path(segment.path, positions)
+                locations = [
+                    Location(position)
+                    for position, is_on_path in zip(positions, on_path)
+                    if is_on_path
+                ]
+                if not locations:
+                    continue
+
+                # All cutting cylinders for the segment, subtracted in one Boolean per body
+                cutters = located_cutters(
+                    hole_cutter_template(
+                        hole_size,
+                        self.node_size / 2 + self.node_size * 0.1,
+                        z_dir=tuple(work_plane.z_dir),
+                        x_dir=tuple(work_plane.x_dir),
+                    ),
+                    locations,
+                )
+
+                if segment.path_body and segment.path_body.part.is_valid:
+                    segment.path_body.part = segment.path_body.part - cutters
+                if segment.support_body and cut_support_holes:
+                    segment.support_body.part = segment.support_body.part - cutters
             # For splines and obstacles, use edge to determine location of holes to cut
             elif (
                 segment.design_strategy == PathSegmentDesignStrategy.SPLINE
@@ -1193,24 +1569,16 @@ class PathBuilder:
                     frame_method=FrameMethod.FRENET,
                 )
 
-                # Create and subtract holes at each sampled location
-                for loc in locations:
-                    with BuildPart() as cutting_cylinder:
-                        # Sketch circle in local XY of the part
-                        with BuildSketch():
-                            Circle(hole_size / 2)
-                        extrude(
-                            amount=self.node_size / 2 + self.node_size * 0.1, both=True
-                        )
-
-                    # Align and position in one step
-                    # Rotate cylinder axis to align with local normal (Y axis)
-                    cutting_cylinder.part = loc * Rot(0, -90, 0) * cutting_cylinder.part
-
-                    # Subtract from bodies
-                    if segment.path_body and segment.path_body.part.is_valid:
-                        segment.path_body.part -= cutting_cylinder.part
-                    # Intentionally not subtracted from support bodies to improve printing
+                # Cylinder axes along the local normal (Y axis), subtracted at once
+                cutters = located_cutters(
+                    hole_cutter_template(
+                        hole_size, self.node_size / 2 + self.node_size * 0.1
+                    ),
+                    [location * Rot(0, -90, 0) for location in locations],
+                )
+                if segment.path_body and segment.path_body.part.is_valid:
+                    segment.path_body.part -= cutters
+                # Intentionally not subtracted from support bodies to improve printing
 
     def determine_path_profile_angle(
         self,
@@ -1250,16 +1618,13 @@ class PathBuilder:
         path_parameters = self.path_profile_type_parameters.get(
             previous_segment.path_profile_type.value, {}
         )
-        # Apply the path profile function based on path profile registry
-        path_profile_function = PROFILE_TYPE_FUNCTIONS.get(
-            previous_segment.path_profile_type, create_u_shape
-        )
-
         # Create previous segment profile type at the start of the current segment path with 90-degree angle increments
         for angle in range(0, 360, 90):
             # Create path profile sketch at the combined angle
-            previous_segment_path_profile = path_profile_function(
-                **path_parameters, rotation_angle=angle + start_angle
+            previous_segment_path_profile = create_path_profile(
+                previous_segment.path_profile_type,
+                path_parameters,
+                rotation_angle=angle + start_angle,
             )
 
             # Create sketch at start of the second path at respective angle
@@ -1450,6 +1815,29 @@ def are_equal_faces(face1: Face, face2: Face, tolerance: float = 0.01) -> bool:
     return (difference_area / avg_area) <= tolerance
 
 
+def _faces_intersect(part: Part) -> bool:
+    """Self-intersection check of a swept body, through the sweep cache."""
+    return cached_check(
+        "faces_intersect", part, do_faces_intersect, FACES_INTERSECT_CHECK_VERSION
+    )
+
+
+def _single_profile_sweep_inputs(
+    segment: PathSegment,
+    profile: Sketch,
+    transition_type: Transition,
+    is_frenet: bool,
+) -> tuple:
+    """Sweep cache inputs of a single profile sweep."""
+    return (
+        shape_digest(segment.path),
+        shape_digest(profile),
+        segment.path_profile_type,
+        transition_type,
+        is_frenet,
+    )
+
+
 def sweep_single_profile(
     segment: PathSegment,
     profile: Sketch,
@@ -1458,7 +1846,83 @@ def sweep_single_profile(
     is_frenet: bool = False,
 ) -> Part | None:
     """
-    Helper for sweeping a single profile (main path, accent, or support).
+    Sweep a single profile (main path, accent, or support) along the segment path,
+    through the sweep cache when enabled.
+    """
+    try:
+        return cached_sweep(
+            "single_profile",
+            _single_profile_sweep_inputs(
+                segment, profile, transition_type, is_frenet
+            ),
+            lambda: _sweep_single_profile(
+                segment, profile, transition_type, sweep_label, is_frenet
+            ),
+            raise_on_failure=False,
+        )
+    except Exception:
+        # Logged by the last attempt, cached by cached_sweep if a known failure
+        return None
+
+
+def _multisection_sweep(path: Any, profile_start: Sketch, profile_end: Sketch) -> BuildPart:
+    """Multi-section sweep from a start profile at t=0 to an end profile at t=1."""
+    with BuildPart() as body:
+        with BuildLine() as segment_path_line:
+            add(path)
+        with BuildSketch(
+            path.location_at(0, frame_method=FrameMethod.CORRECTED)
+        ) as start_section:
+            add(profile_start)
+        with BuildSketch(
+            path.location_at(1, frame_method=FrameMethod.CORRECTED)
+        ) as end_section:
+            add(profile_end)
+
+        sweep(
+            sections=[start_section.sketch, end_section.sketch],
+            path=segment_path_line.line,
+            multisection=True,
+        )
+    return body
+
+
+def _cached_guide_wire_sweep(
+    segment: PathSegment, profile: Sketch, guide_wire: Spline
+) -> BuildPart:
+    """Sweep a profile along the segment path with a binormal guide wire."""
+
+    def sweep_with_guide_wire() -> BuildPart:
+        with BuildPart() as body:
+            with BuildLine():
+                add(segment.path)
+            with BuildSketch(segment.path.location_at(0, frame_method=FrameMethod.CORRECTED)):
+                add(profile)
+            sweep(binormal=guide_wire, transition=segment.transition_type)
+        return body
+
+    return cached_sweep(
+        "guide_wire",
+        (
+            shape_digest(segment.path),
+            shape_digest(profile),
+            shape_digest(guide_wire),
+            segment.transition_type,
+        ),
+        sweep_with_guide_wire,
+    )
+
+
+def _sweep_single_profile(
+    segment: PathSegment,
+    profile: Sketch,
+    transition_type: Transition,
+    sweep_label: str = "Path",
+    is_frenet: bool = False,
+) -> Part | None:
+    """
+    Helper for sweeping a single profile (main path, accent, or support). Raises
+    the error of the last attempt when all attempts fail.
 
     Special consideration for circle shaped path profiles to try different orientation to work with OCCT seam sweep issues
     """
@@ -1496,7 +1960,7 @@ def sweep_single_profile(
 
             # Only O-shapes: invalid geometry counts as a hard failure (to trigger different angle retries)
             if is_o_shape_profile and not sweep_result.part.is_valid:
-                raise RuntimeError(
+                raise InvalidSweepError(
                     f"Part invalid for sweep of O-shaped profile at {rotation_angle}° "
                     f"(segment {segment.main_index}.{segment.secondary_index})"
                 )
@@ -1520,7 +1984,7 @@ def sweep_single_profile(
 
             return sweep_result
 
-        except Exception as exc:
+        except Exception:
             has_more_attempts = is_o_shape_profile and (attempt_index + 1) < len(
                 rotation_attempts
             )
@@ -1548,11 +2012,63 @@ def sweep_single_profile(
                     segment.main_index,
                     segment.secondary_index,
                 )
-            return None
+            # Raise the last error, callers decide whether it is cached as a failure
+            raise
 
     return None
 
 
+def _sweep_job_payload(payload: SweepJobPayload) -> Part | Exception | None:
+    """
+    Worker process entry point, sweeps a deferred profile and returns the part, or
+    the error of the last attempt when all attempts failed.
+    """
+    try:
+        body = _sweep_single_profile(
+            payload,
+            payload.profile,
+            payload.transition_type,
+            payload.sweep_label,
+            is_frenet=payload.is_frenet,
+        )
+    except Exception as error:
+        return error
+    return body.part if body is not None else None
+
+
+def _sweep_spline_option_payload(
+    payload: SplineOptionPayload,
+) -> Optional[dict[str, Any]]:
+    """
+    Worker process entry point, sweeps one spline option. Returns the profiles
+    and parts it produced by segment attribute name, or None when it failed.
+    """
+    builder = PathBuilder.__new__(PathBuilder)
+    builder.path_profile_type_parameters = payload.path_profile_type_parameters
+    if not builder._sweep_spline_option(payload, payload.option):
+        return None
+
+    results: dict[str, Any] = {}
+    for attr_name in (
+        "path_profile",
+        "path_body",
+        "accent_profile",
+        "accent_body",
+        "support_profile",
+        "support_body",
+    ):
+        value = getattr(payload, attr_name)
+        if value is None:
+            continue
+        # Builders do not pickle, send the part or sketch add() would use
+        if isinstance(value, BuildPart):
+            value = value.part
+        elif isinstance(value, BuildSketch):
+            value = value.sketch_local
+        results[attr_name] = value
+    return results
+
+
 def round_to_nearest_90(value: float) -> float:
     if value not in [-180, -90, 0, 90, 180]:
         rounded_value = round(value / 90) * 90
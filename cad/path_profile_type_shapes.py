@@ -1,6 +1,8 @@
 # cad/path_profile_type_shapes.py
 
-from enum import Enum
+import copy
+import logging
+from typing import Optional
 
 from build123d import (
     BuildLine,
@@ -14,32 +16,16 @@ from build123d import (
     Rectangle,
     RegularPolygon,
     Rot,
+    Sketch,
     make_face,
 )
 
 import config
+from logging_config import configure_logging
+from puzzle.utils.enums import PathProfileType
 
-
-class PathProfileType(Enum):
-    """
-    Enumeration representing the different types of path profiles.
-    """
-
-    L_SHAPE = "l_shape"
-    L_SHAPE_ADJUSTED_HEIGHT = "l_shape_adjusted_height"
-    L_SHAPE_PATH_COLOR = "l_shape_path_color"
-    L_SHAPE_MIRRORED = "l_shape_mirrored"
-    L_SHAPE_MIRRORED_ADJUSTED_HEIGHT = "l_shape_mirrored_adjusted_height"
-    L_SHAPE_MIRRORED_PATH_COLOR = "l_shape_mirrored_path_color"
-    O_SHAPE = "o_shape"
-    O_SHAPE_SUPPORT = "o_shape_support"
-    U_SHAPE = "u_shape"
-    U_SHAPE_ADJUSTED_HEIGHT = "u_shape_adjusted_height"
-    U_SHAPE_PATH_COLOR = "u_shape_path_color"
-    V_SHAPE = "v_shape"
-    V_SHAPE_PATH_COLOR = "v_shape_path_color"
-    SQUARE_CLOSED_SHAPE = "square_closed_shape"
-    SQUARE_WITH_HOLE_SHAPE = "square_with_hole_shape"
+configure_logging()
+logger = logging.getLogger(__name__)
 
 
 def create_l_shape(
@@ -538,3 +524,75 @@ ACCENT_REGISTRY = {
 SUPPORT_REGISTRY = {
     PathProfileType.O_SHAPE: PathProfileType.O_SHAPE_SUPPORT,
 }
+
+
+class ProfileSketchCache:
+    """
+    In-process cache of path profile sketches.
+
+    Keyed by profile type, parameters and rotation angle, since the rotation is
+    part of the sketch geometry. Every call returns its own copy of the cached
+    sketch, sharing the underlying shape, so callers can place it freely.
+    """
+
+    def __init__(self) -> None:
+        self._sketches: dict[tuple, Sketch] = {}
+        self.builds: int = 0
+        self.builds_avoided: int = 0
+
+    def get(
+        self,
+        profile_type: PathProfileType,
+        parameters: Optional[dict] = None,
+        rotation_angle: float = -90,
+    ) -> Sketch:
+        """Return a copy of the profile sketch, building it on the first request."""
+        parameters = parameters or {}
+        key = (
+            profile_type,
+            tuple(sorted(parameters.items())),
+            float(rotation_angle),
+        )
+
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            profile_function = PROFILE_TYPE_FUNCTIONS.get(profile_type, create_u_shape)
+            sketch = profile_function(
+                **parameters, rotation_angle=rotation_angle
+            ).sketch_local
+            self._sketches[key] = sketch
+            self.builds += 1
+        else:
+            self.builds_avoided += 1
+
+        return copy.copy(sketch)
+
+    def clear(self) -> None:
+        self._sketches.clear()
+
+    def log_stats(self) -> None:
+        logger.info(
+            "Profile sketch cache: %d sketches built, %d builds avoided",
+            self.builds,
+            self.builds_avoided,
+        )
+
+
+_profile_sketch_cache = ProfileSketchCache()
+
+
+def get_profile_sketch_cache() -> ProfileSketchCache:
+    """Return the shared profile sketch cache."""
+    return _profile_sketch_cache
+
+
+def create_path_profile(
+    profile_type: PathProfileType,
+    parameters: Optional[dict] = None,
+    rotation_angle: float = -90,
+) -> Sketch:
+    """
+    Create the sketch of a path profile type through the shared profile sketch
+    cache. Unknown profile types fall back to the U shape.
+    """
+    return _profile_sketch_cache.get(profile_type, parameters, rotation_angle)
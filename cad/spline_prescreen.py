@@ -0,0 +1,179 @@
+# cad/spline_prescreen.py
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from build123d import Edge, Sketch
+from OCP.BRepAdaptor import BRepAdaptor_Curve
+from OCP.gp import gp_Pnt, gp_Vec
+
+from logging_config import configure_logging
+from puzzle.node import Node
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Samples per profile half-width of curve length, bounds the error on the radius
+# of curvature and on the distances below
+_SAMPLES_PER_HALF_WIDTH = 10
+_MIN_SAMPLES = 50
+
+# Self-proximity: parts of the centreline further apart along the curve than
+# this many half-widths, may not come closer than one half-width in space
+_SELF_PROXIMITY_ARC_SEPARATION = 2.0
+
+MIN_RADIUS = "minimum radius"
+SELF_PROXIMITY = "self-proximity"
+CORRIDOR_DEVIATION = "corridor deviation"
+
+
+@dataclass
+class SplineScreenResult:
+    """Geometric measures of a candidate spline, taken from samples along its path.
+
+    ``rejected_by`` names the first pre-screen the spline failed, ``None`` when it
+    may still produce a valid sweep.
+    """
+
+    min_radius: float
+    min_self_distance: float
+    max_corridor_deviation: float
+    rejected_by: Optional[str] = None
+
+
+@dataclass
+class SplinePrescreenStats:
+    """Spline options rejected per pre-screen, and the sweeps that saved."""
+
+    screened: int = 0
+    rejected: dict[str, int] = field(default_factory=dict)
+    sweeps_saved: dict[str, int] = field(default_factory=dict)
+
+    def record(self, result: SplineScreenResult, sweep_count: int) -> None:
+        self.screened += 1
+        if result.rejected_by is None:
+            return
+        name = result.rejected_by
+        self.rejected[name] = self.rejected.get(name, 0) + 1
+        self.sweeps_saved[name] = self.sweeps_saved.get(name, 0) + sweep_count
+
+    def log_stats(self) -> None:
+        logger.info(
+            "Spline pre-screen: %d of %d options rejected before sweeping",
+            sum(self.rejected.values()),
+            self.screened,
+        )
+        for name in (MIN_RADIUS, SELF_PROXIMITY, CORRIDOR_DEVIATION):
+            if name in self.rejected:
+                logger.info(
+                    "Spline pre-screen %s: %d options rejected, %d sweeps saved",
+                    name,
+                    self.rejected[name],
+                    self.sweeps_saved[name],
+                )
+
+
+def profile_half_width(profile: Sketch) -> float:
+    """Half the larger side of the profile bounding box in its sketch plane."""
+    size = profile.bounding_box().size
+    return max(size.X, size.Y) / 2.0
+
+
+def sample_curve(curve: Edge, count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample positions, first and second derivatives at evenly spaced parameters."""
+    adaptor = BRepAdaptor_Curve(curve.wrapped)
+    parameters = np.linspace(adaptor.FirstParameter(), adaptor.LastParameter(), count)
+
+    samples = np.empty((3, count, 3))
+    point, first, second = gp_Pnt(), gp_Vec(), gp_Vec()
+    for index, parameter in enumerate(parameters):
+        adaptor.D2(float(parameter), point, first, second)
+        samples[0, index] = (point.X(), point.Y(), point.Z())
+        samples[1, index] = (first.X(), first.Y(), first.Z())
+        samples[2, index] = (second.X(), second.Y(), second.Z())
+    return samples[0], samples[1], samples[2]
+
+
+def min_radius_of_curvature(first: np.ndarray, second: np.ndarray) -> float:
+    """Smallest radius of curvature, |c'|^3 / |c' x c''|, over the samples."""
+    speed = np.linalg.norm(first, axis=1)
+    turning = np.linalg.norm(np.cross(first, second), axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        radii = np.where(turning > 1e-12, speed**3 / turning, np.inf)
+    return float(np.nanmin(radii))
+
+
+def min_self_distance(points: np.ndarray, min_arc_separation: float) -> float:
+    """Closest approach between samples at least min_arc_separation apart along the curve."""
+    arc_length = np.concatenate(
+        ([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1)))
+    )
+    separated = np.abs(arc_length[:, None] - arc_length[None, :]) > min_arc_separation
+    if not separated.any():
+        return math.inf
+
+    distances = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2)
+    return float(distances[separated].min())
+
+
+def max_corridor_deviation(points: np.ndarray, corridor: np.ndarray) -> float:
+    """Largest distance of a sample from the polyline through the corridor nodes."""
+    if len(corridor) < 2:
+        return float(np.linalg.norm(points - corridor[0], axis=1).max())
+
+    starts = corridor[:-1]
+    directions = corridor[1:] - starts
+    lengths_squared = (directions * directions).sum(axis=1)
+    lengths_squared[lengths_squared == 0] = 1.0
+
+    # Project every sample onto every polyline segment
+    offsets = points[:, None, :] - starts[None, :, :]
+    t = np.clip((offsets * directions[None]).sum(axis=2) / lengths_squared, 0.0, 1.0)
+    closest = starts[None] + t[..., None] * directions[None]
+    distances = np.linalg.norm(points[:, None, :] - closest, axis=2)
+    return float(distances.min(axis=1).max())
+
+
+def screen_spline(
+    curve: Edge,
+    corridor_nodes: list[Node],
+    half_width: float,
+    node_size: float,
+    min_radius_factor: float,
+    max_corridor_deviation_nodes: float,
+) -> SplineScreenResult:
+    """Measure a candidate spline and reject it when it cannot sweep cleanly.
+
+    A spline is rejected when its radius of curvature drops below
+    ``min_radius_factor`` profile half-widths (the profile folds over on the inside
+    of the bend), when parts of it more than two half-widths apart along the curve
+    come within one half-width (the swept body runs into itself), or when it
+    strays more than ``max_corridor_deviation_nodes`` node sizes from the nodes it
+    should follow.
+    """
+    count = max(
+        _MIN_SAMPLES, math.ceil(curve.length / half_width * _SAMPLES_PER_HALF_WIDTH)
+    )
+    points, first, second = sample_curve(curve, count)
+    corridor = np.array([(node.x, node.y, node.z) for node in corridor_nodes])
+
+    result = SplineScreenResult(
+        min_radius=min_radius_of_curvature(first, second),
+        min_self_distance=min_self_distance(
+            points, _SELF_PROXIMITY_ARC_SEPARATION * half_width
+        ),
+        max_corridor_deviation=max_corridor_deviation(points, corridor),
+    )
+
+    if result.min_radius < min_radius_factor * half_width:
+        result.rejected_by = MIN_RADIUS
+    elif result.min_self_distance < half_width:
+        result.rejected_by = SELF_PROXIMITY
+    elif result.max_corridor_deviation > max_corridor_deviation_nodes * node_size:
+        result.rejected_by = CORRIDOR_DEVIATION
+    return result
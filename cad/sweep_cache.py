@@ -0,0 +1,295 @@
+# cad/sweep_cache.py
+
+import hashlib
+import io
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+import build123d
+from build123d import BuildPart, BuildSketch, Part, Shape, export_brep, import_brep
+
+import config
+from config import Config
+from logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Bump when sweep code changes in a way that changes the swept geometry
+SWEEP_CACHE_VERSION = 1
+
+
+# TShape flag lines in BREP text (free, modified, checked, ...), these record how a
+# shape was used by builders rather than its geometry
+_BREP_FLAG_LINE = re.compile(rb"^[01]{7}$", re.MULTILINE)
+
+
+# OCCT exceptions that report the state of the process rather than the geometry
+_TRANSIENT_OCCT_ERRORS = ("Standard_OutOfMemory",)
+
+
+class CachedSweepFailure(RuntimeError):
+    """Raised for a sweep that is known to fail from an earlier run."""
+
+
+class InvalidSweepError(RuntimeError):
+    """Raised for a sweep that completed with an invalid body."""
+
+
+def is_sweep_failure(error: BaseException) -> bool:
+    """
+    Whether an error means the inputs cannot be swept: an OCCT exception, a
+    build123d input validation error or an invalid result. Other errors, such as
+    running out of memory, an interrupted worker or disk errors, may not repeat.
+    """
+    if isinstance(error, (ValueError, InvalidSweepError)):
+        return True
+    error_type = type(error)
+    return (
+        error_type.__module__.startswith("OCP.")
+        and error_type.__name__ not in _TRANSIENT_OCCT_ERRORS
+    )
+
+
+def shape_digest(shape: Any) -> str:
+    """
+    Content hash of a shape, taken over its BREP serialization without the shape
+    flags. Builders are hashed by the object add() would place, e.g. the local
+    sketch of a BuildSketch.
+    """
+    if isinstance(shape, BuildSketch):
+        shape = shape.sketch_local
+    elif isinstance(shape, BuildPart):
+        shape = shape.part
+
+    buffer = io.BytesIO()
+    export_brep(shape, buffer)
+    return hashlib.sha256(_BREP_FLAG_LINE.sub(b"", buffer.getvalue())).hexdigest()
+
+
+class SweepCache:
+    """
+    Content-addressed on-disk cache of swept bodies.
+
+    Keys hash the sweep inputs together with a version salt, values are BREP files
+    of the resulting part. Sweeps that failed are stored as a marker file so they
+    are not retried. Boolean check results on swept bodies, such as the spline
+    self-intersection check, are stored alongside, keyed by the body digest. The directory is bounded in size, least recently used entries
+    are evicted first (a hit refreshes the file modification time).
+    """
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int) -> None:
+        self.cache_dir: Path = Path(cache_dir)
+        self.max_size_bytes: int = max_size_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        # Total size of the cache files, read from disk on the first store
+        self._size_bytes: Optional[int] = None
+
+    def key(self, kind: str, *inputs: Any) -> str:
+        """Build a cache key from the sweep kind and its inputs."""
+        digest = hashlib.sha256()
+        for part in (SWEEP_CACHE_VERSION, build123d.__version__, kind, *inputs):
+            digest.update(repr(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _body_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.brep"
+
+    def _failed_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.failed"
+
+    def _check_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.check"
+
+    def lookup(self, key: str) -> Tuple[bool, Optional[BuildPart]]:
+        """
+        Return (found, body). A cached failure is (True, None), a miss or an
+        unreadable entry is (False, None).
+        """
+        for cache_file, is_failure in (
+            (self._body_file(key), False),
+            (self._failed_file(key), True),
+        ):
+            if not cache_file.exists():
+                continue
+            try:
+                body = None if is_failure else wrap_part(import_brep(cache_file))
+                os.utime(cache_file)
+            except Exception:
+                logger.warning("Ignoring unreadable sweep cache entry %s", cache_file)
+                break
+            self.hits += 1
+            return True, body
+
+        self.misses += 1
+        return False, None
+
+    def lookup_check(self, key: str) -> Optional[bool]:
+        """Return a cached check result, None on a miss."""
+        cache_file = self._check_file(key)
+        try:
+            result = cache_file.read_text() == "1"
+            os.utime(cache_file)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def store_check(self, key: str, result: bool) -> None:
+        """Store the result of a check on a swept body."""
+        self._prepare_store()
+        cache_file = self._check_file(key)
+        cache_file.write_text("1" if result else "0")
+        self._added(cache_file)
+
+    def store(self, key: str, body: Optional[BuildPart]) -> None:
+        """Store a swept body, or a failed sweep when body is None."""
+        self._prepare_store()
+
+        if body is None:
+            cache_file = self._failed_file(key)
+            cache_file.touch()
+        else:
+            # Write to a temporary file first, so readers never see a partial file
+            cache_file = self._body_file(key)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            export_brep(body.part, temp_file)
+            os.replace(temp_file, cache_file)
+        self._added(cache_file)
+
+    def _prepare_store(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self._size_bytes is None:
+            self._size_bytes = sum(size for _, size, _ in self._entries())
+
+    def _added(self, cache_file: Path) -> None:
+        """Account for a newly written file and evict when over the size bound."""
+        self._size_bytes += cache_file.stat().st_size
+        if self._size_bytes > self.max_size_bytes:
+            self._evict()
+
+    def _entries(self) -> list[Tuple[float, int, Path]]:
+        """(modification time, size, path) of every cache file."""
+        return [
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in self.cache_dir.iterdir()
+            if entry.suffix in (".brep", ".failed", ".check")
+        ]
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size bound."""
+        entries = self._entries()
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total_size <= self.max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+            self.evictions += 1
+
+        self._size_bytes = total_size
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def log_stats(self) -> None:
+        logger.info(
+            "Sweep cache: %d hits, %d misses (%.0f%% hit rate), %d evictions",
+            self.hits,
+            self.misses,
+            self.hit_rate * 100,
+            self.evictions,
+        )
+
+
+def wrap_part(shape: Shape) -> BuildPart:
+    """
+    Wrap a part in a builder, path building code works on body.part. The shape is
+    assigned as is, so its topology and digest are unchanged.
+    """
+    body = BuildPart()
+    body.part = Part(shape.wrapped)
+    return body
+
+
+_sweep_cache: Optional[SweepCache] = None
+
+
+def get_sweep_cache() -> Optional[SweepCache]:
+    """Return the shared sweep cache, or None when disabled in the configuration."""
+    global _sweep_cache
+    if not Config.Path.SWEEP_CACHE_ENABLED:
+        return None
+    cache_dir = Path(Config.Path.SWEEP_CACHE_DIR)
+    if not cache_dir.is_absolute():
+        cache_dir = Path(config.__file__).resolve().parent / cache_dir
+    if _sweep_cache is None or _sweep_cache.cache_dir != cache_dir:
+        _sweep_cache = SweepCache(
+            cache_dir=cache_dir,
+            max_size_bytes=Config.Path.SWEEP_CACHE_MAX_MB * 1024 * 1024,
+        )
+    return _sweep_cache
+
+
+def cached_sweep(
+    kind: str,
+    inputs: tuple,
+    sweep: Callable[[], Optional[BuildPart]],
+    raise_on_failure: bool = True,
+) -> Optional[BuildPart]:
+    """
+    Run sweep() through the shared cache, keyed by kind and inputs.
+
+    A sweep that returns None or raises a known sweep failure (see
+    is_sweep_failure) is cached as a failure, other errors are not cached. With
+    raise_on_failure a cached failure raises CachedSweepFailure, matching sweeps
+    that report failure by raising, otherwise None is returned.
+    """
+    sweep_cache = get_sweep_cache()
+    if sweep_cache is None:
+        return sweep()
+
+    key = sweep_cache.key(kind, *inputs)
+    found, body = sweep_cache.lookup(key)
+    if found:
+        if body is None and raise_on_failure:
+            raise CachedSweepFailure(f"{kind} sweep failed in an earlier run")
+        return body
+
+    try:
+        body = sweep()
+    except Exception as error:
+        if is_sweep_failure(error):
+            sweep_cache.store(key, None)
+        raise
+    sweep_cache.store(key, body)
+    return body
+
+
+def cached_check(
+    kind: str, part: Part, check: Callable[[Part], bool], check_version: int
+) -> bool:
+    """
+    Run check(part) through the shared cache, keyed by kind, the version of the
+    check and the part digest.
+    """
+    sweep_cache = get_sweep_cache()
+    if sweep_cache is None:
+        return check(part)
+
+    key = sweep_cache.key(kind, check_version, shape_digest(part))
+    result = sweep_cache.lookup_check(key)
+    if result is None:
+        result = check(part)
+        sweep_cache.store_check(key, result)
+    return result
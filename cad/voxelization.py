@@ -0,0 +1,170 @@
+# cad/voxelization.py
+
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# Columns are shifted off the sub-cell centres by this fraction of the cell size,
+# so they do not run exactly through mesh vertices and edges, which lie on
+# round coordinates for most obstacles
+_COLUMN_JITTER = (1.1e-6, 1.7e-6)
+
+
+def _expand(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Owner index and local offset for ``counts[i]`` consecutive entries of each i."""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, local
+
+
+def column_crossings(
+    triangles: np.ndarray, column_x: np.ndarray, column_y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Heights where vertical lines through a grid of columns cross the mesh.
+
+    ``column_x`` and ``column_y`` are sorted column coordinates, the columns are
+    their outer product. Returns the x index, y index and z of every crossing.
+    """
+    corners_xy = triangles[:, :, :2]
+    lower, upper = corners_xy.min(axis=1), corners_xy.max(axis=1)
+
+    # Column index ranges covered by each triangle's footprint
+    x_first = np.searchsorted(column_x, lower[:, 0], side="left")
+    x_last = np.searchsorted(column_x, upper[:, 0], side="right")
+    y_first = np.searchsorted(column_y, lower[:, 1], side="left")
+    y_last = np.searchsorted(column_y, upper[:, 1], side="right")
+    x_span = np.maximum(x_last - x_first, 0)
+    y_span = np.maximum(y_last - y_first, 0)
+
+    triangle, local = _expand(x_span * y_span)
+    ix = x_first[triangle] + local % x_span[triangle]
+    iy = y_first[triangle] + local // x_span[triangle]
+    px, py = column_x[ix], column_y[iy]
+
+    # Barycentric coordinates of the column in the triangle footprint
+    a, b, c = (triangles[triangle, corner] for corner in range(3))
+    bc_x, bc_y = c[:, 0] - b[:, 0], b[:, 1] - c[:, 1]
+    ca_x, ca_y = a[:, 0] - c[:, 0], c[:, 1] - a[:, 1]
+    denominator = bc_y * ca_x - bc_x * ca_y
+    valid = np.abs(denominator) > 1e-15
+    denominator = np.where(valid, denominator, 1.0)
+    dx, dy = px - c[:, 0], py - c[:, 1]
+    u = (bc_y * dx + bc_x * dy) / denominator
+    v = (ca_y * dx + ca_x * dy) / denominator
+    w = 1.0 - u - v
+    inside = valid & (u >= 0) & (v >= 0) & (w >= 0)
+
+    z = u * a[:, 2] + v * b[:, 2] + w * c[:, 2]
+    return ix[inside], iy[inside], z[inside]
+
+
+def cell_fill_fractions(
+    triangles: np.ndarray,
+    x_values: Sequence[float],
+    y_values: Sequence[float],
+    z_values: Sequence[float],
+    cell_size: float,
+    samples: int = 8,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Estimate the filled fraction of every lattice cell of a closed mesh.
+
+    Each cell is sampled by ``samples`` x ``samples`` vertical columns. Along a
+    column the inside intervals follow exactly from the parity of the mesh
+    crossings, the filled length per cell is averaged over its columns.
+
+    Returns the fractions, shaped (len(x), len(y), len(z)), and a mask of cells
+    with a column of odd crossing parity, whose estimate cannot be trusted.
+    """
+    x_values, y_values, z_values = (
+        np.asarray(values, dtype=float) for values in (x_values, y_values, z_values)
+    )
+    shape = (len(x_values), len(y_values), len(z_values))
+    fractions = np.zeros(shape)
+    unreliable = np.zeros(shape, dtype=bool)
+    if len(triangles) == 0 or 0 in shape:
+        return fractions, unreliable
+
+    offsets = ((np.arange(samples) + 0.5) / samples - 0.5) * cell_size
+    column_x = (x_values[:, None] + offsets[None, :]).ravel()
+    column_x += _COLUMN_JITTER[0] * cell_size
+    column_y = (y_values[:, None] + offsets[None, :]).ravel()
+    column_y += _COLUMN_JITTER[1] * cell_size
+
+    ix, iy, z = column_crossings(triangles, column_x, column_y)
+
+    # Crossings sorted per column, then by height
+    column = ix * len(column_y) + iy
+    order = np.lexsort((z, column))
+    column, z = column[order], z[order]
+    columns, starts, counts = np.unique(column, return_index=True, return_counts=True)
+
+    # Columns with an odd number of crossings, eg grazing an edge
+    odd = columns[counts % 2 == 1]
+    unreliable[
+        (odd // len(column_y)) // samples, (odd % len(column_y)) // samples
+    ] = True
+
+    # Inside intervals are consecutive crossing pairs of the even columns
+    position = np.arange(len(column)) - np.repeat(starts, counts)
+    even = np.repeat(counts % 2 == 0, counts)
+    first = np.flatnonzero(even & (position % 2 == 0))
+    interval_column = column[first]
+    bottom, top = z[first], z[first + 1]
+
+    # Spread every interval over the cells it passes along z
+    z_lower = z_values - cell_size / 2
+    first_cell = np.clip(np.searchsorted(z_lower, bottom, side="right") - 1, 0, None)
+    last_cell = np.searchsorted(z_lower, top, side="left")
+    interval, local = _expand(np.maximum(last_cell - first_cell, 0))
+    cell_z = first_cell[interval] + local
+    valid = cell_z < len(z_values)
+    interval, cell_z = interval[valid], cell_z[valid]
+
+    length = np.minimum(top[interval], z_lower[cell_z] + cell_size) - np.maximum(
+        bottom[interval], z_lower[cell_z]
+    )
+    cell_x = (interval_column[interval] // len(column_y)) // samples
+    cell_y = (interval_column[interval] % len(column_y)) // samples
+    np.add.at(fractions, (cell_x, cell_y, cell_z), np.clip(length, 0.0, None))
+
+    fractions /= samples * samples * cell_size
+    return fractions, unreliable
+
+
+def surface_cells(
+    triangles: np.ndarray,
+    x_values: Sequence[float],
+    y_values: Sequence[float],
+    z_values: Sequence[float],
+    cell_size: float,
+) -> np.ndarray:
+    """Mask of the lattice cells overlapped by the bounding box of a mesh triangle.
+
+    Cells outside the mask are either completely inside or outside the solid.
+    """
+    axes = [
+        np.asarray(values, dtype=float) for values in (x_values, y_values, z_values)
+    ]
+    mask = np.zeros(tuple(len(values) for values in axes), dtype=bool)
+    if len(triangles) == 0 or mask.size == 0:
+        return mask
+
+    first, last = [], []
+    for axis, values in enumerate(axes):
+        cell_lower = values - cell_size / 2
+        lowest = triangles[:, :, axis].min(axis=1)
+        highest = triangles[:, :, axis].max(axis=1)
+        first.append(np.searchsorted(cell_lower + cell_size, lowest))
+        last.append(np.searchsorted(cell_lower, highest, side="right"))
+    spans = np.maximum(np.stack(last) - np.stack(first), 0)
+
+    triangle, local = _expand(spans.prod(axis=0))
+    span_x, span_y = spans[0][triangle], spans[1][triangle]
+    mask[
+        first[0][triangle] + local % span_x,
+        first[1][triangle] + (local // span_x) % span_y,
+        first[2][triangle] + local // (span_x * span_y),
+    ] = True
+    return mask
@@ -6,10 +6,10 @@ from cad.cases.case_model_base import (
     CaseManufacturer,
     CaseShape,
 )
-from cad.path_profile_type_shapes import PathProfileType
 from puzzle.utils.enums import (
     ObstacleType,
     PathCurveType,
+    PathProfileType,
     PathSegmentDesignStrategy,
     Theme,
 )
@@ -26,6 +26,8 @@ class Puzzle:
     SEED = 4  # Random seed for reproducibility
     NUMBER_OF_WAYPOINTS = 14  # Number of randomly placed waypoints
     WAYPOINT_CHANGE_INTERVAL = 1  # Change path profile and curve type every n waypoints
+    PATH_QUERY_CACHE_SIZE = 4096  # Cached path queries during backtracking (LRU)
+    BACKTRACKING_WORKERS = 1  # Worker processes for backtracking, 1 = serial search
 
     BALL_COLOR = "#C0C0C0"  # Metal grey
     PATH_COLORS = ["#F0CC00", "#3D3FCE", "#B82D2D"]  # Gold, Cyan, Magenta
@@ -52,8 +54,12 @@ class Obstacles:
         # ObstacleType.OVERHAND_KNOT, # TODO multi section
     ]
     MAX_TO_PLACE = 5  # target number of obstacles to place (total)
-    ATTEMPTS_PER_PLACEMENT = 5  # random tries per single obstacle instance
+    ATTEMPTS_PER_PLACEMENT = 5  # pose draws per single obstacle instance
     PER_TYPE_LIMIT = 1  # optional cap per obstacle type (None = unlimited)
+    # Occupied and overlap node cache, one npz file per obstacle keyed by a hash of its
+    # source and parameters, a relative path is taken from the project root.
+    # Rebuild all entries with: python -m obstacles.node_cache
+    NODE_CACHE_DIR = "obstacles/catalogue/cache"
     # Manual obstacle placement (processed before random placement)
     # name: ObstacleType
     # origin: world coords (x, y, z) in mm
@@ -142,6 +148,19 @@ class Path:
     # Small overlap is allowed, tune here.
     SPLINE_OCCUPANCY_CHECK_ENABLED = True
     SPLINE_OCCUPANCY_MAX_OVERLAP = 0.3
+    # Spline option pre-screen, rejects options from sampled geometry before sweeping.
+    # Opt-in: the limits are heuristics and may reject an option that sweeps fine.
+    SPLINE_PRESCREEN_ENABLED = False
+    SPLINE_PRESCREEN_MIN_RADIUS_FACTOR = 0.6  # Of the path profile half-width
+    SPLINE_PRESCREEN_MAX_CORRIDOR_DEVIATION = 1.5  # In node sizes, from the segment nodes
+    SWEEP_WORKERS = 1  # Worker processes for accent and support sweeps, 1 = serial
+    SPLINE_OPTION_WORKERS = 1  # Worker processes for the options of a spline, 1 = serial
+    FUSION_WORKERS = 1  # Worker processes for independent unions of path bodies, 1 = serial
+    FUSION_FUZZY_VALUE = 0.0  # Fuzzy Boolean tolerance in mm for the unions, 0 = exact
+    SWEEP_CACHE_ENABLED = True  # Reuse swept bodies across runs, stored as BREP files
+    # Sweep cache directory, a relative path is taken from the project root
+    SWEEP_CACHE_DIR = "cad/cache/sweeps"
+    SWEEP_CACHE_MAX_MB = 512  # Least recently used bodies are evicted above this size
 
     PATH_PROFILE_TYPES = [
         # PathProfileType.U_SHAPE,
@@ -35,8 +35,7 @@ def show_obstacles_overview() -> None:
     max_width = max_height = 0.0
 
     for obstacle in obstacles:
-        obstacle.create_obstacle_geometry()
-        solid = obstacle.model_solid()
+        solid = obstacle.cached_model_solid()
 
         bbox = solid.bounding_box()  # -> has .min/.max vectors with X/Y/Z
         width = bbox.max.X - bbox.min.X
@@ -75,7 +74,8 @@ def show_obstacles_overview() -> None:
         # Translate to center inside the cell
         dx = cell_cx - bx_cx
         dy = cell_cy - by_cy
-        solid.locate(Location(Pos(Vector(dx, dy, 0))))  # absolute move
+        # Moved copy, the cached solid stays at the origin
+        solid = solid.moved(Location(Pos(Vector(dx, dy, 0))))
 
         # Label/color for viewer tree & appearance
         solid.label = f"{obstacle.name}"
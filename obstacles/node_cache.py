@@ -0,0 +1,264 @@
+# obstacles/node_cache.py
+
+"""
+On-disk cache of the occupied and overlap nodes of obstacle types.
+
+Entries are npz files of lattice cells (offsets from the obstacle origin in node
+units), keyed by a hash of the obstacle class source, the code that determines
+the nodes, the obstacle parameters, the path profile parameters and the node
+size, so a change to any of them rebuilds the entry instead of reading a stale
+one.
+
+Rebuild the entries of all registered obstacles in parallel with:
+
+    python -m obstacles.node_cache [--workers N] [--force]
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+import build123d
+import numpy as np
+
+import config
+from logging_config import configure_logging
+
+if TYPE_CHECKING:
+    from obstacles.obstacle import Obstacle
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Bump when code outside the hashed sources changes the determined nodes
+NODE_CACHE_VERSION = 1
+
+# Code and settings the nodes are determined with, as "module" or "module:name",
+# besides the modules of the obstacle class and its catalogue bases. The rest of
+# obstacles/obstacle.py (placement, plotting) does not invalidate the cache.
+_OCCUPANCY_SOURCES = (
+    "obstacles.obstacle:Obstacle.default_path_profile_type",
+    "obstacles.obstacle:Obstacle.cached_model_solid",
+    "obstacles.obstacle:Obstacle._load_node_cache",
+    "obstacles.obstacle:Obstacle._relative_entry_exit_nodes",
+    "obstacles.obstacle:Obstacle.determine_occupied_nodes",
+    "obstacles.obstacle:Obstacle.determine_overlap_allowed_nodes",
+    "obstacles.obstacle:VOXEL_SAMPLES",
+    "obstacles.obstacle:VOXEL_MESH_TOLERANCE",
+    "obstacles.obstacle:VOXEL_MESH_ANGULAR_TOLERANCE",
+    "obstacles.obstacle:VOXEL_EXACT_MARGIN",
+    "cad.mesh_intersection:tessellate_faces",
+    "cad.path_profile_type_shapes",
+    "cad.voxelization",
+    "puzzle.utils.geometry:frange",
+    "puzzle.utils.geometry:snap",
+)
+
+# Modules whose classes are hashed through _OCCUPANCY_SOURCES or not at all
+_SHARED_MODULES = frozenset({"builtins", "abc", "obstacles.obstacle"})
+
+# Instance attributes set by placement or determined from the cache, not part of
+# the obstacle type
+_STATE_ATTRIBUTES = frozenset(
+    {
+        "occupied_nodes",
+        "overlap_nodes",
+        "grid_origin",
+        "rotation_angles_deg",
+        "placement_failure_type",
+        "placement_failure_coordinates",
+        "manual_placement_index",
+    }
+)
+
+
+def cache_dir() -> Path:
+    """The configured cache root, a relative path is taken from the project root."""
+    root = Path(config.Obstacles.NODE_CACHE_DIR)
+    if not root.is_absolute():
+        root = Path(config.__file__).resolve().parent / root
+    return root
+
+
+def _is_parameter(value: Any) -> bool:
+    """Whether a value is a plain parameter with a stable repr."""
+    if value is None or isinstance(value, (bool, int, float, str, Enum)):
+        return True
+    if isinstance(value, (tuple, list)):
+        return all(_is_parameter(item) for item in value)
+    return False
+
+
+def _resolve(source: str) -> Any:
+    """The module, or the object within it, named by an _OCCUPANCY_SOURCES entry."""
+    module_name, _, attribute_path = source.partition(":")
+    resolved = importlib.import_module(module_name)
+    for attribute in filter(None, attribute_path.split(".")):
+        resolved = getattr(resolved, attribute)
+    return resolved
+
+
+def _source_text(obj: Any) -> str:
+    """
+    Source of a module, class or function with normalised line endings, so a
+    checkout with CRLF endings hashes the same. Other values hash by their repr.
+    """
+    if not (inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isroutine(obj)):
+        return repr(obj)
+    return "\n".join(inspect.getsource(obj).splitlines())
+
+
+def _sources(obstacle: "Obstacle") -> list[str]:
+    """Sources of the obstacle class modules and the occupancy code."""
+    modules = []
+    for cls in type(obstacle).__mro__:
+        module = inspect.getmodule(cls)
+        if cls.__module__ not in _SHARED_MODULES and module not in modules:
+            modules.append(module)
+    return [_source_text(module) for module in modules] + [
+        _source_text(_resolve(source)) for source in _OCCUPANCY_SOURCES
+    ]
+
+
+def node_cache_key(obstacle: "Obstacle") -> str:
+    """
+    Hash of everything the obstacle nodes are determined from: the sources of the
+    obstacle class and occupancy code, the plain instance attributes, the entry and
+    exit nodes, the profile parameters and the node size.
+    """
+    digest = hashlib.sha256()
+    for source in _sources(obstacle):
+        digest.update(source.encode())
+        digest.update(b"\0")
+
+    parameters = sorted(
+        (name, value)
+        for name, value in vars(obstacle).items()
+        if not name.startswith("_")
+        and name not in _STATE_ATTRIBUTES
+        and _is_parameter(value)
+    )
+    entry_exit = [
+        (node.x, node.y, node.z)
+        for segment in (obstacle.entry_path_segment, obstacle.exit_path_segment)
+        for node in segment.nodes
+    ]
+    for part in (
+        NODE_CACHE_VERSION,
+        build123d.__version__,
+        type(obstacle).__qualname__,
+        obstacle.node_size,
+        parameters,
+        entry_exit,
+        config.Path.PATH_PROFILE_TYPE_PARAMETERS,
+    ):
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _name_prefix(obstacle: "Obstacle") -> str:
+    return obstacle.name.replace(" ", "_").lower()
+
+
+def node_cache_file(obstacle: "Obstacle") -> Path:
+    """
+    Cache file of an obstacle, taken before its geometry is created, which may
+    update the attributes the key is built from.
+    """
+    key = node_cache_key(obstacle)
+    return cache_dir() / f"{_name_prefix(obstacle)}-{key[:16]}.npz"
+
+
+def load_node_cells(cache_file: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return the cached (occupied, overlap) cells, None on a miss."""
+    if not cache_file.exists():
+        return None
+    try:
+        with np.load(cache_file) as data:
+            return data["occupied"], data["overlap"]
+    except Exception:
+        logger.warning("Ignoring unreadable node cache entry %s", cache_file)
+        return None
+
+
+def store_node_cells(
+    cache_file: Path, occupied: np.ndarray, overlap: np.ndarray
+) -> None:
+    """Store the occupied and overlap cells of an obstacle type."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so readers never see a partial file
+    temp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp.npz")
+    np.savez_compressed(
+        temp_file,
+        occupied=np.asarray(occupied, dtype=np.int32).reshape(-1, 3),
+        overlap=np.asarray(overlap, dtype=np.int32).reshape(-1, 3),
+    )
+    os.replace(temp_file, cache_file)
+
+
+def _rebuild(name: str) -> Tuple[str, str, float]:
+    """
+    Construct a registered obstacle in a worker process, which determines and stores
+    its nodes on a cache miss.
+    """
+    from obstacles.obstacle_registry import get_obstacle_class
+
+    start = time.perf_counter()
+    obstacle = get_obstacle_class(name)()
+    cache_file = obstacle.class_geometry().node_cache_file
+    return name, cache_file.name, time.perf_counter() - start
+
+
+def rebuild_node_caches(workers: Optional[int] = None, force: bool = False) -> None:
+    """
+    Build the missing cache entries of all registered obstacles in parallel, or all
+    of them with force, then remove the entries no obstacle uses anymore.
+    """
+    from obstacles.obstacle_registry import get_available_obstacles
+
+    if force:
+        for entry in cache_dir().glob("*.npz"):
+            entry.unlink()
+
+    names = get_available_obstacles()
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, len(names))) as executor:
+        results = list(executor.map(_rebuild, names))
+
+    current = set()
+    for name, file_name, seconds in results:
+        logger.info("%s: %s (%.1f s)", name, file_name, seconds)
+        current.add(file_name)
+
+    for entry in cache_dir().glob("*.npz"):
+        if entry.name not in current:
+            logger.info("Removing unused node cache entry %s", entry.name)
+            entry.unlink()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the node caches of all registered obstacles."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild entries that are up to date"
+    )
+    args = parser.parse_args()
+    rebuild_node_caches(workers=args.workers, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
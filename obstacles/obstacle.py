@@ -1,11 +1,11 @@
 # obstacles/obstacle.py
 import copy
-import json
 import logging
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 import plotly.graph_objects as go
 from build123d import (
@@ -13,26 +13,37 @@ from build123d import (
     BuildLine,
     BuildPart,
     Color,
-    Face,
     Location,
     Part,
     Plane,
     Polyline,
     Pos,
+    Sketch,
     Transition,
     Vector,
 )
+import numpy as np
 from numpy import linspace
 from ocp_vscode import Camera, set_defaults, show
 
 import config
 from cad.path_profile_type_shapes import (
-    PROFILE_TYPE_FUNCTIONS,
     PathProfileType,
+    create_path_profile,
 )
+from cad.mesh_intersection import tessellate_faces
 from cad.path_segment import PathSegment
+from cad.voxelization import cell_fill_fractions, surface_cells
 from logging_config import configure_logging
+from obstacles.node_cache import load_node_cells, node_cache_file, store_node_cells
 from obstacles.obstacle_placement_failure_types import ObstaclePlacementFailureType
+from obstacles.placement_search import (
+    Angles,
+    OrientationMasks,
+    distinct_orientations,
+    lattice_offsets,
+    orientation_masks,
+)
 from puzzle.grid_layouts.grid_layout_sphere import SphereCasing
 from puzzle.node import Node
 from puzzle.utils.geometry import frange, snap
@@ -47,6 +58,40 @@ from visualization.visualization_helpers import (
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# Voxelization of the obstacle solid: columns per cell side, mesh deflection in mm
+# and radians, and the margin around the overlap threshold (as a cube fraction)
+# within which the estimate is confirmed with an exact Boolean. The estimate is
+# off by at most about 1 / VOXEL_SAMPLES for walls parallel to the columns.
+VOXEL_SAMPLES = 32
+VOXEL_MESH_TOLERANCE = 0.01
+VOXEL_MESH_ANGULAR_TOLERANCE = 0.1
+VOXEL_EXACT_MARGIN = 0.04
+
+
+@dataclass
+class ObstacleGeometry:
+    """
+    Local-frame data of an obstacle type, shared by all its instances, which only
+    add a pose. Filled lazily; treat the contents as read-only.
+    """
+
+    occupied_nodes: Optional[list[Node]] = None
+    overlap_nodes: Optional[list[Node]] = None
+    occupied_cells: Optional[np.ndarray] = None
+    overlap_cells: Optional[np.ndarray] = None
+    entry_exit_nodes: Optional[Tuple[Node, Node]] = None
+    node_cache_file: Optional[Path] = None
+    solids: Dict[PathProfileType, Part] = field(default_factory=dict)
+    extras: Optional[Part] = None
+    extras_built: bool = False
+    orientation_masks: Dict[Tuple[Angles, ...], list[OrientationMasks]] = field(
+        default_factory=dict
+    )
+
+
+# Shared geometry per obstacle class, name and node size
+_GEOMETRY_CACHE: Dict[Tuple[type, str, float], ObstacleGeometry] = {}
+
 
 class Obstacle(ABC):
     """
@@ -82,6 +127,9 @@ class Obstacle(ABC):
         self.overlap_percentage = 5  # Can be adjusted on a per obstacle basis
         self.occupied_nodes: Optional[list[Node]] = None
         self.overlap_nodes: Optional[list[Node]] = None
+        # The same nodes in lattice units, (N, 3) int32 offsets from the origin
+        self.occupied_cells: np.ndarray = np.empty((0, 3), dtype=np.int32)
+        self.overlap_cells: np.ndarray = np.empty((0, 3), dtype=np.int32)
 
         # Path profile selections for visualization and debugging
         self.path_profile_type: PathProfileType = PathProfileType.U_SHAPE
@@ -140,7 +188,7 @@ class Obstacle(ABC):
         _build_wire_from_nodes(self.entry_path_segment)
         _build_wire_from_nodes(self.exit_path_segment)
 
-    def default_path_profile_type(self, rotation_angle: float = -90) -> Face:
+    def default_path_profile_type(self, rotation_angle: float = -90) -> Sketch:
         """
         Build the configured path profile shape for use in sweeps.
 
@@ -150,25 +198,39 @@ class Obstacle(ABC):
         profile_params = config.Path.PATH_PROFILE_TYPE_PARAMETERS.get(
             profile_type.value, {}
         )
-        profile_factory = PROFILE_TYPE_FUNCTIONS.get(profile_type)
 
-        return profile_factory(**profile_params, rotation_angle=rotation_angle)
+        return create_path_profile(profile_type, profile_params, rotation_angle)
+
+    def class_geometry(self) -> ObstacleGeometry:
+        """The geometry shared by all obstacles of this class, name and node size."""
+        key = (type(self), self.name, self.node_size)
+        geometry = _GEOMETRY_CACHE.get(key)
+        if geometry is None:
+            geometry = _GEOMETRY_CACHE[key] = ObstacleGeometry()
+        return geometry
 
     def load_relative_node_coords(self) -> list[Node]:
         """
-        Load relative node coordinates from cached json file,
-        if not present, determine and store
+        Load relative node coordinates from the node cache,
+        if not present, determine and store.
+        The cache is read once per obstacle class, later instances share its nodes.
         """
-        cache_dir = Path("obstacles/catalogue/cache")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        fn = cache_dir / f"{self.name.replace(' ', '_').lower()}_nodes.json"
+        geometry = self.class_geometry()
+        if geometry.occupied_nodes is None:
+            self._load_node_cache(geometry)
 
-        if fn.exists():
-            with open(fn) as f:
-                data = json.load(f)
-            occ = data.get("occupied_nodes", [])
-            overlap = data.get("overlap_allowed", [])
-        else:
+        self.occupied_nodes = geometry.occupied_nodes
+        self.overlap_nodes = geometry.overlap_nodes
+        self.occupied_cells = geometry.occupied_cells
+        self.overlap_cells = geometry.overlap_cells
+
+        return self.occupied_nodes
+
+    def _load_node_cache(self, geometry: ObstacleGeometry) -> None:
+        """Read or determine the relative node coordinates into the class geometry."""
+        geometry.node_cache_file = node_cache_file(self)
+        cells = load_node_cells(geometry.node_cache_file)
+        if cells is None:
             self.create_obstacle_geometry()
 
             occ_nodes = self.determine_occupied_nodes()
@@ -182,51 +244,84 @@ class Obstacle(ABC):
                         occ_nodes.append(node)
                         existing.add((node.x, node.y, node.z))
 
-            occ = [
-                dict(
-                    x=n.x / self.node_size,
-                    y=n.y / self.node_size,
-                    z=n.z / self.node_size,
-                )
-                for n in occ_nodes
-            ]
-            # Compute overlap_allowed in unit‐space
+            # Store in lattice units, independent of the puzzle node size
             overlap_nodes = self.determine_overlap_allowed_nodes(occ_nodes)
-            overlap = [
-                dict(
-                    x=n.x / self.node_size,
-                    y=n.y / self.node_size,
-                    z=n.z / self.node_size,
-                )
-                for n in overlap_nodes
-            ]
-            with open(fn, "w") as f:
-                json.dump(
-                    {"occupied_nodes": occ, "overlap_allowed": overlap}, f, indent=2
-                )
+            cells = (
+                lattice_offsets(occ_nodes, self.node_size),
+                lattice_offsets(overlap_nodes, self.node_size),
+            )
+            store_node_cells(geometry.node_cache_file, *cells)
+        occ, overlap = cells
 
         # Rebuild node grid coordinates for puzzle node size
-        self.occupied_nodes = [
+        geometry.occupied_nodes = [
             Node(
-                c["x"] * self.node_size,
-                c["y"] * self.node_size,
-                c["z"] * self.node_size,
+                float(x) * self.node_size,
+                float(y) * self.node_size,
+                float(z) * self.node_size,
                 occupied=True,
             )
-            for c in occ
+            for x, y, z in occ
         ]
 
-        self.overlap_nodes = [
+        geometry.overlap_nodes = [
             Node(
-                c["x"] * self.node_size,
-                c["y"] * self.node_size,
-                c["z"] * self.node_size,
+                float(x) * self.node_size,
+                float(y) * self.node_size,
+                float(z) * self.node_size,
                 overlap_allowed=True,
             )
-            for c in overlap
+            for x, y, z in overlap
         ]
 
-        return self.occupied_nodes
+        geometry.occupied_cells = lattice_offsets(
+            geometry.occupied_nodes, self.node_size
+        )
+        geometry.overlap_cells = lattice_offsets(geometry.overlap_nodes, self.node_size)
+        geometry.occupied_cells.setflags(write=False)
+        geometry.overlap_cells.setflags(write=False)
+
+    def cached_model_solid(
+        self, profile_type: Optional[PathProfileType] = None
+    ) -> Part:
+        """
+        `model_solid()` with the given path profile type, the current one by default,
+        built once per obstacle class. The solid is shared, copy it before changes.
+        """
+        profile_type = profile_type or self.path_profile_type
+        solids = self.class_geometry().solids
+        if profile_type not in solids:
+            if self.main_path_segment.path is None:
+                self.create_obstacle_geometry()
+
+            original_profile_type = self.path_profile_type
+            self.path_profile_type = profile_type
+            solids[profile_type] = self.model_solid()
+            self.path_profile_type = original_profile_type
+
+        return solids[profile_type]
+
+    def distinct_orientation_masks(
+        self, orientations: Sequence[Angles]
+    ) -> list[OrientationMasks]:
+        """
+        Rotated occupied and overlap cells of the orientations that place this obstacle
+        differently, computed once per obstacle class. Orientations repeating the
+        cells and entry/exit nodes of an earlier one, as symmetric obstacles have,
+        are left out.
+        """
+        geometry = self.class_geometry()
+        key = tuple(tuple(angles) for angles in orientations)
+        if key not in geometry.orientation_masks:
+            masks = orientation_masks(
+                self.occupied_cells, self.overlap_cells, orientations
+            )
+            entry_exit = lattice_offsets(
+                self.get_relative_entry_exit_nodes(), self.node_size
+            )
+            geometry.orientation_masks[key] = distinct_orientations(masks, entry_exit)
+
+        return geometry.orientation_masks[key]
 
     def get_placed_obstacle_extras(self) -> Optional[Part]:
         """
@@ -238,8 +333,12 @@ class Obstacle(ABC):
         if self.location is None:
             return None
 
-        # Build the local-space solid
-        self._part_extras = self.model_solid_extras()
+        # Build the local-space solid, once per obstacle class
+        geometry = self.class_geometry()
+        if not geometry.extras_built:
+            geometry.extras = self.model_solid_extras()
+            geometry.extras_built = True
+        self._part_extras = geometry.extras
 
         # Not all obstacles have extra's
         if self._part_extras is None:
@@ -264,6 +363,44 @@ class Obstacle(ABC):
 
         return nodes
 
+    def lattice_pose(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        The placement as an integer rotation matrix and a lattice offset, or None
+        when the location is not a 90° rotation plus a grid translation.
+        """
+        if self.location is None:
+            return np.eye(3, dtype=np.int32), np.zeros(3, dtype=np.int32)
+
+        transformation = self.location.wrapped.Transformation()
+        matrix = np.array(
+            [
+                [transformation.Value(row, col) for col in range(1, 5)]
+                for row in range(1, 4)
+            ]
+        )
+        rotation = np.rint(matrix[:, :3])
+        offset = matrix[:, 3] / self.node_size
+        lattice_offset = np.rint(offset)
+        if (
+            np.abs(matrix[:, :3] - rotation).max() > 1e-9
+            or np.abs(offset - lattice_offset).max() > 1e-6
+        ):
+            return None
+
+        return rotation.astype(np.int32), lattice_offset.astype(np.int32)
+
+    def placed_cells(self, cells: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Place local lattice cells with one integer matrix multiply, or return None
+        when the placement is not grid aligned.
+        """
+        pose = self.lattice_pose()
+        if pose is None:
+            return None
+
+        rotation, offset = pose
+        return cells @ rotation.T + offset
+
     def get_placed_node_coordinates(self, nodes: list[Node] | None) -> list[Node]:
         """Return transformed *copies* of nodes expressed in local coordinates."""
 
@@ -323,8 +460,14 @@ class Obstacle(ABC):
         """Return the local-space entry and exit nodes for the obstacle.
 
         Prefer the explicit entry/exit helper segments if present; fall back
-        to the main path’s start/end otherwise.
+        to the main path’s start/end otherwise. Determined once per obstacle class.
         """
+        geometry = self.class_geometry()
+        if geometry.entry_exit_nodes is None:
+            geometry.entry_exit_nodes = self._relative_entry_exit_nodes()
+        return geometry.entry_exit_nodes
+
+    def _relative_entry_exit_nodes(self) -> Optional[Tuple[Node, Node]]:
         entry_nodes = self.entry_path_segment.nodes
         exit_nodes = self.exit_path_segment.nodes
 
@@ -441,6 +584,10 @@ class Obstacle(ABC):
 
         A node is considered occupied iff the intersection volume between the node's cube
         and the obstacle solid is >= `min_overlap_pct` percent of the cube's volume.
+
+        The solid is tessellated once and the filled fraction of every cube is
+        estimated with NumPy, see `cell_fill_fractions`. Only cubes whose estimate
+        lies within `VOXEL_EXACT_MARGIN` of the threshold get the exact Boolean.
         """
         start_time = time.perf_counter()
 
@@ -453,10 +600,7 @@ class Obstacle(ABC):
         eps = 1e-9 * cube_volume  # tiny tolerance to avoid floating-point chatter
 
         # Build the obstacle solid using the fully filled rectangle sweep
-        original_profile_type = self.path_profile_type
-        self.path_profile_type = PathProfileType.SQUARE_CLOSED_SHAPE
-        obstacle_solid = self.model_solid()
-        self.path_profile_type = original_profile_type
+        obstacle_solid = self.cached_model_solid(PathProfileType.SQUARE_CLOSED_SHAPE)
 
         # Bounding box of obstacle, padded by half a node so border cells are included
         bbox = obstacle_solid.bounding_box()
@@ -470,12 +614,40 @@ class Obstacle(ABC):
         y_values = frange(min_pt.Y, max_pt.Y, node_size)
         z_values = frange(min_pt.Z, max_pt.Z, node_size)
 
+        grid_shape = (len(x_values), len(y_values), len(z_values))
+        if obstacle_solid.is_valid:
+            triangles, _ = tessellate_faces(
+                obstacle_solid,
+                obstacle_solid.faces(),
+                VOXEL_MESH_TOLERANCE,
+                VOXEL_MESH_ANGULAR_TOLERANCE,
+            )
+            fractions, unreliable = cell_fill_fractions(
+                triangles, x_values, y_values, z_values, node_size, VOXEL_SAMPLES
+            )
+            near_threshold = (
+                np.abs(fractions - overlap_threshold) <= VOXEL_EXACT_MARGIN
+            )
+            exact = unreliable | (
+                near_threshold
+                & surface_cells(triangles, x_values, y_values, z_values, node_size)
+            )
+        else:
+            # Crossing parity is meaningless on an invalid solid, intersect every cube
+            fractions = np.zeros(grid_shape)
+            exact = np.ones(grid_shape, dtype=bool)
+
         occupied: list[Node] = []
         tested_count = 0
 
-        for x in x_values:
-            for y in y_values:
-                for z in z_values:
+        for i, x in enumerate(x_values):
+            for j, y in enumerate(y_values):
+                for k, z in enumerate(z_values):
+                    if not exact[i, j, k]:
+                        if fractions[i, j, k] >= overlap_threshold:
+                            occupied.append(Node(x, y, z, occupied=True))
+                        continue
+
                     tested_count += 1
 
                     # Lattice cell centered at (x,y,z)
@@ -502,10 +674,11 @@ class Obstacle(ABC):
         elapsed = time.perf_counter() - start_time
         logger.info(
             "Obstacle: %s. "
-            "Determining occupied nodes took %.3f s – tested %d cubes, occupied: %d, "
-            "threshold: %.2f%%",
+            "Determining occupied nodes took %.3f s – %d cubes, %d intersected exactly, "
+            "occupied: %d, threshold: %.2f%%",
             self.name,
             elapsed,
+            fractions.size,
             tested_count,
             len(occupied),
             min_overlap_pct,
@@ -630,8 +803,7 @@ class Obstacle(ABC):
         """
 
         # Obstacles
-        self.create_obstacle_geometry()
-        obstacle_solid = self.model_solid()
+        obstacle_solid = self.cached_model_solid()
 
         # Cubes
         occupied_cubes = self.solid_model_node_cubes(
@@ -1,7 +1,6 @@
 # obstacles/obstacle_manager.py
 
 import logging
-import math
 import random
 import time
 from collections import Counter
@@ -15,6 +14,7 @@ from logging_config import configure_logging
 from obstacles.obstacle import Obstacle
 from obstacles.obstacle_placement_failure_types import ObstaclePlacementFailureType
 from obstacles.obstacle_registry import get_available_obstacles, get_obstacle_class
+from obstacles.placement_search import PlacementGrid, lattice_offsets
 from puzzle.node import Node
 
 configure_logging()
@@ -26,16 +26,6 @@ def _quantize_coord(val: float, node_size: float) -> float:
     return round(val / node_size) * node_size
 
 
-def _snap_near_grid(value: float, node_size: float, *, tol: float = 1e-6) -> float:
-    """Return the grid-aligned value when the input is already very close to one."""
-
-    scaled = value / node_size
-    rounded = round(scaled)
-    if math.isclose(scaled, rounded, rel_tol=tol, abs_tol=tol):
-        return rounded * node_size
-    return value
-
-
 class ObstacleManager:
     """
     Manages the selection, placement, and node occupation of obstacles.
@@ -83,6 +73,9 @@ class ObstacleManager:
             self._generate_24_xyz_orientations()
         )
 
+        # Dense lattice state for the placement search
+        self.placement_grid = PlacementGrid(nodes, self.node_size)
+
         # Manual placement
         manual_counts = None
         if Config.Obstacles.MANUAL_PLACEMENT_ENABLED:
@@ -305,65 +298,52 @@ class ObstacleManager:
         return manual_counts
 
     def _try_place_one(self, obstacle_name: str, max_attempts: int) -> bool:
-        """Try to place a single obstacle instance of the given type. Returns True on success."""
+        """
+        Try to place a single obstacle instance of the given type. Returns True on success.
+
+        All origins of all distinct orientations are validated at once against the
+        placement grid, so the random pose is drawn from the valid ones only. Each
+        draw is confirmed by `_is_placement_valid`, for up to 'max_attempts' draws.
+        """
         cls = get_obstacle_class(obstacle_name)
-        attempts = 0
+        distinct_masks = cls().distinct_orientation_masks(self.UNIQUE_24_EULER_XYZ)
+
+        poses: Dict[tuple[int, int, int], np.ndarray] = {}
+        for masks in distinct_masks:
+            origins = self.placement_grid.valid_origins(masks)
+            if len(origins):
+                poses[masks.angles] = origins
+
+        logger.debug(
+            "'%s': %s valid origins over %s orientations",
+            obstacle_name,
+            sum(len(origins) for origins in poses.values()),
+            len(poses),
+        )
 
-        while attempts < max_attempts:
+        attempts = 0
+        while poses and attempts < max_attempts:
             obstacle = cls()
 
-            # Random rotation (grid-friendly 90° steps)
-            angle_x, angle_y, angle_z = random.choice(self.UNIQUE_24_EULER_XYZ)
-            R = Rotation(angle_x, angle_y, angle_z, ordering=Extrinsic.XYZ)
-            obstacle.set_placement(R)
-            obstacle.rotation_angles_deg = (angle_x, angle_y, angle_z)
+            # Random valid orientation (grid-friendly 90° steps), then origin
+            angles = random.choice(list(poses))
+            origins = poses[angles]
+            row = random.randrange(len(origins))
+            ox, oy, oz = (float(value) for value in origins[row])
 
-            # Candidate nodes restricted to interior for this rotation
-            interior_nodes, region = self._interior_candidates(obstacle)
-
-            # Check for unoccupied nodes for origin placement
-            pool: list[Node] = []
-            for node in interior_nodes:
-                key = (node.x, node.y, node.z)
-                if key in self.occupied_positions:
-                    continue
-                if key in self.overlap_positions or node.overlap_allowed:
-                    continue
-                pool.append(node)
-
-            # No canditates for this orientation
-            if len(pool) == 0:
-                attempts += 1
-                continue
-
-            # Choose a candidate
-            target = random.choice(pool)
-
-            # Snap target origin to grid and compose a single absolute pose
-            ox = _quantize_coord(target.x, self.node_size)
-            oy = _quantize_coord(target.y, self.node_size)
-            oz = _quantize_coord(target.z, self.node_size)
-            T = Pos(ox, oy, oz)
-
-            obstacle.set_placement(T * R)  # final absolute pose
+            angle_x, angle_y, angle_z = angles
+            R = Rotation(angle_x, angle_y, angle_z, ordering=Extrinsic.XYZ)
+            obstacle.set_placement(Pos(ox, oy, oz) * R)  # final absolute pose
+            obstacle.rotation_angles_deg = angles
             obstacle.grid_origin = (ox, oy, oz)
 
-            # Debug prints
-            xmin, xmax, ymin, ymax, zmin, zmax = region
             logger.debug(
-                "Attempt %s: '%s' origin=%s, rot=%s | interior candidates=%s | placement pool=%s within x[%s,%s] y[%s,%s] z[%s,%s]",
+                "Attempt %s: '%s' origin=%s, rot=%s | valid origins=%s",
                 attempts + 1,
                 obstacle_name,
                 obstacle.grid_origin,
                 obstacle.rotation_angles_deg,
-                len(interior_nodes),
-                len(pool),
-                xmin,
-                xmax,
-                ymin,
-                ymax,
-                zmin,
-                zmax,
+                len(origins),
             )
 
             # Validate
@@ -375,9 +355,19 @@ class ObstacleManager:
                 self._assign_entry_exit_nodes(obstacle)
                 return True
 
+            logger.warning(
+                "Placement search accepted an invalid pose for '%s': %s",
+                obstacle_name,
+                failure_info,
+            )
+            origins = np.delete(origins, row, axis=0)
+            if len(origins):
+                poses[angles] = origins
+            else:
+                del poses[angles]
             attempts += 1
 
-        # Exhausted attempts for this type instance
+        # No valid pose left for this type instance
         return False
 
     def _is_placement_valid(
@@ -391,6 +381,8 @@ class ObstacleManager:
             * occupied ∩ overlap  -> invalid
             * overlap  ∩ occupied -> invalid
             * overlap  ∩ overlap  -> allowed
+        The obstacle's cells are placed by its integer pose and looked up in the
+        dense placement grid.
         Debug logging always uses logger.debug (no debug flag).
 
         Returns:
@@ -398,109 +390,99 @@ class ObstacleManager:
             - is_valid: True if placement is valid, False otherwise
             - failure_info: tuple of (failure_type, conflicting_coordinates) if invalid, None if valid
         """
-        # Transform local occupied/overlap nodes to world space
-        local_occupied = [
-            Node(node.x, node.y, node.z, occupied=True)
-            for node in (obstacle.occupied_nodes or [])
-        ]
-        local_overlap = [
-            Node(node.x, node.y, node.z, overlap_allowed=True)
-            for node in (obstacle.overlap_nodes or [])
-        ]
-
-        world_occupied = obstacle.get_placed_node_coordinates(local_occupied)
-        world_overlap = obstacle.get_placed_node_coordinates(local_overlap)
-
-        # Quantize to grid keys
-        def to_quantized_key(node: Node) -> tuple[float, float, float]:
-            return (
-                _quantize_coord(node.x, self.node_size),
-                _quantize_coord(node.y, self.node_size),
-                _quantize_coord(node.z, self.node_size),
-            )
-
-        occupied_keys = {to_quantized_key(node) for node in world_occupied}
-        overlap_keys = {to_quantized_key(node) for node in world_overlap}
+        grid = self.placement_grid
+        occupied_cells = self._placed_lattice_cells(
+            obstacle, obstacle.occupied_cells, obstacle.occupied_nodes
+        )
+        overlap_cells = self._placed_lattice_cells(
+            obstacle, obstacle.overlap_cells, obstacle.overlap_nodes
+        )
 
         # Boundary checks, occupied must be in-grid
-        for key in occupied_keys:
-            if key not in self.node_dict:
-                logger.debug("    Occupied node %s is outside grid.", key)
-                return False, (
-                    ObstaclePlacementFailureType.OUTSIDE_GRID,
-                    [key],
-                )
+        outside = occupied_cells[~grid.in_grid_at(occupied_cells)]
+        if len(outside):
+            key = grid.key(outside[0])
+            logger.debug("    Occupied node %s is outside grid.", key)
+            return False, (
+                ObstaclePlacementFailureType.OUTSIDE_GRID,
+                [key],
+            )
 
         # Collision checks
         # occupied ∩ occupied -> invalid
-        conflict = occupied_keys & self.occupied_positions
-        if conflict:
-            logger.debug(
-                "    Occupied vs occupied collision at %s", next(iter(conflict))
-            )
+        conflict = occupied_cells[grid.occupied_at(occupied_cells)]
+        if len(conflict):
+            keys = [grid.key(cell) for cell in np.unique(conflict, axis=0)]
+            logger.debug("    Occupied vs occupied collision at %s", keys[0])
             return False, (
                 ObstaclePlacementFailureType.OCCUPIED_VS_OCCUPIED,
-                list(conflict),
+                keys,
             )
 
         # occupied ∩ overlap -> invalid
-        conflict = occupied_keys & self.overlap_positions
-        if conflict:
-            logger.debug(
-                "    Occupied vs overlap collision at %s", next(iter(conflict))
-            )
+        conflict = occupied_cells[grid.overlap_at(occupied_cells)]
+        if len(conflict):
+            keys = [grid.key(cell) for cell in np.unique(conflict, axis=0)]
+            logger.debug("    Occupied vs overlap collision at %s", keys[0])
             return False, (
                 ObstaclePlacementFailureType.OCCUPIED_VS_OVERLAP,
-                list(conflict),
+                keys,
             )
 
         # overlap ∩ occupied -> invalid
-        conflict = overlap_keys & self.occupied_positions
-        if conflict:
-            logger.debug(
-                "    Overlap vs occupied collision at %s", next(iter(conflict))
-            )
+        conflict = overlap_cells[grid.occupied_at(overlap_cells)]
+        if len(conflict):
+            keys = [grid.key(cell) for cell in np.unique(conflict, axis=0)]
+            logger.debug("    Overlap vs occupied collision at %s", keys[0])
             return False, (
                 ObstaclePlacementFailureType.OVERLAP_VS_OCCUPIED,
-                list(conflict),
+                keys,
             )
 
         # overlap ∩ overlap -> allowed
         return True, None
 
+    def _placed_lattice_cells(
+        self, obstacle: Obstacle, cells: np.ndarray, nodes: Optional[list[Node]]
+    ) -> np.ndarray:
+        """
+        World lattice cells of an obstacle's local cells. Grid aligned poses use the
+        integer transform, any other pose quantizes the located nodes.
+        """
+        placed = obstacle.placed_cells(cells)
+        if placed is not None:
+            return placed
+
+        return lattice_offsets(
+            obstacle.get_placed_node_coordinates(nodes), self.node_size
+        )
+
     def _occupy_nodes_for_obstacle(self, obstacle: Obstacle):
         """Marks grid nodes as occupied based on the obstacle's placement."""
-        occ_local = [
-            Node(n.x, n.y, n.z, occupied=True) for n in (obstacle.occupied_nodes or [])
-        ]
-        occ_world = obstacle.get_placed_node_coordinates(occ_local)
-
-        for n in occ_world:
-            x = _quantize_coord(n.x, self.node_size)
-            y = _quantize_coord(n.y, self.node_size)
-            z = _quantize_coord(n.z, self.node_size)
-            key = (x, y, z)
-            node = self.node_dict.get(key)
-            if node:
-                node.occupied = True
-                node.is_obstacle_occupied = True
-                self.occupied_positions.add(key)
-
-        overlap_local = [
-            Node(n.x, n.y, n.z, overlap_allowed=True)
-            for n in (obstacle.overlap_nodes or [])
-        ]
-        overlap_world = obstacle.get_placed_node_coordinates(overlap_local)
-
-        for n in overlap_world:
-            x = _quantize_coord(n.x, self.node_size)
-            y = _quantize_coord(n.y, self.node_size)
-            z = _quantize_coord(n.z, self.node_size)
-            key = (x, y, z)
-            node = self.node_dict.get(key)
-            if node:
-                node.overlap_allowed = True
-                self.overlap_positions.add(key)
+        grid = self.placement_grid
+
+        occupied_cells = self._placed_lattice_cells(
+            obstacle, obstacle.occupied_cells, obstacle.occupied_nodes
+        )
+        occupied_cells = occupied_cells[grid.in_grid_at(occupied_cells)]
+        for cell in occupied_cells:
+            key = grid.key(cell)
+            node = self.node_dict[key]
+            node.occupied = True
+            node.is_obstacle_occupied = True
+            self.occupied_positions.add(key)
+        grid.mark_occupied(occupied_cells)
+
+        overlap_cells = self._placed_lattice_cells(
+            obstacle, obstacle.overlap_cells, obstacle.overlap_nodes
+        )
+        overlap_cells = overlap_cells[grid.in_grid_at(overlap_cells)]
+        for cell in overlap_cells:
+            key = grid.key(cell)
+            node = self.node_dict[key]
+            node.overlap_allowed = True
+            self.overlap_positions.add(key)
+        grid.mark_overlap(overlap_cells)
 
     def _assign_entry_exit_nodes(self, obstacle: Obstacle):
         """Find closest nodes to entry/exit and mark them (if obstacle provides such coords)."""
@@ -577,70 +559,6 @@ class ObstacleManager:
                 closest = node
         return closest
 
-    def _rotated_axis_margins(
-        self, obstacle: Obstacle
-    ) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
-        """
-        For the obstacle's *current rotation*, compute how far local overlap nodes extend from the
-        origin along -X/+X, -Y/+Y, -Z/+Z. Returns ((negX,posX), (negY,posY), (negZ,posZ)).
-        """
-        local_nodes: list[Node] = []
-        if obstacle.overlap_nodes:
-            local_nodes.extend(Node(n.x, n.y, n.z) for n in obstacle.overlap_nodes)
-
-        if not local_nodes:
-            return (0.0, 0.0), (0.0, 0.0), (0.0, 0.0)
-
-        # Apply current rotation (at this point obstacle hasn't been translated yet)
-        placed = obstacle.get_placed_node_coordinates(local_nodes)
-        xs = [n.x for n in placed]
-        ys = [n.y for n in placed]
-        zs = [n.z for n in placed]
-
-        # Distances outward from origin in +/- directions
-        posx, negx = (max(xs), -min(xs))
-        posy, negy = (max(ys), -min(ys))
-        posz, negz = (max(zs), -min(zs))
-
-        return (negx, posx), (negy, posy), (negz, posz)
-
-    def _interior_candidates(
-        self, obstacle: Obstacle, inset_nodes: int = 0
-    ) -> Tuple[list[Node], Tuple[float, float, float, float, float, float]]:
-        """
-        Build a candidate list of nodes strictly inside the grid bounds by the
-        rotation-aware margins (overlap nodes) plus an optional extra inset.
-        """
-        (negx, posx), (negy, posy), (negz, posz) = self._rotated_axis_margins(obstacle)
-        inset = inset_nodes * self.node_size
-
-        xmin = self.bounds["x"][0] + negx + inset
-        xmax = self.bounds["x"][1] - posx - inset
-        ymin = self.bounds["y"][0] + negy + inset
-        ymax = self.bounds["y"][1] - posy - inset
-        zmin = self.bounds["z"][0] + negz + inset
-        zmax = self.bounds["z"][1] - posz - inset
-
-        # Snap bounds that are numerically close to the grid to avoid tiny artifacts
-        xmin = _snap_near_grid(xmin, self.node_size)
-        xmax = _snap_near_grid(xmax, self.node_size)
-        ymin = _snap_near_grid(ymin, self.node_size)
-        ymax = _snap_near_grid(ymax, self.node_size)
-        zmin = _snap_near_grid(zmin, self.node_size)
-        zmax = _snap_near_grid(zmax, self.node_size)
-
-        # Filter nodes to those that keep all transformed nodes inside the grid
-        eps = self.node_size * 1e-6
-        candidates = [
-            n
-            for n in self.nodes
-            if (xmin - eps <= n.x <= xmax + eps)
-            and (ymin - eps <= n.y <= ymax + eps)
-            and (zmin - eps <= n.z <= zmax + eps)
-        ]
-        bounds = tuple(round(val, 6) for val in (xmin, xmax, ymin, ymax, zmin, zmax))
-        return candidates, bounds
-
     @staticmethod
     def _generate_24_xyz_orientations() -> List[Tuple[int, int, int]]:
         """
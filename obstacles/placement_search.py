@@ -0,0 +1,214 @@
+# obstacles/placement_search.py
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from puzzle.node import Node
+
+Angles = Tuple[int, int, int]
+
+
+def rotation_matrix(angle_x: float, angle_y: float, angle_z: float) -> np.ndarray:
+    """
+    Integer matrix of the extrinsic X -> Y -> Z rotation by multiples of 90°,
+    the rotation of `Rotation(angle_x, angle_y, angle_z, ordering=Extrinsic.XYZ)`.
+    """
+
+    def cos_sin(angle: float) -> Tuple[int, int]:
+        radians = math.radians(angle)
+        return round(math.cos(radians)), round(math.sin(radians))
+
+    c, s = cos_sin(angle_x)
+    rx = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+    c, s = cos_sin(angle_y)
+    ry = np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+    c, s = cos_sin(angle_z)
+    rz = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+
+def lattice_offsets(nodes: Optional[Iterable[Node]], node_size: float) -> np.ndarray:
+    """Node coordinates rounded to the lattice, as an (N, 3) int32 array."""
+    coords = [(node.x, node.y, node.z) for node in (nodes or [])]
+    if not coords:
+        return np.empty((0, 3), dtype=np.int32)
+    return np.rint(np.array(coords, dtype=float) / node_size).astype(np.int32)
+
+
+@dataclass(frozen=True)
+class OrientationMasks:
+    """Lattice offsets from the origin of an obstacle's nodes in one orientation."""
+
+    angles: Angles
+    occupied: np.ndarray
+    overlap: np.ndarray
+
+    @property
+    def margins(self) -> Tuple[np.ndarray, np.ndarray]:
+        """How far the overlap nodes reach along -X/-Y/-Z and +X/+Y/+Z."""
+        if len(self.overlap) == 0:
+            return np.zeros(3, dtype=int), np.zeros(3, dtype=int)
+        return -self.overlap.min(axis=0), self.overlap.max(axis=0)
+
+
+def orientation_masks(
+    occupied: np.ndarray, overlap: np.ndarray, orientations: Sequence[Angles]
+) -> list[OrientationMasks]:
+    """Rotate an obstacle's local occupied and overlap cells into every orientation."""
+    masks = []
+    for angles in orientations:
+        matrix = rotation_matrix(*angles)
+        masks.append(
+            OrientationMasks(
+                angles=tuple(angles),
+                occupied=occupied @ matrix.T,
+                overlap=overlap @ matrix.T,
+            )
+        )
+    return masks
+
+
+def distinct_orientations(
+    masks: Sequence[OrientationMasks], entry_exit: np.ndarray
+) -> list[OrientationMasks]:
+    """
+    Drop the orientations that occupy and overlap the same cells as an earlier one
+    and rotate the local `entry_exit` cells onto the same cells, in either order:
+    the path then just runs through the obstacle the other way.
+    """
+    distinct: dict[tuple[bytes, ...], OrientationMasks] = {}
+    for masks_of_orientation in masks:
+        rotation = rotation_matrix(*masks_of_orientation.angles)
+        key = (
+            np.unique(masks_of_orientation.occupied, axis=0).tobytes(),
+            np.unique(masks_of_orientation.overlap, axis=0).tobytes(),
+            np.unique(entry_exit @ rotation.T, axis=0).tobytes(),
+        )
+        distinct.setdefault(key, masks_of_orientation)
+    return list(distinct.values())
+
+
+def _any_hit(
+    state: np.ndarray, cells: np.ndarray, offsets: np.ndarray, outside: bool
+) -> np.ndarray:
+    """
+    Per cell, whether any of the `offsets` from it lands on a set cell of `state`,
+    the correlation of `state` with the offsets kernel at just these cells. Cells
+    beyond the array count as `outside`.
+    """
+    if len(offsets) == 0:
+        return np.zeros(len(cells), dtype=bool)
+
+    targets = cells[:, None, :] + offsets[None, :, :]
+    inside = np.all((targets >= 0) & (targets < state.shape), axis=2)
+    values = np.full(inside.shape, outside)
+    values[inside] = state[tuple(targets[inside].T)]
+    return values.any(axis=1)
+
+
+class PlacementGrid:
+    """
+    Dense lattice arrays of the puzzle nodes and the obstacle nodes claimed so far,
+    to validate all origins of an obstacle orientation in one pass.
+
+    Mirrors the rules of `ObstacleManager._is_placement_valid`: occupied nodes must
+    land on free in-grid lattice nodes, overlap nodes must not land on occupied ones.
+    """
+
+    def __init__(self, nodes: list[Node], node_size: float) -> None:
+        self.nodes = nodes
+        self.node_size = node_size
+
+        self.node_coords = np.array(
+            [(n.x, n.y, n.z) for n in nodes], dtype=float
+        ).reshape(-1, 3)
+        lattice = np.rint(self.node_coords / node_size)
+        extent = self.node_coords if nodes else np.zeros((1, 3))
+        self.bounds_min = extent.min(axis=0)
+        self.bounds_max = extent.max(axis=0)
+
+        corner = lattice if nodes else np.zeros((1, 3))
+        self.lattice_min = corner.min(axis=0).astype(int)
+        shape = tuple(corner.max(axis=0).astype(int) - self.lattice_min + 1)
+        self.node_cells = lattice.astype(int) - self.lattice_min
+
+        # Only nodes exactly on the lattice can be matched by quantized keys
+        self.node_on_lattice = np.all(lattice * node_size == self.node_coords, axis=1)
+        self.in_grid = np.zeros(shape, dtype=bool)
+        self.in_grid[tuple(self.node_cells[self.node_on_lattice].T)] = True
+        self.node_overlap_allowed = np.array(
+            [node.overlap_allowed for node in nodes], dtype=bool
+        )
+
+        self.occupied = np.zeros(shape, dtype=bool)
+        self.overlap = np.zeros(shape, dtype=bool)
+
+    def key(self, cell: np.ndarray) -> Tuple[float, float, float]:
+        """Quantized world coordinate of a lattice cell, as used for node keys."""
+        x, y, z = (int(value) * self.node_size for value in cell)
+        return x, y, z
+
+    def _state_at(self, state: np.ndarray, cells: np.ndarray) -> np.ndarray:
+        """State of each lattice cell, False beyond the array."""
+        index = cells - self.lattice_min
+        inside = np.all((index >= 0) & (index < state.shape), axis=1)
+        values = np.zeros(len(cells), dtype=bool)
+        values[inside] = state[tuple(index[inside].T)]
+        return values
+
+    def in_grid_at(self, cells: np.ndarray) -> np.ndarray:
+        return self._state_at(self.in_grid, cells)
+
+    def occupied_at(self, cells: np.ndarray) -> np.ndarray:
+        return self._state_at(self.occupied, cells)
+
+    def overlap_at(self, cells: np.ndarray) -> np.ndarray:
+        return self._state_at(self.overlap, cells)
+
+    def mark_occupied(self, cells: np.ndarray) -> None:
+        """Mark in-grid lattice cells as occupied by an obstacle."""
+        cells = cells[self.in_grid_at(cells)]
+        self.occupied[tuple((cells - self.lattice_min).T)] = True
+
+    def mark_overlap(self, cells: np.ndarray) -> None:
+        """Mark in-grid lattice cells as overlap nodes of an obstacle."""
+        cells = cells[self.in_grid_at(cells)]
+        self.overlap[tuple((cells - self.lattice_min).T)] = True
+
+    def valid_origins(self, masks: OrientationMasks) -> np.ndarray:
+        """
+        World coordinates, one row each, of all origins at which the obstacle can
+        be placed in the given orientation.
+
+        Origins are taken from the free nodes whose distance to the grid bounds fits
+        the rotated overlap nodes, as the random pool of `_try_place_one` was.
+        """
+        if not self.nodes:
+            return np.empty((0, 3))
+
+        # Free origin nodes, inset by the overlap margins
+        cells = tuple(self.node_cells.T)
+        claimed = self.node_on_lattice & (self.occupied[cells] | self.overlap[cells])
+        free = ~claimed & ~self.node_overlap_allowed
+        low, high = masks.margins
+        eps = self.node_size * 1e-6
+        lower = self.bounds_min + low * self.node_size - eps
+        upper = self.bounds_max - high * self.node_size + eps
+        inside = np.all(
+            (self.node_coords >= lower) & (self.node_coords <= upper), axis=1
+        )
+        origin_cells = np.unique(self.node_cells[free & inside], axis=0)
+        if len(origin_cells) == 0:
+            return np.empty((0, 3))
+
+        # Occupied nodes may only land on free in-grid nodes, beyond the array is
+        # outside the grid; overlap nodes only clash with occupied nodes
+        blocked = ~self.in_grid | self.occupied | self.overlap
+        conflicts = _any_hit(blocked, origin_cells, masks.occupied, outside=True)
+        conflicts |= _any_hit(self.occupied, origin_cells, masks.overlap, outside=False)
+
+        valid = origin_cells[~conflicts]
+        return (valid + self.lattice_min) * self.node_size
@@ -13,9 +13,10 @@ from ocp_vscode import Camera, set_defaults, show_object
 import config
 from cad.path_profile_type_shapes import (
     ACCENT_REGISTRY,
-    PROFILE_TYPE_FUNCTIONS,
     SUPPORT_REGISTRY,
     PathProfileType,
+    create_path_profile,
+    get_profile_sketch_cache,
 )
 
 
@@ -75,8 +76,7 @@ for idx, profile_type in enumerate(PathProfileType):
 
     # Main profile
     params_main, missing_main = get_params(profile_type)
-    profile_func = PROFILE_TYPE_FUNCTIONS[profile_type]
-    main_sketch = profile_func(**params_main, rotation_angle=-90)
+    main_sketch = create_path_profile(profile_type, params_main)
 
     sweep_single_section_profile(
         main_sketch,
@@ -89,8 +89,7 @@ for idx, profile_type in enumerate(PathProfileType):
     accent_type = ACCENT_REGISTRY.get(profile_type)
     if accent_type:
         params_acc, missing_acc = get_params(accent_type)
-        accent_func = PROFILE_TYPE_FUNCTIONS[accent_type]
-        accent_sk = accent_func(**params_acc, rotation_angle=-90)
+        accent_sk = create_path_profile(accent_type, params_acc)
 
         sweep_single_section_profile(
             accent_sk,
@@ -103,8 +102,7 @@ for idx, profile_type in enumerate(PathProfileType):
     support_type = SUPPORT_REGISTRY.get(profile_type)
     if support_type:
         params_sup, missing_sup = get_params(support_type)
-        support_func = PROFILE_TYPE_FUNCTIONS[support_type]
-        support_sk = support_func(**params_sup, rotation_angle=-90)
+        support_sk = create_path_profile(support_type, params_sup)
 
         sweep_single_section_profile(
             support_sk,
@@ -112,3 +110,5 @@ for idx, profile_type in enumerate(PathProfileType):
             label=f"{profile_type.value} - support",
             color=pick_colour(support_type, missing_sup),
         )
+
+get_profile_sketch_cache().log_stats()
@@ -2,7 +2,10 @@
 
 import math
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
 
 from puzzle.node import Node
 from puzzle.utils.geometry import key3, snap, squared_distance_xyz
@@ -10,6 +13,41 @@ from puzzle.utils.geometry import key3, snap, squared_distance_xyz
 Coordinate = Tuple[float, float, float]
 
 
+def _close_pairs(
+    points: Sequence[Sequence[float]],
+    reference: Sequence[Sequence[float]],
+    distance: float,
+) -> list[list[int]]:
+    """
+    For every point, the indices of the reference points strictly closer than
+    'distance', in ascending order.
+
+    A KD-tree over the reference points finds the candidates, the final check
+    uses the same squared distance sum as a plain loop so boundary cases match.
+    """
+    if not points or not reference or distance <= 0:
+        return [[] for _ in points]
+
+    tree = cKDTree(np.asarray(reference, dtype=np.float64))
+    # Widen the radius slightly, the exact comparison below does the filtering
+    candidates = tree.query_ball_point(
+        np.asarray(points, dtype=np.float64), r=distance * (1 + 1e-9) + 1e-12
+    )
+
+    distance_squared = distance * distance
+    close: list[list[int]] = []
+    for point, candidate_ids in zip(points, candidates):
+        close.append(
+            [
+                ref_id
+                for ref_id in sorted(candidate_ids)
+                if sum((a - b) * (a - b) for a, b in zip(point, reference[ref_id]))
+                < distance_squared
+            ]
+        )
+    return close
+
+
 class Casing(ABC):
     """Abstract base for a casing shape."""
 
@@ -17,6 +55,14 @@ class Casing(ABC):
     def contains_point(self, x: float, y: float, z: float) -> bool:
         pass
 
+    @abstractmethod
+    def contains_points(self, xyz: np.ndarray) -> np.ndarray:
+        """
+        Vectorized contains_point for an (N, 3) array of coordinates, returns a
+        boolean mask of length N.
+        """
+        pass
+
     @abstractmethod
     def get_mounting_waypoints(self, nodes: list[Node]) -> list[Node]:
         """Mark & return mounting waypoint nodes inside 'nodes'."""
@@ -35,18 +81,34 @@ class Casing(ABC):
     ) -> Tuple[list[Node], Dict[Coordinate, Node]]:
         """
         Generate a rectangular grid using explicit value lists, filtering with
-        this casing's contains_point().
+        this casing's contains_points().
+
+        The full grid is built as one coordinate array and masked in a single
+        pass, nodes are only created for the points inside the casing. Nodes are
+        ordered x, then y, then z, same as nested loops over the value lists.
         """
+        x_list, y_list, z_list = list(x_values), list(y_values), list(z_values)
+
+        grid = np.stack(
+            np.meshgrid(
+                np.asarray(x_list, dtype=np.float64),
+                np.asarray(y_list, dtype=np.float64),
+                np.asarray(z_list, dtype=np.float64),
+                indexing="ij",
+            ),
+            axis=-1,
+        )
+        inside = self.contains_points(grid.reshape(-1, 3)).reshape(grid.shape[:3])
+
         nodes: list[Node] = []
         node_dict: Dict[Coordinate, Node] = {}
 
-        for x in x_values:
-            for y in y_values:
-                for z in z_values:
-                    if self.contains_point(x, y, z):
-                        node = Node(x, y, z, in_rectangular_grid=True)
-                        nodes.append(node)
-                        node_dict[key3(x, y, z)] = node
+        # Index back into the value lists so nodes keep the original coordinate values
+        for i, j, k in zip(*(axis.tolist() for axis in np.nonzero(inside))):
+            x, y, z = x_list[i], y_list[j], z_list[k]
+            node = Node(x, y, z, in_rectangular_grid=True)
+            nodes.append(node)
+            node_dict[key3(x, y, z)] = node
 
         return nodes, node_dict
 
@@ -72,16 +134,15 @@ class Casing(ABC):
 
         Returns: list of all circular nodes added (ring + intersections).
         """
-        import math
-
         added_circular: list[Node] = []
         tol = tolerance if tolerance is not None else (grid_step or 0.0)
-        tol2 = tol * tol
 
-        def is_close_xy(ax: float, ay: float, bx: float, by: float) -> bool:
-            dx = ax - bx
-            dy = ay - by
-            return (dx * dx + dy * dy) < tol2
+        # Circular nodes per z plane, gathered once instead of scanning all
+        # nodes for every plane
+        circular_by_plane: Dict[float, list[Node]] = {}
+        for n in nodes:
+            if n.in_circular_grid:
+                circular_by_plane.setdefault(n.z, []).append(n)
 
         def add_new_circular_node(xf: float, yf: float, zf: float) -> Node:
             # Ring nodes, snapped
@@ -96,6 +157,7 @@ class Casing(ABC):
             node_dict[k] = new_node
 
             added_circular.append(new_node)
+            circular_by_plane.setdefault(zs, []).append(new_node)
             return new_node
 
         # Work per plane
@@ -134,26 +196,26 @@ class Casing(ABC):
                         for x_cand in x_opts:
                             candidate_xy.append((x_cand, y_val))
 
-            # Deduplicate intersection candidates among themselves by tolerance
-            unique_candidates: list[tuple[float, float]] = []
-            for coord in candidate_xy:
-                if any(
-                    is_close_xy(coord[0], coord[1], uc[0], uc[1])
-                    for uc in unique_candidates
-                ):
-                    continue
-                unique_candidates.append(coord)
-
-            # Build current plane circular set for conflict checks
-            plane_circular_now: list[Node] = [
-                n
-                for n in nodes
-                if (n.z == z_plane and n.in_circular_grid)
+            # Deduplicate intersection candidates among themselves by tolerance,
+            # a candidate is dropped when close to an earlier kept candidate
+            kept = [False] * len(candidate_xy)
+            for index, close_ids in enumerate(
+                _close_pairs(candidate_xy, candidate_xy, tol)
+            ):
+                kept[index] = not any(
+                    kept[other] for other in close_ids if other < index
+                )
+            unique_candidates = [
+                coord for coord, keep in zip(candidate_xy, kept) if keep
             ]
 
             # Withhold intersections that conflict with existing circulars on this plane
-            for cx, cy in unique_candidates:
-                if any(is_close_xy(cx, cy, n.x, n.y) for n in plane_circular_now):
+            plane_circular_xy = [
+                (n.x, n.y) for n in circular_by_plane.get(z_plane, [])
+            ]
+            conflicts = _close_pairs(unique_candidates, plane_circular_xy, tol)
+            for (cx, cy), conflict_ids in zip(unique_candidates, conflicts):
+                if conflict_ids:
                     continue
                 add_new_circular_node(cx, cy, z_plane)
 
@@ -171,28 +233,26 @@ class Casing(ABC):
         Remove non-circular nodes that lie within 'cutoff_distance' of any
         'reference_nodes'. Optionally limited to nodes on specific z planes.
         """
-        to_remove: list[Node] = []
-        cutoff_squared = cutoff_distance * cutoff_distance
-
-        for node in nodes:
-            if node.in_circular_grid:
-                continue
-            if z_planes is not None and node.z not in z_planes:
-                continue
-
-            for ref_node in reference_nodes:
-                dx = node.x - ref_node.x
-                dy = node.y - ref_node.y
-                dz = node.z - ref_node.z
-                if dx * dx + dy * dy + dz * dz < cutoff_squared:
-                    to_remove.append(node)
-                    break
+        candidates = [
+            node
+            for node in nodes
+            if not node.in_circular_grid
+            and (z_planes is None or node.z in z_planes)
+        ]
+        close = _close_pairs(
+            [(node.x, node.y, node.z) for node in candidates],
+            [(ref_node.x, ref_node.y, ref_node.z) for ref_node in reference_nodes],
+            cutoff_distance,
+        )
+        to_remove = [node for node, close_ids in zip(candidates, close) if close_ids]
 
         if not to_remove:
             return
 
+        # Remove in one pass over the node list
+        removed_ids = {id(node) for node in to_remove}
+        nodes[:] = [node for node in nodes if id(node) not in removed_ids]
         for node in to_remove:
-            nodes.remove(node)
             node_key = key3(node.x, node.y, node.z)
             if node_dict.get(node_key) is node:
                 del node_dict[node_key]
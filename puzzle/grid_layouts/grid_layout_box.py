@@ -2,6 +2,8 @@
 
 from typing import Dict, Tuple
 
+import numpy as np
+
 from config import Config
 from puzzle.node import Node
 from puzzle.utils.geometry import frange, squared_distance_xyz
@@ -36,6 +38,19 @@ class BoxCasing(Casing):
             and -effective_height <= z <= effective_height
         )
 
+    def contains_points(self, xyz: np.ndarray) -> np.ndarray:
+        effective_half_extents = np.array(
+            [
+                self.inner_half_width - self.node_size / 2,
+                self.inner_half_length - self.node_size / 2,
+                self.inner_half_height - self.node_size / 2,
+            ]
+        )
+
+        return np.all(
+            (-effective_half_extents <= xyz) & (xyz <= effective_half_extents), axis=1
+        )
+
     def get_mounting_waypoints(self, nodes: list[Node]) -> list[Node]:
         """
         Determine mounting waypoints for the box casing
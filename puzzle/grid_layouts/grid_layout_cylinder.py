@@ -3,6 +3,8 @@
 import math
 from typing import Dict, Tuple
 
+import numpy as np
+
 from config import Config
 from puzzle.node import Node
 from puzzle.utils.geometry import frange
@@ -35,6 +37,15 @@ class CylinderCasing(Casing):
             -self.inner_half_height <= z <= self.inner_half_height
         )
 
+    def contains_points(self, xyz: np.ndarray) -> np.ndarray:
+        square_half_diagonal = self.node_size / math.sqrt(2)
+        effective_radius = self.inner_radius - square_half_diagonal
+
+        x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        return ((x * x + y * y) <= effective_radius**2) & (
+            (-self.inner_half_height <= z) & (z <= self.inner_half_height)
+        )
+
     def get_mounting_waypoints(self, nodes: list[Node]) -> list[Node]:
         """
         Generic circular waypoint selection.
@@ -3,6 +3,8 @@
 import math
 from typing import Dict, Tuple
 
+import numpy as np
+
 from config import Config
 from puzzle.node import Node
 from puzzle.utils.geometry import frange
@@ -28,6 +30,13 @@ class SphereCasing(Casing):
 
         return x * x + y * y + z * z <= effective_radius**2
 
+    def contains_points(self, xyz: np.ndarray) -> np.ndarray:
+        cube_half_diagonal = (self.node_size * math.sqrt(3)) / 2.0
+        effective_radius = self.inner_radius - cube_half_diagonal
+
+        x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        return x * x + y * y + z * z <= effective_radius**2
+
     def get_mounting_waypoints(self, nodes: list[Node]) -> list[Node]:
         """
         Get mounting waypoints for the spherical casing.
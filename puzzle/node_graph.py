@@ -0,0 +1,164 @@
+# puzzle/node_graph.py
+
+import logging
+import time
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from logging_config import configure_logging
+from puzzle.node import Node
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+class NodeGraph:
+    """
+    Precomputed adjacency of the puzzle node grid in compressed sparse row (CSR) form.
+
+    Every node gets an integer id, its index in ``nodes``. The neighbours of node ``i``
+    are ``targets[offsets[i]:offsets[i + 1]]`` with the matching move ``costs``, in
+    the same order as returned by ``AStarPathFinder.get_neighbors``.
+
+    The graph only describes the grid topology. Occupancy, waypoint and obstacle
+    flags stay on the nodes, so the graph remains valid while paths are routed and
+    only has to be rebuilt when nodes are added or removed.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[Node],
+        offsets: np.ndarray,
+        targets: np.ndarray,
+        costs: np.ndarray,
+    ) -> None:
+        self.nodes: list[Node] = list(nodes)
+        self.node_ids: dict[Node, int] = {
+            node: node_id for node_id, node in enumerate(self.nodes)
+        }
+
+        self.offsets: np.ndarray = offsets
+        self.targets: np.ndarray = targets
+        self.costs: np.ndarray = costs
+
+        # Plain Python copies for the search loops, indexing numpy arrays one
+        # element at a time is considerably slower than list indexing.
+        self._offsets_list: list[int] = offsets.tolist()
+        self._targets_list: list[int] = targets.tolist()
+        self._costs_list: list[float] = costs.tolist()
+
+        # Reverse and undirected adjacency, derived on first use
+        self._predecessor_lists: Optional[list[list[int]]] = None
+        self._undirected_lists: Optional[list[list[int]]] = None
+        self._is_symmetric: Optional[bool] = None
+
+    @classmethod
+    def build(cls, puzzle: Any, path_finder: Any) -> "NodeGraph":
+        """
+        Build the graph for the current puzzle nodes using the path finder's
+        neighbour rules. Runs get_neighbors once per node.
+        """
+        start_time = time.perf_counter()
+
+        nodes = list(puzzle.nodes)
+        node_ids = {node: node_id for node_id, node in enumerate(nodes)}
+
+        offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        targets: list[int] = []
+        costs: list[float] = []
+
+        for node_id, node in enumerate(nodes):
+            for neighbor, move_cost in path_finder.get_neighbors(puzzle, node):
+                neighbor_id = node_ids.get(neighbor)
+                if neighbor_id is None:
+                    # Neighbour no longer part of the grid (pruned), skip the edge
+                    continue
+                targets.append(neighbor_id)
+                costs.append(move_cost)
+            offsets[node_id + 1] = len(targets)
+
+        graph = cls(
+            nodes,
+            offsets,
+            np.asarray(targets, dtype=np.int32),
+            np.asarray(costs, dtype=np.float64),
+        )
+
+        logger.debug(
+            "Built node graph with %d nodes and %d edges in %.3f s",
+            graph.node_count,
+            graph.edge_count,
+            time.perf_counter() - start_time,
+        )
+        return graph
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets_list)
+
+    def index_of(self, node: Node) -> int:
+        """Return the integer id of a node, raises KeyError for unknown nodes."""
+        return self.node_ids[node]
+
+    def neighbor_ids(self, node_id: int) -> Iterator[Tuple[int, float]]:
+        """Iterate (neighbor id, move cost) pairs for the given node id."""
+        start = self._offsets_list[node_id]
+        end = self._offsets_list[node_id + 1]
+        return zip(self._targets_list[start:end], self._costs_list[start:end])
+
+    def neighbors(self, node: Node) -> list[Tuple[Node, float]]:
+        """Return (neighbor, cost) tuples for a node, same format as get_neighbors."""
+        nodes = self.nodes
+        return [
+            (nodes[neighbor_id], move_cost)
+            for neighbor_id, move_cost in self.neighbor_ids(self.node_ids[node])
+        ]
+
+    def degrees(self) -> np.ndarray:
+        """Number of outgoing edges per node id."""
+        return np.diff(self.offsets)
+
+    def predecessor_ids(self, node_id: int) -> list[int]:
+        """Ids of nodes that have an edge towards the given node."""
+        if self._predecessor_lists is None:
+            predecessors: list[list[int]] = [[] for _ in range(self.node_count)]
+            for source_id in range(self.node_count):
+                for target_id, _ in self.neighbor_ids(source_id):
+                    predecessors[target_id].append(source_id)
+            self._predecessor_lists = predecessors
+        return self._predecessor_lists[node_id]
+
+    def undirected_neighbor_ids(self, node_id: int) -> list[int]:
+        """Ids of nodes connected to the given node by an edge in either direction."""
+        if self._undirected_lists is None:
+            undirected: list[list[int]] = []
+            for source_id in range(self.node_count):
+                linked = dict.fromkeys(
+                    target_id for target_id, _ in self.neighbor_ids(source_id)
+                )
+                linked.update(dict.fromkeys(self.predecessor_ids(source_id)))
+                linked.pop(source_id, None)
+                undirected.append(list(linked))
+            self._undirected_lists = undirected
+        return self._undirected_lists[node_id]
+
+    @property
+    def is_symmetric(self) -> bool:
+        """
+        True when every edge has a reverse edge. Neighbour rules are not symmetric
+        on every casing, e.g. cylinder rings only link back to the rectangular grid
+        along the primary axes.
+        """
+        if self._is_symmetric is None:
+            node_count = self.node_count
+            sources = np.repeat(np.arange(node_count, dtype=np.int64), self.degrees())
+            targets = self.targets.astype(np.int64)
+            forward = np.unique(sources * node_count + targets)
+            backward = np.unique(targets * node_count + sources)
+            self._is_symmetric = bool(np.array_equal(forward, backward))
+        return self._is_symmetric
@@ -1,13 +1,16 @@
 # puzzle/path_finder.py
 
-import heapq
 import logging
-from typing import Any, Optional, Set, Tuple
+from typing import Any, Optional, Tuple
 
 from cad.cases.case_model_base import CaseShape
+from config import Config
 from logging_config import configure_logging
 from puzzle.node import Node
+from puzzle.node_graph import NodeGraph
+from puzzle.path_query_cache import PathQueryCache
 from puzzle.utils.geometry import euclidean_distance, key3, manhattan_distance
+from puzzle.utils.indexed_heap import IndexedMinHeap
 
 configure_logging()
 logger = logging.getLogger(__name__)
@@ -15,12 +18,46 @@ logger = logging.getLogger(__name__)
 Coordinate = Tuple[float, float, float]
 
 
+class SearchState:
+    """
+    Reusable per-search arrays indexed by node id.
+
+    Entries are only valid when their stamp equals the current generation, starting
+    a new search increments the generation instead of resetting every node.
+    """
+
+    def __init__(self, node_graph: NodeGraph) -> None:
+        node_count = node_graph.node_count
+        self.node_graph: NodeGraph = node_graph
+        self.generation: int = 0
+        self.g_score: list[float] = [float("inf")] * node_count
+        self.parent: list[int] = [-1] * node_count
+        self.visited: list[int] = [0] * node_count  # generation g/parent were set
+        self.closed: list[int] = [0] * node_count  # generation node was expanded
+        self.open_set: IndexedMinHeap = IndexedMinHeap(node_count)
+
+    def begin(self) -> int:
+        """Start a new search and return its generation stamp."""
+        self.generation += 1
+        self.open_set.clear()
+        return self.generation
+
+
 class AStarPathFinder:
     """
     Finds paths between nodes in a puzzle grid using the A* algorithm.
-    Also provides neighbor generation for the puzzle grid.
+    Also provides neighbor generation for the puzzle grid, searches read the
+    neighbours from the puzzle's precomputed NodeGraph built from these rules.
     """
 
+    def __init__(self) -> None:
+        self._search_state: Optional[SearchState] = None
+        # Results of find_path queries made with an occupancy fingerprint
+        self.query_cache: PathQueryCache = PathQueryCache(
+            Config.Puzzle.PATH_QUERY_CACHE_SIZE
+        )
+        self._query_cache_graph: Optional[NodeGraph] = None
+
     def get_neighbors(
         self,
         puzzle: Any,
@@ -221,107 +258,186 @@ class AStarPathFinder:
         return neighbors
 
     def find_path(
-        self, start_node: Node, goal_node: Node, puzzle: Any
+        self,
+        start_node: Node,
+        goal_node: Node,
+        puzzle: Any,
+        occupancy_hash: Optional[int] = None,
     ) -> Optional[list[Node]]:
         """
         Implements the A* pathfinding algorithm to find the cheapest path between two nodes.
+
+        Search bookkeeping (g-scores, parents, closed flags) lives in per-search
+        arrays indexed by node id. A generation counter marks which entries belong
+        to the current search, so no per-node reset pass is needed between searches.
+
+        When the caller passes an occupancy_hash, results (including "no path") are
+        memoized per (start, goal, occupancy_hash). The caller is responsible for
+        the hash changing whenever occupied or waypoint flags change.
+        """
+        # Neighbours come from the puzzle's precomputed adjacency graph
+        node_graph = puzzle.node_graph
+        goal_id = node_graph.index_of(goal_node)
+
+        cache_key = None
+        if occupancy_hash is not None:
+            if self._query_cache_graph is not node_graph:
+                # Node ids are only meaningful for the graph they were cached with
+                self.query_cache.clear()
+                self._query_cache_graph = node_graph
+            cache_key = (node_graph.index_of(start_node), goal_id, occupancy_hash)
+            found, cached_path = self.query_cache.lookup(cache_key)
+            if found:
+                return cached_path
+
+        reached_id = self._search(
+            node_graph, start_node, {goal_id}, heuristic_goal=goal_node
+        )
+        if reached_id is None:
+            # If the open set becomes empty and the goal was not reached, no path exists
+            path = None
+        else:
+            path = self.reconstruct_path(node_graph, self._search_state, reached_id)
+
+        if cache_key is not None:
+            self.query_cache.store(cache_key, path)
+        return path
+
+    def find_path_to_nearest(
+        self, start_node: Node, goal_nodes: list[Node], puzzle: Any
+    ) -> Tuple[Optional[Node], Optional[list[Node]]]:
+        """
+        Multi-target Dijkstra search: expands from the start node until the first
+        of the goal nodes is settled, which is the goal with the lowest true path
+        cost. Replaces running a separate search per goal.
+
+        Returns (goal, path), or (None, None) when no goal is reachable.
         """
-        # Priority queue for nodes to visit, ordered by f-score (estimated total cost)
-        open_set: list[Tuple[float, Node]] = []
-        # Set of nodes already evaluated
-        closed_set: Set[Node] = set()
-
-        # Reset pathfinding attributes (g, h, f, parent) for all nodes before starting a new search
-        self.reset_nodes(puzzle.nodes)
-
-        # Initialize the start node's scores
-        start_node.g = 0.0  # Cost from start to start is 0
-        start_node.h = manhattan_distance(
-            start_node, goal_node
-        )  # Heuristic cost estimate
-        start_node.f = start_node.h  # Initial f-score
-        heapq.heappush(
-            open_set, (start_node.f, start_node)
-        )  # Add start node to the queue
-
-        # Main A* loop
+        if not goal_nodes:
+            return None, None
+
+        node_graph = puzzle.node_graph
+        goal_ids = {node_graph.index_of(goal_node) for goal_node in goal_nodes}
+
+        reached_id = self._search(node_graph, start_node, goal_ids)
+        if reached_id is None:
+            return None, None
+
+        path = self.reconstruct_path(node_graph, self._search_state, reached_id)
+        return node_graph.nodes[reached_id], path
+
+    def _search(
+        self,
+        node_graph: NodeGraph,
+        start_node: Node,
+        goal_ids: set[int],
+        heuristic_goal: Optional[Node] = None,
+    ) -> Optional[int]:
+        """
+        Shared best-first search loop. Runs A* towards heuristic_goal when given,
+        otherwise plain Dijkstra. Returns the id of the first goal popped from the
+        open set, parent links are left in the search state for reconstruction.
+        """
+        nodes = node_graph.nodes
+        state = self._get_search_state(node_graph)
+        generation = state.begin()
+
+        g_score = state.g_score
+        parent = state.parent
+        visited = state.visited
+        closed = state.closed
+        open_set = state.open_set
+
+        start_id = node_graph.index_of(start_node)
+
+        # Initialize the start node's scores, f-score equals the heuristic estimate
+        g_score[start_id] = 0.0
+        parent[start_id] = -1
+        visited[start_id] = generation
+        open_set.push(
+            start_id,
+            manhattan_distance(start_node, heuristic_goal) if heuristic_goal else 0.0,
+        )
+
+        # Main search loop
         while open_set:
             # Get the node with the lowest f-score from the priority queue
-            current_f, current_node = heapq.heappop(open_set)
+            current_id, _ = open_set.pop()
 
-            # If we reached the goal, reconstruct and return the path
-            if current_node == goal_node:
-                return self.reconstruct_path(current_node)
+            # If we reached a goal, the caller reconstructs the path
+            if current_id in goal_ids:
+                return current_id
 
             # Mark the current node as evaluated
-            closed_set.add(current_node)
+            closed[current_id] = generation
+            current_g = g_score[current_id]
 
             # Explore neighbors
-            neighbors_with_costs = self.get_neighbors(puzzle, current_node)
-            for neighbor, move_cost in neighbors_with_costs:
+            for neighbor_id, move_cost in node_graph.neighbor_ids(current_id):
                 # Skip neighbors that have already been evaluated
-                if neighbor in closed_set:
+                if closed[neighbor_id] == generation:
                     continue
 
-                # (Non) mounting waypoints can only be entered when they are the target goal.
-                # Ensures mounting waypoints are not visited on route, preserving the
-                # intended load-bearing distribution.
-                if neighbor.waypoint and neighbor != goal_node:
-                    continue
+                neighbor = nodes[neighbor_id]
+                if neighbor_id not in goal_ids:
+                    # (Non) mounting waypoints can only be entered when they are the target goal.
+                    # Ensures mounting waypoints are not visited on route, preserving the
+                    # intended load-bearing distribution.
+                    if neighbor.waypoint:
+                        continue
 
-                # Skip neighbors that are marked as occupied (part of a previous path),
-                # unless it's the goal node itself we are trying to reach.
-                if neighbor.occupied and neighbor != goal_node:
-                    continue
+                    # Skip neighbors that are marked as occupied (part of a previous path),
+                    # unless it's the goal node itself we are trying to reach.
+                    if neighbor.occupied:
+                        continue
 
                 # Calculate the tentative cost (g-score) to reach this neighbor from the start
-                tentative_g = current_node.g + move_cost
-
-                # If this path to the neighbor is better than any previously found path
-                if tentative_g < neighbor.g:
-                    # Update the neighbor's pathfinding attributes
-                    neighbor.parent = current_node  # Record the path
-                    neighbor.g = tentative_g  # Update cost from start
-                    neighbor.h = manhattan_distance(
-                        neighbor, goal_node
-                    )  # Recalculate heuristic
-                    neighbor.f = neighbor.g + neighbor.h  # Update total estimated cost
-
-                    # Add the neighbor to the open set for evaluation if it's not already there.
-                    # (A* implementations sometimes update existing entries, but adding duplicates
-                    # and letting the heapq prioritize is simpler and often sufficient).
-                    is_in_open_set = any(neighbor == item[1] for item in open_set)
-                    if not is_in_open_set:
-                        heapq.heappush(open_set, (neighbor.f, neighbor))
-
-        # If the open set becomes empty and the goal was not reached, no path exists
+                tentative_g = current_g + move_cost
+
+                # Only continue if this path to the neighbor is better than any previously found path
+                if (
+                    visited[neighbor_id] == generation
+                    and tentative_g >= g_score[neighbor_id]
+                ):
+                    continue
+
+                g_score[neighbor_id] = tentative_g
+                parent[neighbor_id] = current_id
+                visited[neighbor_id] = generation
+
+                # Queue the neighbor, or lower its f-score in place when already queued
+                f_score = tentative_g
+                if heuristic_goal is not None:
+                    f_score += manhattan_distance(neighbor, heuristic_goal)
+                open_set.push_or_decrease(neighbor_id, f_score)
+
         return None
 
-    def reconstruct_path(self, current_node: Node) -> list[Node]:
+    def reconstruct_path(
+        self, node_graph: NodeGraph, state: SearchState, node_id: int
+    ) -> list[Node]:
         """
         Reconstructs the path from the goal node back to the start node
-        by following the parent pointers.
+        by following the parent links of the last search.
         """
         path: list[Node] = []
+        parent = state.parent
         # Traverse backwards from the goal node using the parent links
-        while current_node:
-            path.append(current_node)
-            current_node = current_node.parent
+        while node_id >= 0:
+            path.append(node_graph.nodes[node_id])
+            node_id = parent[node_id]
         # The path is constructed backwards, so reverse it for the correct order
         path.reverse()
         return path
 
-    def reset_nodes(self, nodes: list[Node]) -> None:
-        """
-        Resets the pathfinding attributes (g, h, f, parent) of all nodes.
-        This is crucial before starting a new A* search to clear previous run data.
-        It does NOT reset the 'occupied' status.
-        """
-        for node in nodes:
-            node.g = float("inf")  # Cost from start
-            node.h = 0.0  # Heuristic cost to goal
-            node.f = float("inf")  # Total estimated cost
-            node.parent = None  # Path reconstruction link
+    def _get_search_state(self, node_graph: NodeGraph) -> SearchState:
+        """Return the search arrays for this graph, reallocating when the graph changed."""
+        if (
+            self._search_state is None
+            or self._search_state.node_graph is not node_graph
+        ):
+            self._search_state = SearchState(node_graph)
+        return self._search_state
 
     def occupy_path(self, path: list[Node]) -> None:
         """
@@ -0,0 +1,88 @@
+# puzzle/path_query_cache.py
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+from puzzle.node import Node
+
+
+class ZobristHash:
+    """
+    Incremental fingerprint of a set of node ids.
+
+    Every node id gets a random 64-bit key, the fingerprint is the XOR of the keys
+    of all ids in the set. Adding or removing an id is a single XOR, so the hash
+    follows occupancy changes without rehashing the grid.
+    """
+
+    def __init__(self, node_count: int, seed: int = 0) -> None:
+        rng = np.random.default_rng(seed)
+        self._keys: list[int] = rng.integers(
+            0, np.iinfo(np.uint64).max, size=node_count, dtype=np.uint64, endpoint=True
+        ).tolist()
+        self.value: int = 0
+
+    def toggle(self, node_id: int) -> None:
+        """Add the id to the fingerprint, or remove it when already included."""
+        self.value ^= self._keys[node_id]
+
+
+class PathQueryCache:
+    """
+    Least recently used cache of path query results.
+
+    Keys are (start id, goal id, occupancy fingerprint) tuples, values the found
+    path or None when no path exists, so failed queries are cached as well.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size: int = max_size
+        self._entries: OrderedDict[Hashable, Optional[Tuple[Node, ...]]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Optional[list[Node]]]:
+        """Return (found, path), a cached "no path" result is (True, None)."""
+        path = self._entries.get(key, self._MISSING)
+        if path is self._MISSING:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return True, None if path is None else list(path)
+
+    def store(self, key: Hashable, path: Optional[list[Node]]) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = None if path is None else tuple(path)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries, the counters keep accumulating."""
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        queries = self.hits + self.misses
+        return self.hits / queries if queries else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -15,6 +15,7 @@ from puzzle.grid_layouts.grid_layout_box import BoxCasing
 from puzzle.grid_layouts.grid_layout_cylinder import CylinderCasing
 from puzzle.grid_layouts.grid_layout_sphere import SphereCasing
 from puzzle.node import Node
+from puzzle.node_graph import NodeGraph
 from puzzle.path_finder import AStarPathFinder
 from puzzle.waypoint_connector import WaypointConnector
 from puzzle.utils.geometry import key3
@@ -73,11 +74,14 @@ class Puzzle:
         # lookups can jump straight to relevant circular nodes without scanning
         # the full node list.
         self._circular_nodes_by_plane: Optional[dict[int, list[Node]]] = None
+        # Precomputed adjacency graph, built once the node set is final
+        self._node_graph: Optional[NodeGraph] = None
 
         # Define mounting waypoints
         self.define_mounting_waypoints()
 
-        # Node neighbor connectivity sanity-check,
+        # Node neighbor connectivity sanity-check, leaves the adjacency graph that
+        # pathfinding reads neighbours from built for the final node set
         self._check_node_connectivity()
 
         # Populate puzzle with obstacles
@@ -124,6 +128,29 @@ class Puzzle:
         plane_index = self.get_circular_plane_level(z_value)
         return self.get_circular_nodes_by_plane().get(plane_index, [])
 
+    @property
+    def node_graph(self) -> NodeGraph:
+        """Return the adjacency graph of the current nodes, building it when needed."""
+
+        if self._node_graph is None:
+            self._node_graph = NodeGraph.build(self, self.path_finder)
+        return self._node_graph
+
+    def invalidate_node_graph(self) -> None:
+        """
+        Drop the adjacency graph and circular plane cache. Call whenever nodes
+        are added to or removed from the puzzle, the graph is rebuilt on next use.
+        """
+
+        self._node_graph = None
+        self._circular_nodes_by_plane = None
+
+    def rebuild_node_graph(self) -> NodeGraph:
+        """Invalidate and immediately rebuild the adjacency graph."""
+
+        self.invalidate_node_graph()
+        return self.node_graph
+
     def define_mounting_waypoints(self) -> None:
         """
         Defines mounting waypoints within the casing by delegating to the casing object.
@@ -483,34 +510,56 @@ class Puzzle:
         - Repeatedly remove all non-start nodes whose neighbour count <= 1.
         This prevents dead-ends in the grid.
         - Keep the start node even if it ends up with ≤1 neighbour; warn about it.
+
+        Runs as a k-core peel over the degree array of the adjacency graph. Only
+        nodes that linked to a removed node get their neighbours recomputed, as
+        the closest-node rules of circular grids may pick a replacement neighbour.
+        Each round removes the nodes that dropped to ≤1 neighbour in the previous
+        round, the node list is compacted once at the end.
         """
         max_report = 10
         total_pruned = 0
         iteration = 0
 
-        while True:
-            iteration += 1
-
-            # Compute neighbour counts for the current node set
-            degrees: dict[Node, int] = {}
-            for n in self.nodes:
-                neighbors = self.path_finder.get_neighbors(self, n)
-                degrees[n] = len(neighbors)
-
-            # Candidates: non-start nodes with <= 1 neighbour
-            to_prune: list[Node] = [
-                n for n, deg in degrees.items() if deg <= 1 and n is not self.start_node
-            ]
+        node_graph = self.node_graph
+        nodes = node_graph.nodes
+        node_ids = node_graph.node_ids
+        degrees: list[int] = node_graph.degrees().tolist()
+        removed = [False] * len(nodes)
+        start_id = node_ids.get(self.start_node, -1)
+
+        # Neighbour and predecessor sets, only materialised for nodes that change
+        neighbor_sets: dict[int, set[int]] = {}
+        predecessor_sets: dict[int, set[int]] = {}
+
+        def neighbor_set(node_id: int) -> set[int]:
+            if node_id not in neighbor_sets:
+                neighbor_sets[node_id] = {
+                    t for t, _ in node_graph.neighbor_ids(node_id)
+                }
+            return neighbor_sets[node_id]
+
+        def predecessor_set(node_id: int) -> set[int]:
+            if node_id not in predecessor_sets:
+                predecessor_sets[node_id] = set(node_graph.predecessor_ids(node_id))
+            return predecessor_sets[node_id]
+
+        # Candidates: non-start nodes with <= 1 neighbour
+        to_prune: list[int] = [
+            node_id
+            for node_id, degree in enumerate(degrees)
+            if degree <= 1 and node_id != start_id
+        ]
 
-            if not to_prune:
-                break
+        while to_prune:
+            iteration += 1
 
             logger.warning(
                 "Pruning %s node(s) with ≤1 neighbour [iteration %s]",
                 len(to_prune),
                 iteration,
             )
-            for n in to_prune[:max_report]:
+            for n in (nodes[node_id] for node_id in to_prune[:max_report]):
                 tags = []
                 if getattr(n, "mounting", False):
                     tags.append("mounting")
@@ -527,14 +576,56 @@ class Puzzle:
             if len(to_prune) > max_report:
                 logger.warning("    … and %s more", len(to_prune) - max_report)
 
-            # Remove from nodes and node_dict
-            for n in to_prune:
-                self.nodes.remove(n)
+            # Remove from node_dict and the circular plane lookup, the lookups
+            # get_neighbors reads from
+            circular_planes = self.get_circular_nodes_by_plane()
+            affected: set[int] = set()
+            for node_id in to_prune:
+                removed[node_id] = True
+                n = nodes[node_id]
                 k = key3(n.x, n.y, n.z)
                 if self.node_dict.get(k) is n:
                     del self.node_dict[k]
+                if n.in_circular_grid:
+                    circular_planes[self.get_circular_plane_level(n.z)].remove(n)
+                affected.update(predecessor_set(node_id))
+
+            # Recompute the neighbours of nodes that linked to a removed node
+            for node_id in affected:
+                if removed[node_id]:
+                    continue
+                old_neighbors = neighbor_set(node_id)
+                neighbor_list = [
+                    node_ids[neighbor]
+                    for neighbor, _ in self.path_finder.get_neighbors(
+                        self, nodes[node_id]
+                    )
+                    if neighbor in node_ids
+                ]
+                new_neighbors = set(neighbor_list)
+                for neighbor_id in new_neighbors - old_neighbors:
+                    predecessor_set(neighbor_id).add(node_id)
+                for neighbor_id in old_neighbors - new_neighbors:
+                    predecessor_set(neighbor_id).discard(node_id)
+                neighbor_sets[node_id] = new_neighbors
+                # Duplicate entries count, as in the degrees of the graph
+                degrees[node_id] = len(neighbor_list)
 
             total_pruned += len(to_prune)
+            to_prune = sorted(
+                node_id
+                for node_id in affected
+                if not removed[node_id]
+                and degrees[node_id] <= 1
+                and node_id != start_id
+            )
+
+        if total_pruned > 0:
+            # Compact the node list once and rebuild the graph on the final nodes
+            self.nodes[:] = [
+                n for node_id, n in enumerate(nodes) if not removed[node_id]
+            ]
+            self.rebuild_node_graph()
 
         # Start node special case: warn if it has no neighbour
         if (
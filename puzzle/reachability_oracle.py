@@ -0,0 +1,176 @@
+# puzzle/reachability_oracle.py
+
+from collections import deque
+from typing import Iterable
+
+from puzzle.node import Node
+from puzzle.node_graph import NodeGraph
+
+
+class ReachabilityOracle:
+    """
+    Answers "can a path still be routed from A to B" for the current occupancy
+    without running a path search per target.
+
+    Follows the same entry rule as the path finder: a route may only pass through
+    free nodes (neither occupied nor a waypoint), the target itself may be entered
+    regardless. The free subgraph is labelled with connected components (edges
+    taken in either direction), so a reachability check reduces to comparing the
+    component labels around source and target.
+
+    Labels mirror the node flags at the time of labelling. Callers that change
+    occupancy must report it through occupy() / release(), which only relabel the
+    affected region, or call refresh() for a full pass. Reported changes are
+    batched and relabelled together on the next query.
+
+    On graphs with one-way edges components are only a necessary condition, a
+    positive answer is then confirmed with a single directed sweep from the source.
+    """
+
+    def __init__(self, node_graph: NodeGraph) -> None:
+        self.node_graph: NodeGraph = node_graph
+        # Component label per node id, -1 for nodes outside the free subgraph
+        self._labels: list[int] = [-1] * node_graph.node_count
+        self._next_label: int = 0
+        # Seeds of regions to relabel before the next query
+        self._pending_seeds: list[int] = []
+        self.refresh()
+
+    def _is_free(self, node: Node) -> bool:
+        return not node.occupied and not node.waypoint
+
+    def refresh(self) -> None:
+        """Relabel the whole free subgraph from the current node flags."""
+        nodes = self.node_graph.nodes
+        self._labels = [-1] * len(nodes)
+        self._pending_seeds = []
+        self._label_regions(
+            node_id for node_id, node in enumerate(nodes) if self._is_free(node)
+        )
+
+    def occupy(self, nodes: Iterable[Node]) -> None:
+        """
+        Update labels after the given nodes were marked occupied. Only the
+        components that contained them are relabelled, they may have split.
+        """
+        node_graph = self.node_graph
+        labels = self._labels
+        seeds = self._pending_seeds
+        for node in nodes:
+            node_id = node_graph.index_of(node)
+            if labels[node_id] < 0:
+                continue
+            labels[node_id] = -1
+            seeds.extend(node_graph.undirected_neighbor_ids(node_id))
+
+    def release(self, nodes: Iterable[Node]) -> None:
+        """
+        Update labels after the given nodes were freed again. Components touching
+        them are merged into one relabelled region.
+        """
+        node_graph = self.node_graph
+        labels = self._labels
+        seeds = self._pending_seeds
+        for node in nodes:
+            node_id = node_graph.index_of(node)
+            if labels[node_id] < 0 and self._is_free(node):
+                seeds.append(node_id)
+
+    def _flush(self) -> None:
+        """
+        Relabel the regions around all reported changes in one pass. Every region
+        that split or merged contains at least one seed, untouched regions keep
+        their labels.
+        """
+        if self._pending_seeds:
+            seeds = self._pending_seeds
+            self._pending_seeds = []
+            self._label_regions(seeds)
+
+    def _label_regions(self, seed_ids: Iterable[int]) -> None:
+        """Flood fill fresh component labels from every seed not labelled in this pass."""
+        node_graph = self.node_graph
+        nodes = node_graph.nodes
+        labels = self._labels
+        first_new_label = self._next_label
+
+        for seed_id in seed_ids:
+            if labels[seed_id] >= first_new_label:
+                continue  # already covered by an earlier seed of this pass
+            if not self._is_free(nodes[seed_id]):
+                continue
+
+            label = self._next_label
+            self._next_label += 1
+            labels[seed_id] = label
+            queue = deque([seed_id])
+            while queue:
+                current_id = queue.popleft()
+                for neighbor_id in node_graph.undirected_neighbor_ids(current_id):
+                    if labels[neighbor_id] >= first_new_label:
+                        continue
+                    if not self._is_free(nodes[neighbor_id]):
+                        continue
+                    labels[neighbor_id] = label
+                    queue.append(neighbor_id)
+
+    def unreachable_targets(self, source: Node, targets: Iterable[Node]) -> list[Node]:
+        """Return the targets that cannot be reached from source, in input order."""
+        targets = list(targets)
+        self._flush()
+        node_graph = self.node_graph
+        labels = self._labels
+        source_id = node_graph.index_of(source)
+
+        direct_ids: set[int] = set()
+        source_labels: set[int] = set()
+        for neighbor_id, _ in node_graph.neighbor_ids(source_id):
+            direct_ids.add(neighbor_id)
+            if labels[neighbor_id] >= 0:
+                source_labels.add(labels[neighbor_id])
+
+        unreachable: list[Node] = []
+        maybe_reachable: list[Node] = []
+        for target in targets:
+            target_id = node_graph.index_of(target)
+            if target_id in direct_ids:
+                continue
+            if any(
+                labels[predecessor_id] in source_labels
+                for predecessor_id in node_graph.predecessor_ids(target_id)
+                if labels[predecessor_id] >= 0
+            ):
+                maybe_reachable.append(target)
+            else:
+                unreachable.append(target)
+
+        if maybe_reachable and not node_graph.is_symmetric:
+            reached = self._directed_sweep(source_id, maybe_reachable)
+            unreachable.extend(t for t in maybe_reachable if t not in reached)
+            # Keep input order for callers that report the first failure
+            order = {node: index for index, node in enumerate(targets)}
+            unreachable.sort(key=lambda node: order[node])
+
+        return unreachable
+
+    def is_reachable(self, source: Node, target: Node) -> bool:
+        return not self.unreachable_targets(source, [target])
+
+    def _directed_sweep(self, source_id: int, targets: list[Node]) -> set[Node]:
+        """Breadth-first sweep along edge direction, returns the targets it enters."""
+        node_graph = self.node_graph
+        nodes = node_graph.nodes
+        target_ids = {node_graph.index_of(target) for target in targets}
+        reached: set[Node] = set()
+        seen = {source_id}
+        queue = deque([source_id])
+        while queue and len(reached) < len(target_ids):
+            current_id = queue.popleft()
+            for neighbor_id, _ in node_graph.neighbor_ids(current_id):
+                if neighbor_id in target_ids:
+                    reached.add(nodes[neighbor_id])
+                if neighbor_id in seen or not self._is_free(nodes[neighbor_id]):
+                    continue
+                seen.add(neighbor_id)
+                queue.append(neighbor_id)
+        return reached
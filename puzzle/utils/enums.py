@@ -35,6 +35,28 @@ class PathSegmentDesignStrategy(Enum):
     OBSTACLE = "obstacle"
 
 
+class PathProfileType(Enum):
+    """
+    Enumeration representing the different types of path profiles.
+    """
+
+    L_SHAPE = "l_shape"
+    L_SHAPE_ADJUSTED_HEIGHT = "l_shape_adjusted_height"
+    L_SHAPE_PATH_COLOR = "l_shape_path_color"
+    L_SHAPE_MIRRORED = "l_shape_mirrored"
+    L_SHAPE_MIRRORED_ADJUSTED_HEIGHT = "l_shape_mirrored_adjusted_height"
+    L_SHAPE_MIRRORED_PATH_COLOR = "l_shape_mirrored_path_color"
+    O_SHAPE = "o_shape"
+    O_SHAPE_SUPPORT = "o_shape_support"
+    U_SHAPE = "u_shape"
+    U_SHAPE_ADJUSTED_HEIGHT = "u_shape_adjusted_height"
+    U_SHAPE_PATH_COLOR = "u_shape_path_color"
+    V_SHAPE = "v_shape"
+    V_SHAPE_PATH_COLOR = "v_shape_path_color"
+    SQUARE_CLOSED_SHAPE = "square_closed_shape"
+    SQUARE_WITH_HOLE_SHAPE = "square_with_hole_shape"
+
+
 class PathCurveType(Enum):
     """
     Enumeration representing the different types of path curves.
@@ -0,0 +1,140 @@
+# puzzle/utils/indexed_heap.py
+
+from typing import Tuple
+
+
+class IndexedMinHeap:
+    """
+    Binary min-heap over integer items in range [0, capacity) with a true
+    decrease-key operation.
+
+    Every item can be in the heap at most once. A position table maps items to
+    their heap slot, so membership tests and key updates are O(1) / O(log n)
+    instead of scanning the heap. Equal keys are ordered by item id, which keeps
+    pop order deterministic.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._items: list[int] = []
+        self._keys: list[float] = []
+        # Heap slot per item, -1 when the item is not in the heap
+        self._position: list[int] = [-1] * capacity
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, item: int) -> bool:
+        return self._position[item] >= 0
+
+    def clear(self) -> None:
+        """Empty the heap. Costs O(len(heap)), not O(capacity)."""
+        for item in self._items:
+            self._position[item] = -1
+        self._items.clear()
+        self._keys.clear()
+
+    def key(self, item: int) -> float:
+        """Return the current key of an item that is in the heap."""
+        return self._keys[self._position[item]]
+
+    def push(self, item: int, key: float) -> None:
+        """Insert an item that is not yet in the heap."""
+        slot = len(self._items)
+        self._items.append(item)
+        self._keys.append(key)
+        self._position[item] = slot
+        self._sift_up(slot)
+
+    def decrease_key(self, item: int, key: float) -> None:
+        """Lower the key of an item already in the heap."""
+        slot = self._position[item]
+        self._keys[slot] = key
+        self._sift_up(slot)
+
+    def push_or_decrease(self, item: int, key: float) -> None:
+        """Insert the item, or lower its key when it is already queued with a larger one."""
+        slot = self._position[item]
+        if slot < 0:
+            self.push(item, key)
+        elif key < self._keys[slot]:
+            self.decrease_key(item, key)
+
+    def pop(self) -> Tuple[int, float]:
+        """Remove and return the (item, key) pair with the smallest key."""
+        items = self._items
+        keys = self._keys
+        top_item = items[0]
+        top_key = keys[0]
+        self._position[top_item] = -1
+
+        last_item = items.pop()
+        last_key = keys.pop()
+        if items:
+            items[0] = last_item
+            keys[0] = last_key
+            self._position[last_item] = 0
+            self._sift_down(0)
+
+        return top_item, top_key
+
+    def _sift_up(self, slot: int) -> None:
+        items = self._items
+        keys = self._keys
+        position = self._position
+        item = items[slot]
+        key = keys[slot]
+
+        while slot > 0:
+            parent_slot = (slot - 1) >> 1
+            parent_key = keys[parent_slot]
+            parent_item = items[parent_slot]
+            if parent_key < key or (parent_key == key and parent_item < item):
+                break
+            items[slot] = parent_item
+            keys[slot] = parent_key
+            position[parent_item] = slot
+            slot = parent_slot
+
+        items[slot] = item
+        keys[slot] = key
+        position[item] = slot
+
+    def _sift_down(self, slot: int) -> None:
+        items = self._items
+        keys = self._keys
+        position = self._position
+        size = len(items)
+        item = items[slot]
+        key = keys[slot]
+
+        while True:
+            child_slot = 2 * slot + 1
+            if child_slot >= size:
+                break
+
+            # Pick the smaller of both children
+            right_slot = child_slot + 1
+            if right_slot < size:
+                left_key = keys[child_slot]
+                right_key = keys[right_slot]
+                if right_key < left_key or (
+                    right_key == left_key and items[right_slot] < items[child_slot]
+                ):
+                    child_slot = right_slot
+
+            child_key = keys[child_slot]
+            child_item = items[child_slot]
+            if key < child_key or (key == child_key and item < child_item):
+                break
+
+            items[slot] = child_item
+            keys[slot] = child_key
+            position[child_item] = slot
+            slot = child_slot
+
+        items[slot] = item
+        keys[slot] = key
+        position[item] = slot
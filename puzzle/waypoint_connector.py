@@ -1,32 +1,157 @@
 # puzzle/waypoint_connector.py
 
 import logging
-from dataclasses import dataclass, field
+import multiprocessing
+import multiprocessing.synchronize
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from typing import Any, Optional, Set, Tuple
 
+import numpy as np
+
+from config import Config
 from logging_config import configure_logging
 from puzzle.node import Node
+from puzzle.node_graph import NodeGraph
 from puzzle.path_finder import AStarPathFinder
+from puzzle.path_query_cache import ZobristHash
+from puzzle.reachability_oracle import ReachabilityOracle
 from puzzle.utils.geometry import euclidean_distance
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# Shared with the worker processes of the parallel backtracking search, set once
+# a preferred branch found a path so the branches still running stop
+_branch_stop_event: Optional[multiprocessing.synchronize.Event] = None
+
 
 @dataclass
 class BacktrackingState:
-    """State for backtracking search through waypoint orderings."""
+    """
+    State for backtracking search through waypoint orderings.
+
+    Occupancy is not copied per state, a state only records the node ids it
+    occupied on top of its parent state (occupied_delta).
+    """
 
     current_node: Node
     remaining_mounting: list[Node]
     remaining_non_mounting: list[Node]
     path: list[Node]
-    occupied_nodes: set[Node] = field(default_factory=set)
+    parent: Optional["BacktrackingState"] = None
+    depth: int = 0
+    occupied_delta: tuple[int, ...] = ()
     visited_waypoints: set[Node] = field(default_factory=set)
     last_visited_was_mounting: bool = False
     non_mounting_count_since_last_mount: int = 0
 
 
+@dataclass
+class BacktrackingSnapshot:
+    """
+    Picklable input of one parallel backtracking branch. Carries the grid with the
+    branch's occupancy applied and stands in for the puzzle inside the worker.
+    """
+
+    node_graph: NodeGraph
+    root: BacktrackingState
+    entry_to_exit: dict[Node, Node]
+    target_non_mounting_per_gap: float
+    max_depth: int
+
+
+class OccupancyUndoLog:
+    """
+    Occupancy of the backtracking search as a bool array indexed by node id.
+
+    Switching to another state undoes the deltas of the applied states up to the
+    common ancestor and applies the deltas down to the target state, so restoring
+    a state costs O(delta) instead of a walk over the whole grid. Node flags, the
+    Zobrist fingerprint and the optional reachability oracle are kept in sync with
+    the array.
+    """
+
+    def __init__(
+        self,
+        node_graph: NodeGraph,
+        root: BacktrackingState,
+        oracle: Optional[ReachabilityOracle] = None,
+    ) -> None:
+        self.node_graph: NodeGraph = node_graph
+        self.oracle: Optional[ReachabilityOracle] = oracle
+        self.occupied: np.ndarray = np.zeros(node_graph.node_count, dtype=bool)
+        self.fingerprint: ZobristHash = ZobristHash(node_graph.node_count)
+        self.current: BacktrackingState = root
+        self._apply(root)
+        if oracle is not None:
+            oracle.refresh()
+
+    def is_occupied(self, node: Node) -> bool:
+        return bool(self.occupied[self.node_graph.index_of(node)])
+
+    def new_delta(self, nodes: list[Node]) -> tuple[int, ...]:
+        """Node ids of the given nodes that the current state does not occupy yet."""
+        node_ids = dict.fromkeys(self.node_graph.index_of(node) for node in nodes)
+        occupied = self.occupied
+        return tuple(node_id for node_id in node_ids if not occupied[node_id])
+
+    def switch_to(self, state: BacktrackingState) -> None:
+        """Restore the occupancy of the given state."""
+        undone: list[Node] = []
+        applied_chain: list[BacktrackingState] = []
+
+        current = self.current
+        target = state
+        while current.depth > target.depth:
+            undone.extend(self._undo(current))
+            current = current.parent
+        while target.depth > current.depth:
+            applied_chain.append(target)
+            target = target.parent
+        while current is not target:
+            undone.extend(self._undo(current))
+            current = current.parent
+            applied_chain.append(target)
+            target = target.parent
+
+        if undone and self.oracle is not None:
+            self.oracle.release(undone)
+
+        applied: list[Node] = []
+        for applied_state in reversed(applied_chain):
+            applied.extend(self._apply(applied_state))
+        if applied and self.oracle is not None:
+            self.oracle.occupy(applied)
+
+        self.current = state
+
+    def _apply(self, state: BacktrackingState) -> list[Node]:
+        nodes = self.node_graph.nodes
+        applied = []
+        for node_id in state.occupied_delta:
+            self.occupied[node_id] = True
+            self.fingerprint.toggle(node_id)
+            node = nodes[node_id]
+            node.occupied = True
+            applied.append(node)
+        return applied
+
+    def _undo(self, state: BacktrackingState) -> list[Node]:
+        nodes = self.node_graph.nodes
+        undone = []
+        for node_id in state.occupied_delta:
+            self.occupied[node_id] = False
+            self.fingerprint.toggle(node_id)
+            node = nodes[node_id]
+            # Preserve obstacle-occupied nodes
+            if not node.is_obstacle_occupied:
+                node.occupied = False
+                undone.append(node)
+        return undone
+
+
 class WaypointConnector:
     """
     Connects waypoints in a puzzle using a hybrid greedy + backtracking strategy.
@@ -45,60 +170,51 @@ class WaypointConnector:
         """
         Finds the shortest path from the current node to the closest reachable
         candidate waypoint from the provided list.
-        """
-        # Pre-sort by Euclidean distance as a heuristic; A* still finds the true shortest path
-        candidates.sort(key=lambda node: euclidean_distance(current_node, node))
-
-        for candidate in candidates:
-            path_segment = self._path_finder.find_path(current_node, candidate, puzzle)
-
-            if path_segment:
-                return candidate, path_segment
-
-        # If no path was found to any candidate
-        return None, None
 
-    def _is_waypoint_reachable(
-        self, from_node: Node, target: Node, puzzle: Any
-    ) -> bool:
-        """
-        Quick check to determine if a waypoint is reachable from the current node.
-        Uses A* but returns early once reachability is confirmed.
+        A single multi-target search settles the candidate with the lowest true
+        path cost, instead of trying a full search per candidate.
         """
-        path = self._path_finder.find_path(from_node, target, puzzle)
-        return path is not None
+        return self._path_finder.find_path_to_nearest(current_node, candidates, puzzle)
 
     def _check_mounting_waypoints_reachable(
         self,
         from_node: Node,
         remaining_mounting: list[Node],
-        puzzle: Any,
+        oracle: ReachabilityOracle,
     ) -> bool:
         """
         Checks if all remaining mounting waypoints are still reachable from the
         current position. Used for pruning in backtracking search.
+
+        Answered by the reachability oracle's component labels, the oracle must
+        reflect the occupancy to check against.
         """
-        for waypoint in remaining_mounting:
-            if not self._is_waypoint_reachable(from_node, waypoint, puzzle):
-                logger.debug(
-                    "Pruning: Mounting waypoint at (%.1f, %.1f, %.1f) is unreachable from (%.1f, %.1f, %.1f)",
-                    waypoint.x,
-                    waypoint.y,
-                    waypoint.z,
-                    from_node.x,
-                    from_node.y,
-                    from_node.z,
-                )
-                return False
+        unreachable = oracle.unreachable_targets(from_node, remaining_mounting)
+        if unreachable:
+            waypoint = unreachable[0]
+            logger.debug(
+                "Pruning: Mounting waypoint at (%.1f, %.1f, %.1f) is unreachable from (%.1f, %.1f, %.1f)",
+                waypoint.x,
+                waypoint.y,
+                waypoint.z,
+                from_node.x,
+                from_node.y,
+                from_node.z,
+            )
+            return False
         return True
 
-    def _clear_occupied_nodes(self, nodes: set[Node]) -> None:
-        """
-        Clears the occupied status of the provided nodes.
-        Used when backtracking to restore the grid state.
-        """
-        for node in nodes:
-            node.occupied = False
+    def _log_query_cache_stats(self) -> None:
+        stats = self._path_finder.query_cache.stats()
+        logger.info(
+            "Path query cache: %d hits, %d misses (%.1f%% hit rate), %d evictions, %d/%d entries",
+            stats["hits"],
+            stats["misses"],
+            stats["hit_rate"] * 100.0,
+            stats["evictions"],
+            stats["size"],
+            stats["max_size"],
+        )
 
     def _get_next_waypoint_preference(
         self,
@@ -146,6 +262,8 @@ class WaypointConnector:
 
         Uses depth-first search with pruning based on mounting waypoint reachability.
         Respects distribution preferences but explores alternatives when needed.
+        With Config.Puzzle.BACKTRACKING_WORKERS above 1 the top of the search tree
+        is split across worker processes.
         """
         logger.info(
             "Starting backtracking search with %d mounting and %d non-mounting waypoints remaining",
@@ -153,19 +271,59 @@ class WaypointConnector:
             len(initial_state.remaining_non_mounting),
         )
 
+        workers = Config.Puzzle.BACKTRACKING_WORKERS
+        if workers > 1:
+            return self._connect_waypoints_backtracking_parallel(
+                puzzle,
+                initial_state,
+                entry_to_exit,
+                target_non_mounting_per_gap,
+                max_depth,
+                workers,
+            )
+
+        return self._search_waypoint_orderings(
+            puzzle,
+            initial_state,
+            entry_to_exit,
+            target_non_mounting_per_gap,
+            max_depth,
+        )
+
+    def _search_waypoint_orderings(
+        self,
+        puzzle: Any,
+        initial_state: BacktrackingState,
+        entry_to_exit: dict[Node, Node],
+        target_non_mounting_per_gap: float,
+        max_depth: int,
+        max_iterations: int = 10000,  # Safety limit to prevent infinite loops
+        stop_event: Optional[multiprocessing.synchronize.Event] = None,
+    ) -> Optional[list[Node]]:
+        """
+        Depth-first search below initial_state, returns the first complete path.
+        Gives up without a path once stop_event is set.
+        """
         # Stack for DFS: each entry is a BacktrackingState
-        stack: list[tuple[BacktrackingState, int]] = [(initial_state, 0)]
+        stack: list[BacktrackingState] = [initial_state]
+        # Component labels of the free grid, used to prune unreachable branches
+        node_graph = puzzle.node_graph
+        oracle = ReachabilityOracle(node_graph)
+        occupancy = OccupancyUndoLog(node_graph, initial_state, oracle)
         iterations = 0
-        max_iterations = 10000  # Safety limit to prevent infinite loops
 
         while stack and iterations < max_iterations:
             iterations += 1
-            state, depth = stack.pop()
+            if stop_event is not None and stop_event.is_set():
+                logger.info(
+                    "Backtracking search stopped after %d iterations", iterations
+                )
+                return None
+            state = stack.pop()
+            depth = state.depth
 
             if depth > max_depth:
                 logger.debug("Max depth %d reached, backtracking", max_depth)
-                # Clear occupied nodes from this branch
-                self._clear_occupied_nodes(state.occupied_nodes)
                 continue
 
             # Check if we've visited all waypoints
@@ -175,188 +333,330 @@ class WaypointConnector:
                     iterations,
                     depth,
                 )
+                self._log_query_cache_stats()
                 return state.path
 
-            # Restore the occupied state for this branch
-            # First clear any nodes that shouldn't be occupied (preserve obstacle-occupied nodes)
-            for node in puzzle.nodes:
-                if node.occupied and not node.is_obstacle_occupied and node not in state.occupied_nodes and node not in state.path:
-                    node.occupied = False
-            # Then mark the nodes from this state as occupied
-            for node in state.occupied_nodes:
-                node.occupied = True
-
-            # Determine preferred waypoint type based on distribution
-            prefer_mounting = self._get_next_waypoint_preference(
-                state.remaining_mounting,
-                state.remaining_non_mounting,
-                state.last_visited_was_mounting,
-                state.non_mounting_count_since_last_mount,
-                target_non_mounting_per_gap,
+            # Restore the occupied state for this branch, only the nodes that
+            # differ from the previously explored state are touched
+            occupancy.switch_to(state)
+
+            stack.extend(
+                self._expand_backtracking_state(
+                    puzzle,
+                    state,
+                    occupancy,
+                    oracle,
+                    entry_to_exit,
+                    target_non_mounting_per_gap,
+                )
             )
 
-            # Build candidate list: preferred type first, then alternative
-            if prefer_mounting:
-                candidates = list(state.remaining_mounting) + list(
-                    state.remaining_non_mounting
-                )
-            else:
-                candidates = list(state.remaining_non_mounting) + list(
-                    state.remaining_mounting
-                )
+        self._log_query_cache_stats()
 
-            # Sort each group by distance (closest first within each group)
-            mounting_sorted = sorted(
-                [c for c in candidates if c.mounting],
-                key=lambda n: euclidean_distance(state.current_node, n),
+        if iterations >= max_iterations:
+            logger.warning(
+                "Backtracking search reached max iterations (%d) without finding solution",
+                max_iterations,
             )
-            non_mounting_sorted = sorted(
-                [c for c in candidates if not c.mounting],
-                key=lambda n: euclidean_distance(state.current_node, n),
+        else:
+            logger.warning(
+                "Backtracking search exhausted all possibilities after %d iterations",
+                iterations,
             )
 
-            # Rebuild candidates with distance ordering within preference groups
-            if prefer_mounting:
-                ordered_candidates = mounting_sorted + non_mounting_sorted
-            else:
-                ordered_candidates = non_mounting_sorted + mounting_sorted
-
-            # Try each candidate. Iterate in reverse because branches are pushed
-            # onto a LIFO stack: pushing the least preferred candidate first means
-            # the most preferred candidate is popped and explored first.
-            found_valid_successor = False
-            for candidate in reversed(ordered_candidates):
-                # Attempt to find path to this candidate
-                path_segment = self._path_finder.find_path(state.current_node, candidate, puzzle)
-
-                if not path_segment:
-                    logger.debug(
-                        "Backtracking: No path to candidate at (%.1f, %.1f, %.1f)",
-                        candidate.x,
-                        candidate.y,
-                        candidate.z,
-                    )
-                    continue
+        return None
 
-                # Create new state for this branch
-                new_occupied = state.occupied_nodes.copy()
-                for node in path_segment[1:]:
-                    new_occupied.add(node)
+    def _expand_backtracking_state(
+        self,
+        puzzle: Any,
+        state: BacktrackingState,
+        occupancy: OccupancyUndoLog,
+        oracle: ReachabilityOracle,
+        entry_to_exit: dict[Node, Node],
+        target_non_mounting_per_gap: float,
+    ) -> list[BacktrackingState]:
+        """
+        Returns the valid successor states of a state, least preferred first so
+        they can be pushed onto the DFS stack as is. The occupancy must be switched
+        to the state before expanding it.
+        """
+        # Determine preferred waypoint type based on distribution
+        prefer_mounting = self._get_next_waypoint_preference(
+            state.remaining_mounting,
+            state.remaining_non_mounting,
+            state.last_visited_was_mounting,
+            state.non_mounting_count_since_last_mount,
+            target_non_mounting_per_gap,
+        )
 
-                new_remaining_mounting = list(state.remaining_mounting)
-                new_remaining_non_mounting = list(state.remaining_non_mounting)
+        # Build candidate list: preferred type first, then alternative
+        if prefer_mounting:
+            candidates = list(state.remaining_mounting) + list(
+                state.remaining_non_mounting
+            )
+        else:
+            candidates = list(state.remaining_non_mounting) + list(
+                state.remaining_mounting
+            )
 
-                if candidate in new_remaining_mounting:
-                    new_remaining_mounting.remove(candidate)
-                if candidate in new_remaining_non_mounting:
-                    new_remaining_non_mounting.remove(candidate)
+        # Sort each group by distance (closest first within each group)
+        mounting_sorted = sorted(
+            [c for c in candidates if c.mounting],
+            key=lambda n: euclidean_distance(state.current_node, n),
+        )
+        non_mounting_sorted = sorted(
+            [c for c in candidates if not c.mounting],
+            key=lambda n: euclidean_distance(state.current_node, n),
+        )
 
-                # Temporarily mark nodes as occupied to check reachability
-                for node in path_segment[1:]:
-                    node.occupied = True
+        # Rebuild candidates with distance ordering within preference groups
+        if prefer_mounting:
+            ordered_candidates = mounting_sorted + non_mounting_sorted
+        else:
+            ordered_candidates = non_mounting_sorted + mounting_sorted
+
+        # Try each candidate. Iterate in reverse because branches are pushed
+        # onto a LIFO stack: pushing the least preferred candidate first means
+        # the most preferred candidate is popped and explored first.
+        children: list[BacktrackingState] = []
+        for candidate in reversed(ordered_candidates):
+            # Attempt to find path to this candidate
+            path_segment = self._path_finder.find_path(
+                state.current_node,
+                candidate,
+                puzzle,
+                occupancy_hash=occupancy.fingerprint.value,
+            )
 
-                mounting_waypoints_reachable = (
-                    not new_remaining_mounting
-                    or self._check_mounting_waypoints_reachable(
-                        candidate, new_remaining_mounting, puzzle
-                    )
+            if not path_segment:
+                logger.debug(
+                    "Backtracking: No path to candidate at (%.1f, %.1f, %.1f)",
+                    candidate.x,
+                    candidate.y,
+                    candidate.z,
                 )
+                continue
 
-                # Restore occupied state before evaluating the next candidate, so
-                # sibling branches are checked against the popped state's occupancy
-                # instead of this branch's path. The branch's own occupancy travels
-                # in new_occupied and is re-applied when its state is popped.
-                for node in path_segment[1:]:
-                    if node not in state.occupied_nodes:
-                        node.occupied = False
-
-                # Prune if any mounting waypoints become unreachable
-                if not mounting_waypoints_reachable:
-                    logger.debug(
-                        "Backtracking: Pruning branch - mounting waypoints would become unreachable after visiting (%.1f, %.1f, %.1f)",
-                        candidate.x,
-                        candidate.y,
-                        candidate.z,
-                    )
-                    continue
+            # Create new state for this branch
+            new_occupied = list(path_segment[1:])
 
-                # Update distribution tracking
-                new_last_was_mounting = candidate.mounting
-                if candidate.mounting:
-                    new_non_mounting_count = 0
-                else:
-                    if state.last_visited_was_mounting:
-                        new_non_mounting_count = 1
-                    else:
-                        new_non_mounting_count = state.non_mounting_count_since_last_mount + 1
-
-                # Handle obstacle entry/exit teleportation
-                new_path = state.path + path_segment[1:]
-                new_current_node = candidate
-
-                mapped_exit = entry_to_exit.get(candidate)
-                if mapped_exit is not None and mapped_exit is not candidate:
-                    new_occupied.add(mapped_exit)
-                    new_path.append(mapped_exit)
-                    new_current_node = mapped_exit
-                    # Treat exit as non-mounting waypoint
-                    if mapped_exit in new_remaining_non_mounting:
-                        new_remaining_non_mounting.remove(mapped_exit)
-                    if new_last_was_mounting:
-                        new_non_mounting_count = 1
-                    else:
-                        new_non_mounting_count += 1
-                    new_last_was_mounting = False
-
-                new_visited = state.visited_waypoints.copy()
-                new_visited.add(candidate)
-                if mapped_exit:
-                    new_visited.add(mapped_exit)
-
-                new_state = BacktrackingState(
-                    current_node=new_current_node,
-                    remaining_mounting=new_remaining_mounting,
-                    remaining_non_mounting=new_remaining_non_mounting,
-                    path=new_path,
-                    occupied_nodes=new_occupied,
-                    visited_waypoints=new_visited,
-                    last_visited_was_mounting=new_last_was_mounting,
-                    non_mounting_count_since_last_mount=new_non_mounting_count,
+            new_remaining_mounting = list(state.remaining_mounting)
+            new_remaining_non_mounting = list(state.remaining_non_mounting)
+
+            if candidate in new_remaining_mounting:
+                new_remaining_mounting.remove(candidate)
+            if candidate in new_remaining_non_mounting:
+                new_remaining_non_mounting.remove(candidate)
+
+            # Temporarily mark nodes as occupied to check reachability
+            for node in path_segment[1:]:
+                node.occupied = True
+            oracle.occupy(path_segment[1:])
+
+            mounting_waypoints_reachable = (
+                not new_remaining_mounting
+                or self._check_mounting_waypoints_reachable(
+                    candidate, new_remaining_mounting, oracle
                 )
+            )
 
-                stack.append((new_state, depth + 1))
-                found_valid_successor = True
+            # Restore occupied state before evaluating the next candidate, so
+            # sibling branches are checked against the popped state's occupancy
+            # instead of this branch's path. The branch's own occupancy travels
+            # in its delta and is re-applied when its state is popped.
+            for node in path_segment[1:]:
+                if not occupancy.is_occupied(node):
+                    node.occupied = False
+            oracle.release(path_segment[1:])
 
+            # Prune if any mounting waypoints become unreachable
+            if not mounting_waypoints_reachable:
                 logger.debug(
-                    "Backtracking: Added branch to waypoint at (%.1f, %.1f, %.1f), depth %d, %d mounting and %d non-mounting remaining",
+                    "Backtracking: Pruning branch - mounting waypoints would become unreachable after visiting (%.1f, %.1f, %.1f)",
                     candidate.x,
                     candidate.y,
                     candidate.z,
-                    depth + 1,
-                    len(new_remaining_mounting),
-                    len(new_remaining_non_mounting),
                 )
+                continue
 
-            if not found_valid_successor:
-                logger.debug(
-                    "Backtracking: No valid successors from (%.1f, %.1f, %.1f) at depth %d",
-                    state.current_node.x,
-                    state.current_node.y,
-                    state.current_node.z,
-                    depth,
-                )
+            # Update distribution tracking
+            new_last_was_mounting = candidate.mounting
+            if candidate.mounting:
+                new_non_mounting_count = 0
+            else:
+                if state.last_visited_was_mounting:
+                    new_non_mounting_count = 1
+                else:
+                    new_non_mounting_count = (
+                        state.non_mounting_count_since_last_mount + 1
+                    )
 
-        if iterations >= max_iterations:
-            logger.warning(
-                "Backtracking search reached max iterations (%d) without finding solution",
-                max_iterations,
+            # Handle obstacle entry/exit teleportation
+            new_path = state.path + path_segment[1:]
+            new_current_node = candidate
+
+            mapped_exit = entry_to_exit.get(candidate)
+            if mapped_exit is not None and mapped_exit is not candidate:
+                new_occupied.append(mapped_exit)
+                new_path.append(mapped_exit)
+                new_current_node = mapped_exit
+                # Treat exit as non-mounting waypoint
+                if mapped_exit in new_remaining_non_mounting:
+                    new_remaining_non_mounting.remove(mapped_exit)
+                if new_last_was_mounting:
+                    new_non_mounting_count = 1
+                else:
+                    new_non_mounting_count += 1
+                new_last_was_mounting = False
+
+            new_visited = state.visited_waypoints.copy()
+            new_visited.add(candidate)
+            if mapped_exit:
+                new_visited.add(mapped_exit)
+
+            new_state = BacktrackingState(
+                current_node=new_current_node,
+                remaining_mounting=new_remaining_mounting,
+                remaining_non_mounting=new_remaining_non_mounting,
+                path=new_path,
+                parent=state,
+                depth=state.depth + 1,
+                occupied_delta=occupancy.new_delta(new_occupied),
+                visited_waypoints=new_visited,
+                last_visited_was_mounting=new_last_was_mounting,
+                non_mounting_count_since_last_mount=new_non_mounting_count,
             )
-        else:
-            logger.warning(
-                "Backtracking search exhausted all possibilities after %d iterations",
-                iterations,
+
+            children.append(new_state)
+
+            logger.debug(
+                "Backtracking: Added branch to waypoint at (%.1f, %.1f, %.1f), depth %d, %d mounting and %d non-mounting remaining",
+                candidate.x,
+                candidate.y,
+                candidate.z,
+                state.depth + 1,
+                len(new_remaining_mounting),
+                len(new_remaining_non_mounting),
+            )
+
+        if not children:
+            logger.debug(
+                "Backtracking: No valid successors from (%.1f, %.1f, %.1f) at depth %d",
+                state.current_node.x,
+                state.current_node.y,
+                state.current_node.z,
+                state.depth,
+            )
+
+        return children
+
+    def _connect_waypoints_backtracking_parallel(
+        self,
+        puzzle: Any,
+        initial_state: BacktrackingState,
+        entry_to_exit: dict[Node, Node],
+        target_non_mounting_per_gap: float,
+        max_depth: int,
+        workers: int,
+    ) -> Optional[list[Node]]:
+        """
+        Splits the first one or two levels of the search tree into branches and
+        searches each branch in a worker process, with its own iteration budget.
+
+        Branches are ordered the way the serial search would visit them. The
+        result of the lowest index branch that succeeds is used, so the outcome
+        does not depend on which worker finishes first. The branches after it are
+        then stopped through a shared event.
+        """
+        node_graph = puzzle.node_graph
+        oracle = ReachabilityOracle(node_graph)
+        occupancy = OccupancyUndoLog(node_graph, initial_state, oracle)
+
+        branches = [initial_state]
+        for _ in range(2):
+            if len(branches) >= workers:
+                break
+            next_branches: list[BacktrackingState] = []
+            for state in branches:
+                if state.depth > max_depth or (
+                    not state.remaining_mounting and not state.remaining_non_mounting
+                ):
+                    next_branches.append(state)
+                    continue
+                occupancy.switch_to(state)
+                children = self._expand_backtracking_state(
+                    puzzle,
+                    state,
+                    occupancy,
+                    oracle,
+                    entry_to_exit,
+                    target_non_mounting_per_gap,
+                )
+                # Children come least preferred first, branches are kept in the
+                # order the serial search would explore them
+                next_branches.extend(reversed(children))
+            branches = next_branches
+
+        # Snapshot the grid per branch, with the branch's occupancy applied to the
+        # node flags. Pickled up front so later flag changes cannot leak in.
+        payloads: list[bytes] = []
+        for state in branches:
+            occupancy.switch_to(state)
+            root = replace(
+                state,
+                parent=None,
+                occupied_delta=tuple(np.flatnonzero(occupancy.occupied).tolist()),
+            )
+            payloads.append(
+                pickle.dumps(
+                    BacktrackingSnapshot(
+                        node_graph=node_graph,
+                        root=root,
+                        entry_to_exit=entry_to_exit,
+                        target_non_mounting_per_gap=target_non_mounting_per_gap,
+                        max_depth=max_depth,
+                    )
+                )
             )
+        occupancy.switch_to(initial_state)
+
+        if not payloads:
+            logger.warning("Backtracking search found no valid first waypoint")
+            return None
+
+        logger.info(
+            "Searching %d backtracking branches with %d worker processes",
+            len(payloads),
+            min(workers, len(payloads)),
+        )
 
+        stop_event = multiprocessing.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(payloads)),
+            initializer=_init_backtracking_worker,
+            initargs=(stop_event,),
+        )
+        try:
+            futures = [
+                executor.submit(_search_backtracking_branch, payload)
+                for payload in payloads
+            ]
+            for index, future in enumerate(futures):
+                path_ids = future.result()
+                if path_ids is not None:
+                    logger.info(
+                        "Backtracking branch %d of %d succeeded",
+                        index + 1,
+                        len(futures),
+                    )
+                    return [node_graph.nodes[node_id] for node_id in path_ids]
+        finally:
+            # All preferred branches have failed by now, the branches still
+            # running stop at their next iteration and the others are dropped
+            stop_event.set()
+            executor.shutdown(cancel_futures=True)
+
+        logger.warning("All %d backtracking branches failed", len(payloads))
         return None
 
     def _verify_mounting_waypoints_visited(
@@ -540,7 +840,9 @@ class WaypointConnector:
             start_node_is_mounting=start_node_is_mounting,
         )
 
-        greedy_path, greedy_visited, greedy_remaining_m, greedy_remaining_nm = greedy_result
+        greedy_path, greedy_visited, greedy_remaining_m, greedy_remaining_nm = (
+            greedy_result
+        )
 
         # Check if greedy succeeded (all waypoints visited)
         if not greedy_remaining_m and not greedy_remaining_nm:
@@ -577,7 +879,7 @@ class WaypointConnector:
             remaining_mounting=list(remaining_mounting),
             remaining_non_mounting=list(remaining_non_mounting),
             path=[start_node],
-            occupied_nodes={start_node},
+            occupied_delta=(puzzle.node_graph.index_of(start_node),),
             visited_waypoints={start_node} if start_node.waypoint else set(),
             last_visited_was_mounting=start_node_is_mounting,
             non_mounting_count_since_last_mount=(
@@ -764,3 +1066,29 @@ class WaypointConnector:
                 break
 
         return total_path, visited_waypoints, remaining_mounting, remaining_non_mounting
+
+
+def _init_backtracking_worker(stop_event: multiprocessing.synchronize.Event) -> None:
+    """Worker initializer of the parallel backtracking search."""
+    global _branch_stop_event
+    _branch_stop_event = stop_event
+
+
+def _search_backtracking_branch(payload: bytes) -> Optional[list[int]]:
+    """
+    Worker entry point of the parallel backtracking search. Returns the found
+    path as node ids, nodes are copies and do not outlive the worker.
+    """
+    snapshot: BacktrackingSnapshot = pickle.loads(payload)
+    connector = WaypointConnector(AStarPathFinder())
+    path = connector._search_waypoint_orderings(
+        snapshot,
+        snapshot.root,
+        snapshot.entry_to_exit,
+        snapshot.target_non_mounting_per_gap,
+        snapshot.max_depth,
+        stop_event=_branch_stop_event,
+    )
+    if path is None:
+        return None
+    return [snapshot.node_graph.index_of(node) for node in path]
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from config import CaseShape, Config
+from puzzle.puzzle import Puzzle
+from puzzle.waypoint_connector import BacktrackingState, OccupancyUndoLog
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def _child(occupancy, parent, nodes):
+    return BacktrackingState(
+        current_node=nodes[-1],
+        remaining_mounting=[],
+        remaining_non_mounting=[],
+        path=parent.path + nodes,
+        parent=parent,
+        depth=parent.depth + 1,
+        occupied_delta=occupancy.new_delta(nodes),
+    )
+
+
+def _expected_occupied(state):
+    occupied = set()
+    while state is not None:
+        occupied.update(state.path)
+        state = state.parent
+    return occupied
+
+
+def test_switching_states_restores_occupancy():
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=CaseShape.SPHERE,
+    )
+    graph = puzzle.node_graph
+    free_nodes = [n for n in graph.nodes if not n.is_obstacle_occupied]
+    for node in free_nodes:
+        node.occupied = False
+    rng = random.Random(2)
+
+    start = free_nodes[0]
+    root = BacktrackingState(
+        current_node=start,
+        remaining_mounting=[],
+        remaining_non_mounting=[],
+        path=[start],
+        occupied_delta=(graph.index_of(start),),
+    )
+    occupancy = OccupancyUndoLog(graph, root)
+
+    # Grow a random tree of states, switching to each parent before branching
+    states = [root]
+    for _ in range(40):
+        parent = rng.choice(states)
+        occupancy.switch_to(parent)
+        states.append(_child(occupancy, parent, rng.sample(free_nodes, 5)))
+
+    for state in rng.sample(states, len(states)):
+        occupancy.switch_to(state)
+        expected = _expected_occupied(state)
+        assert {node for node in free_nodes if node.occupied} == expected
+        assert {graph.nodes[i] for i in occupancy.occupied.nonzero()[0]} == expected
@@ -0,0 +1,69 @@
+import pytest
+from build123d import Box, Location, Part
+
+from cad import boolean_fusion
+from cad.boolean_fusion import fuse_parts, part_bbox, touching_clusters
+
+
+def _box(x: float, y: float = 0.0) -> Part:
+    return Part(Box(10, 10, 10).moved(Location((x, y, 0))).wrapped)
+
+
+def _chain(count: int, y: float = 0.0) -> list[Part]:
+    # Overlapping neighbours along X
+    return [_box(8 * index, y) for index in range(count)]
+
+
+def test_touching_clusters_groups_transitive_neighbours():
+    parts = _chain(3) + _chain(2, y=100) + [_box(0, 200)]
+    clusters = touching_clusters([part_bbox(part) for part in parts], 0.01)
+
+    assert clusters == [[0, 1, 2], [3, 4], [5]]
+
+
+@pytest.mark.parametrize("leaf_size", [2, 3, 32])
+def test_fuse_parts_matches_single_union(leaf_size):
+    parts = _chain(5) + _chain(3, y=100)
+
+    expected = Part() + parts
+    fused = fuse_parts(parts, "test", leaf_size=leaf_size)
+
+    assert fused.volume == pytest.approx(expected.volume)
+    assert len(fused.solids()) == 2
+    assert fused.is_valid
+
+
+def test_fuse_parts_in_worker_processes():
+    parts = _chain(4) + _chain(4, y=100)
+
+    serial = fuse_parts(parts, "serial", leaf_size=2)
+    parallel = fuse_parts(parts, "parallel", workers=2, leaf_size=2)
+
+    assert parallel.volume == pytest.approx(serial.volume)
+    assert len(parallel.faces()) == len(serial.faces())
+
+
+def test_fusion_levels_share_one_worker_pool(monkeypatch):
+    pools = []
+
+    class CountingExecutor(boolean_fusion.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(boolean_fusion, "ProcessPoolExecutor", CountingExecutor)
+
+    # Eight parts per cluster take three levels of pairwise unions
+    fuse_parts(_chain(8) + _chain(8, y=100), "pool", workers=2, leaf_size=2)
+
+    assert len(pools) == 1
+
+
+def test_fuse_single_part_is_returned_unchanged():
+    part = _box(0)
+    assert fuse_parts([part], "single") is part
+
+
+def test_fuse_no_parts_raises():
+    with pytest.raises(ValueError):
+        fuse_parts([], "empty")
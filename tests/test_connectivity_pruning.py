@@ -0,0 +1,89 @@
+import logging
+import random
+
+import pytest
+
+from config import CaseShape, Config
+from puzzle.puzzle import Puzzle
+from puzzle.utils.geometry import key3
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def _remove_node(puzzle, node):
+    puzzle.nodes.remove(node)
+    k = key3(node.x, node.y, node.z)
+    if puzzle.node_dict.get(k) is node:
+        del puzzle.node_dict[k]
+
+
+def _reference_prune(puzzle):
+    """Iterative pruning that recomputes every neighbour count per round."""
+    saved = puzzle.nodes, puzzle.node_dict
+    puzzle.nodes, puzzle.node_dict = list(puzzle.nodes), dict(puzzle.node_dict)
+    rounds = []
+    try:
+        while True:
+            puzzle.invalidate_node_graph()
+            to_prune = [
+                n
+                for n in puzzle.nodes
+                if len(puzzle.path_finder.get_neighbors(puzzle, n)) <= 1
+                and n is not puzzle.start_node
+            ]
+            if not to_prune:
+                break
+            rounds.append(to_prune)
+            for n in to_prune:
+                _remove_node(puzzle, n)
+        return rounds, puzzle.nodes
+    finally:
+        puzzle.nodes, puzzle.node_dict = saved
+        puzzle.invalidate_node_graph()
+
+
+@pytest.mark.parametrize("case_shape", [CaseShape.CYLINDER, CaseShape.SPHERE])
+def test_peel_matches_iterative_pruning(case_shape):
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=case_shape,
+    )
+
+    # Thin out the grid so pruning needs several rounds
+    rng = random.Random(7)
+    for node in rng.sample(puzzle.nodes, len(puzzle.nodes) // 2):
+        if node is not puzzle.start_node:
+            _remove_node(puzzle, node)
+    puzzle.invalidate_node_graph()
+
+    expected_rounds, expected_nodes = _reference_prune(puzzle)
+    assert len(expected_rounds) > 1
+
+    # Records are taken on the module logger, catalogue imports during Puzzle()
+    # reconfigure logging and drop pytest's capture handler from the root logger
+    headers: list[str] = []
+    handler = logging.Handler(logging.WARNING)
+    handler.emit = lambda record: headers.append(record.getMessage())
+    module_logger = logging.getLogger("puzzle.puzzle")
+    module_logger.addHandler(handler)
+    try:
+        puzzle._check_node_connectivity()
+    finally:
+        module_logger.removeHandler(handler)
+
+    headers = [message for message in headers if "Pruning" in message]
+    assert headers == [
+        f"Pruning {len(to_prune)} node(s) with ≤1 neighbour [iteration {i}]"
+        for i, to_prune in enumerate(expected_rounds, start=1)
+    ]
+    assert puzzle.nodes == expected_nodes
+    assert puzzle.node_graph.node_count == len(expected_nodes)
@@ -1,7 +1,14 @@
+from itertools import combinations
+
+import numpy as np
 import pytest
-from build123d import Compound, Cone, Face, Plane
+from build123d import Box, Compound, Cone, Face, Plane
 
-from cad.intersection_check import do_faces_intersect
+from cad.intersection_check import (
+    adjacent_face_pairs,
+    do_faces_intersect,
+    overlapping_pairs,
+)
 
 
 @pytest.fixture
@@ -31,3 +38,42 @@ def test_do_faces_intersect_negative(negative_shape):
     result = do_faces_intersect(negative_shape)
     # should return False when no intersection is detected
     assert result is False
+
+
+def test_do_faces_intersect_matches_brute_force(positive_shape, negative_shape):
+    for shape in (positive_shape, negative_shape, Box(1, 1, 1)):
+        assert do_faces_intersect(shape) == do_faces_intersect(
+            shape, skip_broad_phase=True
+        )
+
+
+def test_overlapping_pairs_match_brute_force():
+    rng = np.random.default_rng(0)
+    low = rng.uniform(0, 10, (60, 3))
+    boxes = np.hstack([low, low + rng.uniform(0, 3, (60, 3))])
+
+    expected = [
+        (i, j)
+        for i, j in combinations(range(len(boxes)), 2)
+        if np.all(boxes[i, 3:] >= boxes[j, :3]) and np.all(boxes[j, 3:] >= boxes[i, :3])
+    ]
+
+    assert overlapping_pairs(boxes).tolist() == [list(pair) for pair in expected]
+
+
+def test_adjacent_face_pairs_of_box():
+    box = Box(1, 1, 1)
+    faces = box.faces()
+    face_index = {hash(face.wrapped): idx for idx, face in enumerate(faces)}
+
+    adjacent = adjacent_face_pairs(box, face_index)
+
+    # Every face borders the four faces that are not opposite to it
+    assert len(adjacent) == 12
+    for i, j in adjacent:
+        assert faces[i].normal_at().dot(faces[j].normal_at()) == pytest.approx(0)
+
+
+def test_do_faces_intersect_without_mesh_stage(positive_shape, negative_shape):
+    assert do_faces_intersect(positive_shape, mesh_tolerance=None) is True
+    assert do_faces_intersect(negative_shape, mesh_tolerance=None) is False
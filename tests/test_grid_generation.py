@@ -0,0 +1,55 @@
+import pytest
+
+from puzzle.grid_layouts.grid_layout_box import BoxCasing
+from puzzle.grid_layouts.grid_layout_cylinder import CylinderCasing
+from puzzle.grid_layouts.grid_layout_sphere import SphereCasing
+from puzzle.utils.geometry import frange, key3
+
+
+def _casings():
+    return [
+        (BoxCasing(width=100, height=150, length=120, panel_thickness=3), 75),
+        (SphereCasing(diameter=100, shell_thickness=2), 50),
+        (CylinderCasing(diameter=100, height=120, shell_thickness=2), 60),
+    ]
+
+
+@pytest.mark.parametrize("casing, extent", _casings())
+@pytest.mark.parametrize("node_size", [10, 5, 3.3])
+def test_vectorized_grid_matches_contains_point(casing, extent, node_size):
+    casing.node_size = node_size
+    values = frange(-extent, extent, node_size)
+
+    nodes, node_dict = casing.generate_rectangular_grid_from_values(
+        x_values=values, y_values=values, z_values=values
+    )
+
+    expected = [
+        (x, y, z)
+        for x in values
+        for y in values
+        for z in values
+        if casing.contains_point(x, y, z)
+    ]
+
+    # Same points in the same x, y, z loop order
+    actual = [(n.x, n.y, n.z) for n in nodes]
+    assert actual == expected
+    # Coordinates keep the exact values (and types) of the input lists
+    assert [tuple(map(type, c)) for c in actual] == [
+        tuple(map(type, c)) for c in expected
+    ]
+    assert all(n.in_rectangular_grid for n in nodes)
+    assert len(node_dict) == len(nodes)
+    for node in nodes:
+        assert node_dict[key3(node.x, node.y, node.z)] is node
+
+
+@pytest.mark.parametrize("casing, extent", _casings())
+def test_empty_value_list_gives_empty_grid(casing, extent):
+    nodes, node_dict = casing.generate_rectangular_grid_from_values(
+        x_values=[], y_values=frange(-extent, extent, 10), z_values=[0.0]
+    )
+
+    assert nodes == []
+    assert node_dict == {}
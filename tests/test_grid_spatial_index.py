@@ -0,0 +1,102 @@
+import logging
+import math
+import os
+import time
+
+import pytest
+
+from puzzle.grid_layouts.grid_layout_base import _close_pairs
+from puzzle.grid_layouts.grid_layout_cylinder import CylinderCasing
+from puzzle.node import Node
+from puzzle.utils.geometry import key3
+
+logger = logging.getLogger(__name__)
+
+
+def _casing():
+    return CylinderCasing(diameter=20, height=20, shell_thickness=2)
+
+
+def test_close_pairs():
+    points = [(0.0, 0.0), (3.0, 0.0), (10.0, 10.0)]
+    reference = [(1.0, 0.0), (0.0, 2.0), (3.0, 4.0), (-1.5, 0.0)]
+
+    # Strictly closer: (3, 0) is exactly 2 from (1, 0) and (3, 4) is 4 away
+    assert _close_pairs(points, reference, 2.0) == [[0, 3], [], []]
+    assert _close_pairs(points, reference, 2.5) == [[0, 1, 3], [0], []]
+    assert _close_pairs(points, [], 2.0) == [[], [], []]
+    assert _close_pairs(points, reference, 0.0) == [[], [], []]
+
+
+def test_remove_rectangular_nodes_close_to():
+    nodes = [
+        Node(0.0, 0.0, 0.0),
+        Node(4.0, 0.0, 0.0),
+        Node(0.5, 0.0, 0.0, in_circular_grid=True),
+        Node(0.0, 0.5, 10.0),
+    ]
+    node_dict = {key3(n.x, n.y, n.z): n for n in nodes}
+    reference = [Node(1.0, 0.0, 0.0), Node(0.0, 0.0, 10.0)]
+
+    _casing().remove_rectangular_nodes_close_to(
+        nodes, node_dict, reference, 2.0, z_planes={0.0}
+    )
+
+    # Circular nodes and nodes off the given planes are kept
+    remaining = [(n.x, n.y, n.z) for n in nodes]
+    assert remaining == [(4.0, 0.0, 0.0), (0.5, 0.0, 0.0), (0.0, 0.5, 10.0)]
+    assert sorted(node_dict) == sorted(key3(*coord) for coord in remaining)
+
+
+def test_circular_nodes_on_plane():
+    nodes, node_dict = [], {}
+
+    added = _casing().add_circular_nodes_on_planes(
+        nodes,
+        node_dict,
+        radius=10,
+        z_planes=[0.0],
+        count_even=4,
+        grid_step=5,
+        tolerance=1.0,
+    )
+
+    # The four ring nodes, and the grid intersections at x or y = +-5. The
+    # intersections on the axes coincide with ring nodes and are withheld.
+    offset = math.sqrt(75)
+    expected = [(10, 0), (0, 10), (-10, 0), (0, -10)] + [
+        (x_sign * a, y_sign * b)
+        for a, b in ((5, offset), (offset, 5))
+        for x_sign in (1, -1)
+        for y_sign in (1, -1)
+    ]
+    assert added == nodes
+    assert len(nodes) == len(expected)
+    assert all(n.in_circular_grid and n.z == 0.0 for n in nodes)
+    for (x, y), (expected_x, expected_y) in zip(
+        sorted((n.x, n.y) for n in nodes), sorted(expected)
+    ):
+        assert (x, y) == (pytest.approx(expected_x), pytest.approx(expected_y))
+    assert len(node_dict) == len(expected)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="benchmark, run with RUN_BENCHMARKS=1 and --log-cli-level=INFO",
+)
+def test_cylinder_node_creation_benchmark():
+    heights = [40, 120, 240, 480]
+    timings = []
+    for height in heights:
+        casing = CylinderCasing(diameter=100, height=height, shell_thickness=2)
+        start_time = time.perf_counter()
+        nodes, _, _ = casing.create_nodes()
+        seconds = time.perf_counter() - start_time
+        timings.append(seconds)
+        logger.info(
+            "Cylinder height %d mm: %d nodes in %.3f s", height, len(nodes), seconds
+        )
+
+    # Exponent of time against height, 1 is linear and 2 quadratic
+    exponent = math.log(timings[-1] / timings[0]) / math.log(heights[-1] / heights[0])
+    logger.info("Node creation time grows with height^%.2f", exponent)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from build123d import Box, Location, Part, Plane, Polyline, RadiusArc, Vector, Wire
+
+from cad.hole_cutters import hole_cutter_template, located_cutters, points_on_path
+
+
+def test_points_on_straight_and_curved_path():
+    straight = Polyline((0, 0, 0), (10, 0, 0), (10, 10, 0))
+    curved = Wire(
+        [
+            Polyline((0, 0, 0), (5, 0, 0)).edge(),
+            RadiusArc((5, 0, 0), (10, 5, 0), -5),
+            Polyline((10, 5, 0), (10, 10, 0)).edge(),
+        ]
+    )
+    points = [Vector(0, 0, 0), Vector(5, 0, 0), Vector(10, 0, 0), Vector(10, 7, 0)]
+
+    assert points_on_path(straight, points).tolist() == [True, True, True, True]
+    # The corner node is cut off by the curve
+    assert points_on_path(curved, points).tolist() == [True, True, False, True]
+    assert points_on_path(curved, []).shape == (0,)
+
+
+def test_points_on_arc_ring_segment():
+    radius = 70.0
+    angles = np.radians(np.arange(0, 91, 15))
+    # Quarter of a ring around the origin, nodes on the ring and just inside it
+    arc = Wire([RadiusArc((radius, 0, 0), (0, radius, 0), -radius)])
+    nodes = [Vector(radius * np.cos(a), radius * np.sin(a), 0) for a in angles]
+    inside = [node * 0.9 for node in nodes]
+
+    assert points_on_path(arc, nodes).tolist() == [True] * len(angles)
+    assert points_on_path(arc, inside).tolist() == [False] * len(angles)
+
+
+def test_template_is_cached_per_orientation():
+    first = hole_cutter_template(5.0, 3.0, (0, -1, 0), (1, 0, 0))
+    again = hole_cutter_template(5.0, 3.0, (0, -1, 0), (1, 0, 0))
+    upright = hole_cutter_template(5.0, 3.0)
+
+    assert first is again
+    assert first is not upright
+    size = first.bounding_box().size
+    assert (size.X, size.Y, size.Z) == pytest.approx((5, 6, 5))
+
+
+def test_batched_cut_matches_sequential_cuts():
+    body = Part(Box(40, 10, 10).wrapped)
+    template = hole_cutter_template(4.0, 6.0, tuple(Plane.XY.z_dir))
+    locations = [Location((x, 0, 0)) for x in (-12, 0, 12)]
+
+    sequential = body
+    for location in locations:
+        sequential = sequential - template.moved(location)
+    batched = body - located_cutters(template, locations)
+
+    assert batched.volume == pytest.approx(sequential.volume)
+    assert batched.volume == pytest.approx(40 * 10 * 10 - 3 * np.pi * 2**2 * 10)
+    # The cached template is left where it was
+    assert template.center().X == pytest.approx(0, abs=1e-6)
@@ -0,0 +1,62 @@
+import random
+
+from puzzle.utils.indexed_heap import IndexedMinHeap
+
+
+def test_pop_order_matches_sorted_keys():
+    rng = random.Random(3)
+    keys = [rng.uniform(0, 100) for _ in range(200)]
+
+    heap = IndexedMinHeap(len(keys))
+    for item, key in enumerate(keys):
+        heap.push(item, key)
+
+    popped = [heap.pop() for _ in range(len(keys))]
+
+    assert [key for _, key in popped] == sorted(keys)
+    assert not heap
+
+
+def test_decrease_key_moves_item_forward():
+    heap = IndexedMinHeap(5)
+    for item, key in enumerate([5.0, 4.0, 3.0, 2.0, 1.0]):
+        heap.push(item, key)
+
+    heap.decrease_key(0, 0.5)
+    assert heap.key(0) == 0.5
+    assert heap.pop() == (0, 0.5)
+
+
+def test_push_or_decrease_ignores_larger_keys():
+    heap = IndexedMinHeap(3)
+    heap.push_or_decrease(1, 2.0)
+    heap.push_or_decrease(1, 3.0)
+    assert len(heap) == 1
+    assert heap.key(1) == 2.0
+
+    heap.push_or_decrease(1, 1.0)
+    assert len(heap) == 1
+    assert heap.key(1) == 1.0
+
+
+def test_equal_keys_pop_by_item_id():
+    heap = IndexedMinHeap(4)
+    for item in (3, 1, 2, 0):
+        heap.push(item, 1.0)
+
+    assert [heap.pop()[0] for _ in range(4)] == [0, 1, 2, 3]
+
+
+def test_clear_resets_membership():
+    heap = IndexedMinHeap(4)
+    heap.push(2, 1.0)
+    heap.push(3, 2.0)
+    assert 2 in heap
+
+    heap.clear()
+
+    assert 2 not in heap
+    assert 3 not in heap
+    assert len(heap) == 0
+    heap.push(2, 5.0)
+    assert heap.pop() == (2, 5.0)
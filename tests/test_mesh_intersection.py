@@ -0,0 +1,91 @@
+import numpy as np
+from build123d import Box, Compound, Cone, Face, Plane
+
+from cad.mesh_intersection import (
+    flag_face_pairs,
+    tessellate_faces,
+    triangles_intersect,
+)
+from cad.sweep_cache import shape_digest
+
+
+def test_triangles_intersect():
+    flat = np.array([[[0, 0, 0], [2, 0, 0], [0, 2, 0]]], dtype=float)
+    crossing = np.array([[[0.5, 0.5, -1], [0.5, 0.5, 1], [1.5, 0.5, 0]]], dtype=float)
+    above = crossing + [0, 0, 2]
+    beside = crossing + [5, 0, 0]
+
+    assert triangles_intersect(flat, crossing).tolist() == [True]
+    assert triangles_intersect(crossing, flat).tolist() == [True]
+    others = np.concatenate([above, beside])
+    assert triangles_intersect(np.repeat(flat, 2, axis=0), others).tolist() == [
+        False,
+        False,
+    ]
+
+
+def test_coplanar_triangles_intersect():
+    flat = np.array([[[0, 0, 0], [2, 0, 0], [0, 2, 0]]], dtype=float)
+    overlapping = flat + [1, 0.5, 0]
+    inside = flat * 0.25 + [0.25, 0.25, 0]
+    apart = flat + [3, 0, 0]
+
+    others = np.concatenate([overlapping, inside, apart])
+    assert triangles_intersect(np.repeat(flat, 3, axis=0), others).tolist() == [
+        True,
+        True,
+        False,
+    ]
+    assert triangles_intersect(inside, flat).tolist() == [True]
+
+    # In a plane that is not a coordinate plane
+    rotation = np.array([[1, 0, 0], [0, 0.6, -0.8], [0, 0.8, 0.6]])
+    assert triangles_intersect(
+        np.concatenate([flat, flat]) @ rotation.T,
+        np.concatenate([overlapping, apart]) @ rotation.T,
+    ).tolist() == [True, False]
+
+
+def test_flag_face_pairs_of_crossing_faces():
+    shape = Compound(
+        [
+            Face.make_rect(1, 1, plane=Plane.XY),
+            Face.make_rect(1, 1, plane=Plane.XZ),
+        ]
+    )
+    faces = shape.faces()
+
+    triangles, face_ids = tessellate_faces(shape, faces, 0.1, 0.5)
+
+    assert flag_face_pairs(triangles, face_ids, 0.1) == {(0, 1)}
+
+
+def test_flag_face_pairs_of_overlapping_coplanar_faces():
+    shape = Compound(
+        [
+            Face.make_rect(1, 1, plane=Plane.XY),
+            Face.make_rect(1, 1, plane=Plane((0.5, 0.3, 0))),
+        ]
+    )
+    faces = shape.faces()
+
+    triangles, face_ids = tessellate_faces(shape, faces, 0.1, 0.5)
+
+    assert flag_face_pairs(triangles, face_ids, 0.1) == {(0, 1)}
+
+
+def test_neighbouring_faces_are_not_flagged():
+    for shape in (Box(1, 2, 3), Cone(2, 1, 2)):
+        triangles, face_ids = tessellate_faces(shape, shape.faces(), 0.1, 0.5)
+
+        assert len(triangles) > 0
+        assert flag_face_pairs(triangles, face_ids, 0.1) == set()
+
+
+def test_tessellation_leaves_shape_unchanged():
+    shape = Cone(2, 1, 2)
+    digest = shape_digest(shape)
+
+    tessellate_faces(shape, shape.faces(), 0.1, 0.5)
+
+    assert shape_digest(shape) == digest
@@ -0,0 +1,128 @@
+import importlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+from build123d import Box, Polyline
+
+import config
+from obstacles import node_cache
+from obstacles.node_cache import (
+    cache_dir,
+    load_node_cells,
+    node_cache_file,
+    node_cache_key,
+    store_node_cells,
+)
+from obstacles.obstacle import Obstacle
+from puzzle.node import Node
+
+
+class CachedObstacle(Obstacle):
+    """Dummy obstacle that loads its nodes on construction, as the catalogue does."""
+
+    geometry_calls = 0
+
+    def __init__(self, name: str = "Cached") -> None:
+        super().__init__(name=name)
+        self.entry_path_segment.nodes = [Node(-10.0, 0.0, 0.0)]
+        self.exit_path_segment.nodes = [Node(10.0, 0.0, 0.0)]
+
+    def create_obstacle_geometry(self):
+        CachedObstacle.geometry_calls += 1
+        self.main_path_segment.path = Polyline((-10, 0, 0), (10, 0, 0))
+
+    def model_solid(self):
+        return Box(10, 10, 10)
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(config.Obstacles, "NODE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_key_follows_parameters():
+    obstacle = CachedObstacle()
+    key = node_cache_key(obstacle)
+    assert node_cache_key(CachedObstacle()) == key
+
+    obstacle.overlap_percentage = 2.0
+    assert node_cache_key(obstacle) != key
+
+    other = CachedObstacle()
+    other.exit_path_segment.nodes = [Node(0.0, 10.0, 0.0)]
+    assert node_cache_key(other) != key
+
+    other = CachedObstacle()
+    other.node_size = 12.0
+    assert node_cache_key(other) != key
+
+    # Placement does not change the obstacle type
+    other = CachedObstacle()
+    other.grid_origin = (10.0, 0.0, 0.0)
+    assert node_cache_key(other) == key
+
+
+def test_key_follows_cache_version(monkeypatch):
+    key = node_cache_key(CachedObstacle())
+
+    version = node_cache.NODE_CACHE_VERSION
+    monkeypatch.setattr(node_cache, "NODE_CACHE_VERSION", version + 1)
+
+    assert node_cache_key(CachedObstacle()) != key
+
+
+def test_source_line_endings_do_not_change_the_key(tmp_path, monkeypatch):
+    source = "def shape():\n    return 1\n"
+    (tmp_path / "lf_source.py").write_bytes(source.encode())
+    (tmp_path / "crlf_source.py").write_bytes(source.replace("\n", "\r\n").encode())
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    lf = node_cache._source_text(importlib.import_module("lf_source"))
+    crlf = node_cache._source_text(importlib.import_module("crlf_source"))
+
+    assert lf == crlf
+    assert node_cache._source_text(0.04) == "0.04"
+
+
+def test_relative_cache_dir_is_taken_from_project_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(config.Obstacles, "NODE_CACHE_DIR", "node/cache")
+    monkeypatch.chdir(tmp_path)
+
+    assert cache_dir() == Path(config.__file__).resolve().parent / "node/cache"
+
+
+def test_store_and_load(tmp_cache):
+    cache_file = node_cache_file(CachedObstacle("Round trip"))
+    assert cache_file.parent == tmp_cache
+    assert load_node_cells(cache_file) is None
+
+    occupied = np.array([[0, 0, 0], [-1, 0, 2]])
+    store_node_cells(cache_file, occupied, np.empty((0, 3)))
+    cells = load_node_cells(cache_file)
+
+    assert cells[0].dtype == np.int32
+    assert cells[0].tolist() == occupied.tolist()
+    assert cells[1].shape == (0, 3)
+    assert [entry.name for entry in tmp_cache.iterdir()] == [cache_file.name]
+
+    cache_file.write_bytes(b"not an npz file")
+    assert load_node_cells(cache_file) is None
+
+
+def test_nodes_are_read_from_the_cache(tmp_cache):
+    obstacle = CachedObstacle("Read from cache")
+    store_node_cells(
+        node_cache_file(obstacle), np.array([[1, 0, -1]]), np.array([[2, 0, -1]])
+    )
+    CachedObstacle.geometry_calls = 0
+
+    nodes = obstacle.load_relative_node_coords()
+
+    size = obstacle.node_size
+    assert [(n.x, n.y, n.z) for n in nodes] == [(size, 0.0, -size)]
+    assert nodes[0].occupied
+    assert [(n.x, n.y, n.z) for n in obstacle.overlap_nodes] == [(2 * size, 0, -size)]
+    assert obstacle.occupied_cells.tolist() == [[1, 0, -1]]
+    assert CachedObstacle.geometry_calls == 0
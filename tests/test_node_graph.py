@@ -0,0 +1,83 @@
+import pytest
+
+from config import CaseShape, Config
+from puzzle.puzzle import Puzzle
+from puzzle.utils.geometry import key3
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def _build_puzzle(case_shape: CaseShape) -> Puzzle:
+    return Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=case_shape,
+    )
+
+
+@pytest.mark.parametrize(
+    "case_shape",
+    [CaseShape.BOX, CaseShape.SPHERE, CaseShape.CYLINDER],
+)
+def test_graph_neighbors_match_get_neighbors(case_shape):
+    puzzle = _build_puzzle(case_shape)
+    # Path processing moves some path nodes after routing, rebuild so the graph
+    # and get_neighbors see the same coordinates
+    graph = puzzle.rebuild_node_graph()
+
+    assert graph.node_count == len(puzzle.nodes)
+
+    for node in puzzle.nodes:
+        expected = puzzle.path_finder.get_neighbors(puzzle, node)
+        actual = graph.neighbors(node)
+
+        # Same neighbours, same order, same costs
+        assert [neighbor for neighbor, _ in actual] == [
+            neighbor for neighbor, _ in expected
+        ]
+        assert [cost for _, cost in actual] == [cost for _, cost in expected]
+
+
+def test_graph_csr_layout_is_consistent():
+    puzzle = _build_puzzle(CaseShape.BOX)
+    graph = puzzle.node_graph
+
+    assert graph.offsets[0] == 0
+    assert graph.offsets[-1] == graph.edge_count
+    assert len(graph.targets) == len(graph.costs) == graph.edge_count
+    assert graph.degrees().sum() == graph.edge_count
+    assert graph.targets.min() >= 0
+    assert graph.targets.max() < graph.node_count
+
+
+def test_rebuild_after_node_removal_drops_edges():
+    puzzle = _build_puzzle(CaseShape.BOX)
+    graph = puzzle.node_graph
+
+    # Pick a plain interior node and remove it from the grid
+    removed = next(
+        node
+        for node in puzzle.nodes
+        if not node.waypoint and not node.puzzle_start and not node.occupied
+    )
+    neighbor_nodes = [neighbor for neighbor, _ in graph.neighbors(removed)]
+    assert neighbor_nodes
+
+    puzzle.nodes.remove(removed)
+    del puzzle.node_dict[key3(removed.x, removed.y, removed.z)]
+    puzzle.invalidate_node_graph()
+    rebuilt = puzzle.node_graph
+
+    assert rebuilt is not graph
+    assert removed not in rebuilt.node_ids
+    assert rebuilt.node_count == graph.node_count - 1
+    for neighbor in neighbor_nodes:
+        assert removed not in [n for n, _ in rebuilt.neighbors(neighbor)]
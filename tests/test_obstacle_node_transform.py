@@ -1,7 +1,8 @@
 import math
 
+import numpy as np
 import pytest
-from build123d import Location, Pos, Vector
+from build123d import Box, Extrinsic, Location, Polyline, Pos, Rotation, Vector
 
 from obstacles.obstacle import Obstacle
 from puzzle.node import Node
@@ -78,3 +79,71 @@ def test_world_nodes_snap_and_copy(obstacle: DummyObstacle):
     # helper flags preserved
     assert world_nodes[0].in_circular_grid
     assert world_nodes[0].in_rectangular_grid
+
+
+def test_lattice_pose_of_grid_aligned_placement(obstacle: DummyObstacle):
+    obstacle.location = Pos(20.0, -10.0, 30.0) * Rotation(
+        90, 0, 180, ordering=Extrinsic.XYZ
+    )
+    obstacle.occupied_nodes = [
+        Node(10.0, 20.0, 30.0, occupied=True),
+        Node(-10.0, 0.0, 10.0, occupied=True),
+    ]
+    cells = np.array([[1, 2, 3], [-1, 0, 1]], dtype=np.int32)
+
+    placed = obstacle.placed_cells(cells)
+
+    expected = [
+        [round(c / 10.0) for c in (n.x, n.y, n.z)]
+        for n in obstacle.get_placed_node_coordinates(obstacle.occupied_nodes)
+    ]
+    assert placed.tolist() == expected
+
+
+def test_lattice_pose_is_none_off_grid(obstacle: DummyObstacle):
+    obstacle.location = Location(Pos(Vector(5.0, 0.0, 0.0)))
+    assert obstacle.lattice_pose() is None
+
+    obstacle.location = Rotation(0, 0, 45)
+    assert obstacle.placed_cells(np.zeros((1, 3), dtype=np.int32)) is None
+
+
+class CountingObstacle(DummyObstacle):
+    """Dummy obstacle counting how often its solid is modelled."""
+
+    model_calls = 0
+
+    def create_obstacle_geometry(self):
+        self.main_path_segment.path = Polyline((0, 0, 0), (10, 0, 0))
+
+    def model_solid(self):
+        CountingObstacle.model_calls += 1
+        return Box(10, 10, 10)
+
+
+def test_class_geometry_is_shared_between_instances():
+    first = CountingObstacle("Counting")
+    second = CountingObstacle("Counting")
+    other = CountingObstacle("Other counting")
+
+    assert first.class_geometry() is second.class_geometry()
+    assert first.class_geometry() is not other.class_geometry()
+
+    solid = first.cached_model_solid()
+    assert second.cached_model_solid() is solid
+    assert CountingObstacle.model_calls == 1
+
+
+def test_distinct_orientation_masks_are_computed_once():
+    obstacle = CountingObstacle("Symmetric bar")
+    obstacle.occupied_cells = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0]])
+    obstacle.overlap_cells = obstacle.occupied_cells
+    obstacle.entry_path_segment.nodes = [Node(-10.0, 0.0, 0.0)]
+    obstacle.exit_path_segment.nodes = [Node(10.0, 0.0, 0.0)]
+    orientations = [(0, 0, 0), (0, 0, 90), (0, 0, 180), (0, 90, 0)]
+
+    masks = obstacle.distinct_orientation_masks(orientations)
+
+    # The bar turned half way lies on the same cells, entry and exit swapped
+    assert [m.angles for m in masks] == [(0, 0, 0), (0, 0, 90), (0, 90, 0)]
+    assert obstacle.distinct_orientation_masks(orientations) is masks
@@ -0,0 +1,67 @@
+import multiprocessing
+
+import pytest
+
+from config import CaseShape, Config
+from puzzle.path_finder import AStarPathFinder
+from puzzle.puzzle import Puzzle
+from puzzle.waypoint_connector import BacktrackingState, WaypointConnector
+
+
+@pytest.fixture
+def restore_config():
+    original_random = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    original_workers = Config.Puzzle.BACKTRACKING_WORKERS
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_random
+        Config.Puzzle.BACKTRACKING_WORKERS = original_workers
+
+
+def _total_path(seed: int) -> list[tuple[float, float, float]]:
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=seed,
+        case_shape=CaseShape.SPHERE,
+    )
+    return [(node.x, node.y, node.z) for node in puzzle.total_path]
+
+
+def test_parallel_backtracking_matches_serial(restore_config):
+    # Random obstacles on this seed make the greedy connection fail
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = True
+
+    Config.Puzzle.BACKTRACKING_WORKERS = 1
+    serial_path = _total_path(seed=1)
+
+    Config.Puzzle.BACKTRACKING_WORKERS = 2
+    assert _total_path(seed=1) == serial_path
+
+
+def test_search_stops_once_stop_event_is_set(restore_config):
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=1,
+        case_shape=CaseShape.SPHERE,
+    )
+    connector = WaypointConnector(AStarPathFinder())
+    # Nothing left to visit, the search succeeds in its first iteration
+    start = puzzle.start_node
+    state = BacktrackingState(
+        current_node=start,
+        remaining_mounting=[],
+        remaining_non_mounting=[],
+        path=[start],
+    )
+    stop_event = multiprocessing.Event()
+
+    def search():
+        return connector._search_waypoint_orderings(
+            puzzle, state, {}, 1.0, max_depth=10, stop_event=stop_event
+        )
+
+    assert search() == [start]
+    stop_event.set()
+    assert search() is None
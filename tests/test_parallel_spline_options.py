@@ -0,0 +1,122 @@
+import pytest
+from build123d import Spline, Transition
+
+from cad.path_builder import PathBuilder, SplineOption
+from cad.path_segment import PathSegment
+from config import Config, PathProfileType
+from puzzle.node import Node
+
+
+@pytest.fixture
+def restore_spline_option_workers():
+    original_workers = Config.Path.SPLINE_OPTION_WORKERS
+    original_cache_enabled = Config.Path.SWEEP_CACHE_ENABLED
+    # Sweep for real in both modes, not from the sweep cache
+    Config.Path.SWEEP_CACHE_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Path.SPLINE_OPTION_WORKERS = original_workers
+        Config.Path.SWEEP_CACHE_ENABLED = original_cache_enabled
+
+
+def make_stub_builder() -> PathBuilder:
+    builder = PathBuilder.__new__(PathBuilder)
+    builder.path_profile_type_parameters = Config.Path.PATH_PROFILE_TYPE_PARAMETERS
+    builder._spline_option_executor = None
+    return builder
+
+
+def shutdown(builder: PathBuilder) -> None:
+    if builder._spline_option_executor is not None:
+        builder._spline_option_executor.shutdown(cancel_futures=True)
+
+
+def make_segment() -> PathSegment:
+    points = [(0, 0, 0), (20, 0, 0), (20, 20, 0)]
+    segment = PathSegment([Node(*p) for p in points], main_index=3)
+    segment.path_profile_type = PathProfileType.U_SHAPE
+    segment.transition_type = Transition.RIGHT
+    return segment
+
+
+def make_options() -> list[SplineOption]:
+    """A kinked spline that cannot sweep, followed by two gentle ones."""
+    kinked = Spline(
+        [(0, 0, 0), (20, 0, 0), (20, 20, 0)], tangents=[(1, 0, 0), (0, -1, 0)]
+    )
+    direct = Spline([(0, 0, 0), (20, 20, 0)], tangents=[(1, 0, 0), (0, 1, 0)])
+    through_middle = Spline(
+        [(0, 0, 0), (14, 6, 0), (20, 20, 0)], tangents=[(1, 0, 0), (0, 1, 0)]
+    )
+    return [
+        SplineOption(index, path, -90, -90)
+        for index, path in enumerate((kinked, direct, through_middle), 1)
+    ]
+
+
+def _sweep(workers: int):
+    Config.Path.SPLINE_OPTION_WORKERS = workers
+    builder = make_stub_builder()
+    segment = make_segment()
+    try:
+        option = builder._sweep_spline_options_concurrently(segment, make_options())
+    finally:
+        shutdown(builder)
+    return option, segment
+
+
+def test_concurrent_spline_options_match_serial(restore_spline_option_workers):
+    builder = make_stub_builder()
+    serial_segment = make_segment()
+    serial_option = next(
+        option
+        for option in make_options()
+        if builder._sweep_spline_option(serial_segment, option)
+    )
+
+    parallel_option, parallel_segment = _sweep(workers=3)
+
+    # The lowest index option that validates wins, as in the serial loop
+    assert serial_option.index == 2
+    assert parallel_option.index == serial_option.index
+    assert parallel_segment.path is parallel_option.path
+    assert parallel_segment.path_body.part.volume == pytest.approx(
+        serial_segment.path_body.part.volume
+    )
+    assert parallel_segment.path_profile.area == pytest.approx(
+        serial_segment.path_profile.area
+    )
+
+
+def test_no_valid_option_returns_none(restore_spline_option_workers):
+    Config.Path.SPLINE_OPTION_WORKERS = 2
+    kinked = make_options()[0]
+    options = [kinked, SplineOption(2, kinked.path, 0, 0)]
+
+    builder = make_stub_builder()
+    try:
+        assert (
+            builder._sweep_spline_options_concurrently(make_segment(), options)
+            is None
+        )
+    finally:
+        shutdown(builder)
+
+
+def test_worker_pool_is_shared_between_segments(restore_spline_option_workers):
+    Config.Path.SPLINE_OPTION_WORKERS = 2
+    builder = make_stub_builder()
+    try:
+        first = builder._sweep_spline_options_concurrently(
+            make_segment(), make_options()
+        )
+        executor = builder._spline_option_executor
+        second = builder._sweep_spline_options_concurrently(
+            make_segment(), make_options()
+        )
+
+        assert first.index == second.index == 2
+        assert builder._spline_option_executor is executor
+    finally:
+        shutdown(builder)
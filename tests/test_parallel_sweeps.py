@@ -0,0 +1,72 @@
+import pytest
+from build123d import Polyline, Transition
+
+from cad.path_builder import PathBuilder, SweepJob
+from cad.path_profile_type_shapes import create_path_profile
+from cad.path_segment import PathSegment
+from config import Config, PathProfileType
+from puzzle.node import Node
+
+
+@pytest.fixture
+def restore_sweep_workers():
+    original_workers = Config.Path.SWEEP_WORKERS
+    original_cache_enabled = Config.Path.SWEEP_CACHE_ENABLED
+    # Sweep for real in both modes, not from the sweep cache
+    Config.Path.SWEEP_CACHE_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Path.SWEEP_WORKERS = original_workers
+        Config.Path.SWEEP_CACHE_ENABLED = original_cache_enabled
+
+
+def make_stub_builder() -> PathBuilder:
+    builder = PathBuilder.__new__(PathBuilder)
+    builder.path_profile_type_parameters = Config.Path.PATH_PROFILE_TYPE_PARAMETERS
+    return builder
+
+
+def make_sweep_jobs() -> list[SweepJob]:
+    """One accent and one support sweep per segment along a few L-shaped paths."""
+    jobs = []
+    for main_index, offset in enumerate((0, 30, 60)):
+        points = [(offset, 0, 0), (offset + 20, 0, 0), (offset + 20, 20, 0)]
+        segment = PathSegment([Node(*p) for p in points], main_index=main_index)
+        segment.path = Polyline(points)
+        segment.path_profile_type = PathProfileType.U_SHAPE
+        segment.transition_type = Transition.RIGHT
+
+        for profile_type, body_attr_name, sweep_label in (
+            (PathProfileType.U_SHAPE_PATH_COLOR, "accent_body", "Accent"),
+            (PathProfileType.O_SHAPE_SUPPORT, "support_body", "Support"),
+        ):
+            profile = create_path_profile(
+                profile_type,
+                Config.Path.PATH_PROFILE_TYPE_PARAMETERS.get(profile_type.value, {}),
+            )
+            jobs.append(SweepJob(segment, profile, body_attr_name, sweep_label))
+    return jobs
+
+
+def _body_volumes(jobs: list[SweepJob]) -> list[float]:
+    return [
+        round(getattr(job.segment, job.body_attr_name).part.volume, 6) for job in jobs
+    ]
+
+
+def test_parallel_sweeps_match_serial(restore_sweep_workers):
+    builder = make_stub_builder()
+
+    Config.Path.SWEEP_WORKERS = 1
+    serial_jobs = make_sweep_jobs()
+    builder._run_sweep_jobs(serial_jobs)
+
+    Config.Path.SWEEP_WORKERS = 2
+    parallel_jobs = make_sweep_jobs()
+    builder._run_sweep_jobs(parallel_jobs)
+
+    serial_volumes = _body_volumes(serial_jobs)
+    assert all(volume > 0 for volume in serial_volumes)
+    # Results land on their own segments, in path order
+    assert _body_volumes(parallel_jobs) == serial_volumes
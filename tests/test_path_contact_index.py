@@ -0,0 +1,66 @@
+import pytest
+from build123d import Box, Compound, Location, Part
+
+from assembly.casing import PathContactIndex, merge_standard_paths_with_case
+from cad.cases.case_model_base import CasePart
+
+
+def _box(x: float, y: float, size=(10, 10, 10)) -> Part:
+    return Part(Box(*size).moved(Location((x, y, 0))).wrapped)
+
+
+def _paths() -> list[Part]:
+    return [_box(0, 0), _box(0, 30), _box(0, 60)]
+
+
+def test_candidates_from_bounding_boxes():
+    index = PathContactIndex(_paths())
+
+    assert index.candidates(_box(0, 15, (4, 24, 4))) == [0, 1]
+    assert index.candidates(_box(100, 0)) == []
+
+
+def test_match_by_contact_and_overlap():
+    index = PathContactIndex(_paths())
+
+    # L-shaped bridge, its bounding box overlaps the first path but only the
+    # second path is reached
+    bridge = _box(10, 14, (4, 28, 4)) + _box(6, 27, (12, 2, 4))
+    assert index.candidates(bridge) == [0, 1]
+    assert index.match(bridge) == 1
+    # Reaches into both paths, the first one it overlaps wins
+    assert index.match(_box(0, 15, (4, 24, 4))) == 0
+    assert index.match(_box(0, 100, (4, 4, 4))) is None
+    # Only touches the first path, without overlapping it
+    assert index.match(_box(7, 0, (4, 4, 4))) is None
+
+
+def test_merge_grows_bounding_box():
+    index = PathContactIndex(_paths())
+    fragment = _box(0, 8, (4, 6, 4))
+
+    index.merge(0, fragment)
+
+    assert index.standard_paths[0].volume == pytest.approx(1000 + 4 * 6 * 4)
+    assert index.candidates(_box(0, 10, (2, 2, 2))) == [0]
+
+
+def test_bridges_are_merged_into_their_paths():
+    paths = _paths()
+    bridges = Part(
+        Compound(
+            children=[_box(0, 9, (4, 10, 4)), _box(0, 69, (4, 10, 4))]
+        ).wrapped
+    )
+    bridges.label = CasePart.INTERNAL_PATH_BRIDGES.value
+    ring = _box(0, 200)
+    ring.label = CasePart.MOUNTING_RING.value
+    case_parts = [ring, bridges]
+
+    merge_standard_paths_with_case(case_parts, paths)
+
+    assert [part.label for part in case_parts] == [CasePart.MOUNTING_RING.value]
+    # The flush-cut fragment outside each path is merged back into it
+    assert paths[0].volume == pytest.approx(1000 + 4 * 9 * 4)
+    assert paths[1].volume == pytest.approx(1000)
+    assert paths[2].volume == pytest.approx(1000 + 4 * 9 * 4)
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from config import CaseShape, Config
+from puzzle.puzzle import Puzzle
+from puzzle.utils.geometry import euclidean_distance
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def _path_cost(path) -> float:
+    return sum(euclidean_distance(a, b) for a, b in zip(path, path[1:]))
+
+
+@pytest.fixture
+def puzzle():
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=CaseShape.SPHERE,
+    )
+    # Start from a clean grid, keep obstacle nodes blocked
+    for node in puzzle.nodes:
+        if not node.is_obstacle_occupied:
+            node.occupied = False
+    return puzzle
+
+
+def test_nearest_goal_has_lowest_true_path_cost(puzzle):
+    path_finder = puzzle.path_finder
+    rng = random.Random(11)
+    free_nodes = [n for n in puzzle.nodes if not n.occupied and not n.waypoint]
+    start = puzzle.start_node
+
+    for _ in range(5):
+        goals = rng.sample(free_nodes, 6)
+
+        winner, path = path_finder.find_path_to_nearest(start, goals, puzzle)
+        assert winner in goals
+        assert path[0] is start and path[-1] is winner
+
+        # Reference: plain A* searches, one per candidate
+        costs = []
+        for goal in goals:
+            goal_path = path_finder.find_path(start, goal, puzzle)
+            if goal_path is not None:
+                costs.append(_path_cost(goal_path))
+
+        assert _path_cost(path) == pytest.approx(min(costs))
+
+
+def test_nearest_skips_unreachable_goals(puzzle):
+    path_finder = puzzle.path_finder
+    graph = puzzle.node_graph
+    start = puzzle.start_node
+
+    free_nodes = [n for n in puzzle.nodes if not n.occupied and not n.waypoint]
+    free_nodes.sort(key=lambda n: euclidean_distance(start, n))
+
+    # Wall off a goal close to the start so it cannot be reached
+    start_neighbors = {n for n, _ in graph.neighbors(start)}
+    walled_goal = next(n for n in free_nodes[5:] if n not in start_neighbors)
+    for neighbor, _ in graph.neighbors(walled_goal):
+        neighbor.occupied = True
+
+    far_goal = next(n for n in reversed(free_nodes) if not n.occupied)
+
+    winner, path = path_finder.find_path_to_nearest(
+        start, [walled_goal, far_goal], puzzle
+    )
+
+    assert winner is far_goal
+    assert path[-1] is far_goal
+    assert all(not node.occupied for node in path[1:-1])
+
+
+def test_nearest_without_goals_returns_none(puzzle):
+    assert puzzle.path_finder.find_path_to_nearest(puzzle.start_node, [], puzzle) == (
+        None,
+        None,
+    )
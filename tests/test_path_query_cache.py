@@ -0,0 +1,75 @@
+import pytest
+
+from config import CaseShape, Config
+from puzzle.path_query_cache import PathQueryCache, ZobristHash
+from puzzle.puzzle import Puzzle
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def test_lru_evicts_least_recently_used():
+    cache = PathQueryCache(max_size=2)
+    cache.store("a", ["path-a"])
+    cache.store("b", None)
+    assert cache.lookup("a") == (True, ["path-a"])
+
+    cache.store("c", ["path-c"])
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a")[0]
+    assert cache.lookup("c")[0]
+    assert cache.evictions == 1
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_zobrist_hash_is_order_independent():
+    first = ZobristHash(16)
+    second = ZobristHash(16)
+    for node_id in (3, 7, 11):
+        first.toggle(node_id)
+    for node_id in (11, 3, 7, 5, 5):
+        second.toggle(node_id)
+
+    assert first.value == second.value
+    first.toggle(7)
+    assert first.value != second.value
+
+
+def test_find_path_caches_paths_and_failures():
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=CaseShape.SPHERE,
+    )
+    path_finder = puzzle.path_finder
+    cache = path_finder.query_cache
+    free_nodes = [n for n in puzzle.nodes if not n.is_obstacle_occupied]
+    for node in free_nodes:
+        node.occupied = False
+    start, goal = free_nodes[0], free_nodes[-1]
+
+    path = path_finder.find_path(start, goal, puzzle, occupancy_hash=1)
+    assert path is not None
+    assert path_finder.find_path(start, goal, puzzle, occupancy_hash=1) == path
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Wall off the goal, a new fingerprint gives a fresh (failed) search
+    for neighbor, _ in puzzle.node_graph.neighbors(goal):
+        if neighbor is not start:
+            neighbor.occupied = True
+    assert path_finder.find_path(start, goal, puzzle, occupancy_hash=2) is None
+    assert path_finder.find_path(start, goal, puzzle, occupancy_hash=2) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Queries without a fingerprint bypass the cache
+    path_finder.find_path(start, goal, puzzle)
+    assert (cache.hits, cache.misses) == (2, 2)
@@ -0,0 +1,107 @@
+import itertools
+
+import numpy as np
+import pytest
+from build123d import Extrinsic, Location, Pos, Rotation, Vector
+
+from obstacles.obstacle_manager import ObstacleManager
+from obstacles.placement_search import (
+    PlacementGrid,
+    distinct_orientations,
+    orientation_masks,
+    rotation_matrix,
+)
+from puzzle.node import Node
+
+NODE_SIZE = 10.0
+
+
+def _lattice_nodes(size: int) -> list[Node]:
+    return [
+        Node(x * NODE_SIZE, y * NODE_SIZE, z * NODE_SIZE)
+        for x, y, z in itertools.product(range(size), repeat=3)
+    ]
+
+
+def test_rotation_matrix_matches_build123d_rotation():
+    point = Vector(1, 2, 3)
+    for angles in ObstacleManager._generate_24_xyz_orientations():
+        location = Rotation(*angles, ordering=Extrinsic.XYZ) * Location(Pos(point))
+        rotated = rotation_matrix(*angles) @ np.array([1, 2, 3])
+
+        assert tuple(location.position) == pytest.approx(tuple(rotated), abs=1e-9)
+
+
+def test_orientation_masks_rotate_offsets():
+    occupied = np.array([[0, 0, 0], [1, 0, 0]])
+    overlap = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+
+    masks = orientation_masks(occupied, overlap, [(0, 0, 0), (0, 0, 90)])
+
+    assert masks[1].angles == (0, 0, 90)
+    assert masks[1].occupied.tolist() == [[0, 0, 0], [0, 1, 0]]
+    low, high = masks[1].margins
+    assert low.tolist() == [0, 0, 0]
+    assert high.tolist() == [0, 2, 0]
+
+
+def test_valid_origins_follow_placement_rules():
+    grid = PlacementGrid(_lattice_nodes(5), NODE_SIZE)
+    grid.mark_occupied(np.array([[2, 2, 0]]))
+    grid.mark_overlap(np.array([[4, 0, 0]]))
+    # L-shaped obstacle with an overlap node one step further along x
+    occupied = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    overlap = np.concatenate([occupied, [[2, 0, 0]]])
+    (masks,) = orientation_masks(occupied, overlap, [(0, 0, 0)])
+
+    origins = {tuple(row) for row in (grid.valid_origins(masks) / NODE_SIZE).tolist()}
+
+    expected = set()
+    for x, y, z in itertools.product(range(5), repeat=3):
+        cells = {(x + dx, y + dy, z) for dx, dy in ((0, 0), (1, 0), (0, 1))}
+        in_grid = all(0 <= c < 5 for cell in cells for c in cell)
+        if x + 2 > 4 or not in_grid:
+            continue
+        # Occupied nodes clash with occupied and overlap nodes, the overlap node
+        # only with occupied ones
+        if cells & {(2, 2, 0), (4, 0, 0)} or (x + 2, y, z) == (2, 2, 0):
+            continue
+        expected.add((x, y, z))
+    assert origins == expected
+    assert (0, 0, 1) in origins and (1, 2, 0) not in origins
+
+
+def test_no_origins_when_obstacle_does_not_fit():
+    grid = PlacementGrid(_lattice_nodes(2), NODE_SIZE)
+    occupied = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    (masks,) = orientation_masks(occupied, occupied, [(0, 0, 0)])
+
+    assert grid.valid_origins(masks).shape == (0, 3)
+
+
+def test_grid_lookups_and_marks():
+    grid = PlacementGrid(_lattice_nodes(3), NODE_SIZE)
+    cells = np.array([[0, 0, 0], [2, 2, 2], [3, 0, 0], [-1, 0, 0]])
+
+    grid.mark_occupied(cells)
+
+    assert grid.in_grid_at(cells).tolist() == [True, True, False, False]
+    assert grid.occupied_at(cells).tolist() == [True, True, False, False]
+    assert not grid.overlap_at(cells).any()
+    assert grid.key(np.array([2, -1, 0])) == (20.0, -10.0, 0.0)
+
+
+def test_distinct_orientations_of_symmetric_shape():
+    # Straight bar along x, entry and exit at both ends
+    bar = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0]])
+    entry_exit = np.array([[-1, 0, 0], [1, 0, 0]])
+    orientations = ObstacleManager._generate_24_xyz_orientations()
+    masks = orientation_masks(bar, bar, orientations)
+
+    distinct = distinct_orientations(masks, entry_exit)
+
+    # One orientation per axis the bar can lie along
+    assert len(distinct) == 3
+    assert distinct[0].angles == orientations[0]
+    # Entry and exit on different cells keep orientations apart
+    assert len(distinct_orientations(masks, entry_exit[:1])) == 6
@@ -0,0 +1,63 @@
+import pytest
+from build123d import Location
+
+from cad.path_profile_type_shapes import (
+    PROFILE_TYPE_FUNCTIONS,
+    PathProfileType,
+    ProfileSketchCache,
+)
+from cad.sweep_cache import shape_digest
+from config import Config
+
+
+def _parameters(profile_type: PathProfileType) -> dict:
+    return Config.Path.PATH_PROFILE_TYPE_PARAMETERS.get(profile_type.value, {})
+
+
+@pytest.mark.parametrize("profile_type", list(PathProfileType))
+def test_cached_sketch_matches_profile_function(profile_type):
+    cache = ProfileSketchCache()
+    parameters = _parameters(profile_type)
+
+    built = PROFILE_TYPE_FUNCTIONS[profile_type](**parameters, rotation_angle=30)
+    cached = cache.get(profile_type, parameters, rotation_angle=30)
+
+    assert shape_digest(cached) == shape_digest(built)
+    assert cached.area == pytest.approx(built.sketch_local.area)
+
+
+def test_repeated_requests_avoid_builds():
+    cache = ProfileSketchCache()
+    parameters = _parameters(PathProfileType.U_SHAPE)
+
+    for _ in range(3):
+        for rotation_angle in (-90, 0, 90):
+            cache.get(PathProfileType.U_SHAPE, parameters, rotation_angle)
+    # Same parameters in another dict, angle as a float
+    cache.get(PathProfileType.U_SHAPE, dict(parameters), -90.0)
+
+    assert cache.builds == 3
+    assert cache.builds_avoided == 7
+
+
+def test_key_depends_on_parameters():
+    cache = ProfileSketchCache()
+    parameters = _parameters(PathProfileType.U_SHAPE)
+
+    regular = cache.get(PathProfileType.U_SHAPE, parameters)
+    wide = cache.get(PathProfileType.U_SHAPE, {**parameters, "factor": 1.3})
+
+    assert cache.builds == 2
+    assert wide.area > regular.area
+
+
+def test_copies_are_independent():
+    cache = ProfileSketchCache()
+    parameters = _parameters(PathProfileType.O_SHAPE)
+
+    first = cache.get(PathProfileType.O_SHAPE, parameters)
+    first.move(Location((10, 0, 0)))
+    second = cache.get(PathProfileType.O_SHAPE, parameters)
+
+    assert second.center().X == pytest.approx(0, abs=1e-6)
+    assert first.center().X == pytest.approx(10)
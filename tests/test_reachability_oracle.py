@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from config import CaseShape, Config
+from puzzle.puzzle import Puzzle
+from puzzle.reachability_oracle import ReachabilityOracle
+
+
+@pytest.fixture(autouse=True)
+def disable_random_obstacles():
+    original_setting = Config.Obstacles.RANDOM_PLACEMENT_ENABLED
+    Config.Obstacles.RANDOM_PLACEMENT_ENABLED = False
+    try:
+        yield
+    finally:
+        Config.Obstacles.RANDOM_PLACEMENT_ENABLED = original_setting
+
+
+def _make_puzzle(case_shape: CaseShape) -> Puzzle:
+    puzzle = Puzzle(
+        node_size=Config.Puzzle.NODE_SIZE,
+        seed=Config.Puzzle.SEED,
+        case_shape=case_shape,
+    )
+    for node in puzzle.nodes:
+        if not node.is_obstacle_occupied:
+            node.occupied = False
+    puzzle.rebuild_node_graph()
+    return puzzle
+
+
+def _reference_unreachable(puzzle, source, targets):
+    path_finder = puzzle.path_finder
+    return [
+        target
+        for target in targets
+        if path_finder.find_path(source, target, puzzle) is None
+    ]
+
+
+@pytest.mark.parametrize("case_shape", [CaseShape.SPHERE, CaseShape.CYLINDER])
+def test_oracle_matches_path_finder(case_shape):
+    puzzle = _make_puzzle(case_shape)
+    rng = random.Random(5)
+    free_nodes = [n for n in puzzle.node_graph.nodes if not n.occupied]
+
+    # Scatter walls so the free grid splits into several regions
+    for node in rng.sample(free_nodes, len(free_nodes) // 3):
+        if not node.waypoint:
+            node.occupied = True
+
+    oracle = ReachabilityOracle(puzzle.node_graph)
+    candidates = [n for n in free_nodes if not n.occupied and not n.waypoint]
+    for _ in range(5):
+        source = rng.choice(candidates)
+        targets = rng.sample(candidates, 8)
+        assert oracle.unreachable_targets(source, targets) == _reference_unreachable(
+            puzzle, source, targets
+        )
+
+
+def test_incremental_updates_match_refresh():
+    puzzle = _make_puzzle(CaseShape.SPHERE)
+    rng = random.Random(9)
+    free_nodes = [
+        n for n in puzzle.node_graph.nodes if not n.occupied and not n.waypoint
+    ]
+
+    oracle = ReachabilityOracle(puzzle.node_graph)
+    reference = ReachabilityOracle(puzzle.node_graph)
+
+    blocked = rng.sample(free_nodes, len(free_nodes) // 2)
+    for node in blocked:
+        node.occupied = True
+    oracle.occupy(blocked)
+    reference.refresh()
+
+    source = next(n for n in free_nodes if not n.occupied)
+    targets = rng.sample(free_nodes, 20)
+    assert oracle.unreachable_targets(source, targets) == reference.unreachable_targets(
+        source, targets
+    )
+    assert oracle.unreachable_targets(source, targets)
+
+    for node in blocked:
+        node.occupied = False
+    oracle.release(blocked)
+
+    assert not oracle.unreachable_targets(source, targets)
@@ -0,0 +1,119 @@
+import pytest
+import numpy as np
+from build123d import CenterArc, Spline
+
+from cad.path_profile_type_shapes import PathProfileType, create_path_profile
+from cad.spline_prescreen import (
+    CORRIDOR_DEVIATION,
+    MIN_RADIUS,
+    SELF_PROXIMITY,
+    SplinePrescreenStats,
+    max_corridor_deviation,
+    min_radius_of_curvature,
+    profile_half_width,
+    sample_curve,
+    screen_spline,
+)
+from config import Config
+from puzzle.node import Node
+
+HALF_WIDTH = 5.0
+NODE_SIZE = 10.0
+
+
+def _screen(curve, nodes):
+    return screen_spline(
+        curve,
+        nodes,
+        half_width=HALF_WIDTH,
+        node_size=NODE_SIZE,
+        min_radius_factor=0.6,
+        max_corridor_deviation_nodes=1.5,
+    )
+
+
+def _nodes(*points):
+    return [Node(*point) for point in points]
+
+
+def test_profile_half_width_of_main_profile():
+    profile = create_path_profile(
+        PathProfileType.U_SHAPE,
+        Config.Path.PATH_PROFILE_TYPE_PARAMETERS[PathProfileType.U_SHAPE.value],
+    )
+
+    assert profile_half_width(profile) == pytest.approx(5.0, abs=0.01)
+
+
+def test_radius_of_curvature_of_a_circle():
+    radius = 20.0
+    _, first, second = sample_curve(CenterArc((0, 0, 0), radius, 0, 90), 50)
+
+    assert min_radius_of_curvature(first, second) == pytest.approx(radius)
+
+
+def test_gentle_spline_passes():
+    nodes = _nodes((0, 0, 0), (10, 0, 0), (20, 0, 0), (30, 10, 0), (30, 20, 0))
+    curve = Spline([(0, 0, 0), (30, 20, 0)], tangents=[(1, 0, 0), (0, 1, 0)])
+
+    result = _screen(curve, nodes)
+
+    assert result.rejected_by is None
+    assert result.max_corridor_deviation < NODE_SIZE
+
+
+def test_tight_bend_is_rejected_on_radius():
+    nodes = _nodes((0, 0, 0), (10, 0, 0), (10, 10, 0))
+    # Tangents that force a kink well inside the profile half-width
+    curve = Spline(
+        [(0, 0, 0), (10, 0, 0), (10, 10, 0)], tangents=[(1, 0, 0), (0, -1, 0)]
+    )
+
+    assert _screen(curve, nodes).rejected_by == MIN_RADIUS
+
+
+def test_loop_is_rejected_on_self_proximity():
+    # Wide loop, gentle curvature, but the end returns next to the start
+    curve = CenterArc((0, 0, 0), 20, 0, 350)
+    nodes = [Node(*curve.position_at(t)) for t in np.linspace(0, 1, 12)]
+    result = _screen(curve, nodes)
+
+    assert result.min_radius >= 0.6 * HALF_WIDTH
+    assert result.rejected_by == SELF_PROXIMITY
+
+
+def test_bulging_spline_is_rejected_on_corridor_deviation():
+    nodes = [Node(x, 0, 0) for x in range(0, 81, 10)]
+    # Gentle arch that leaves the straight run of nodes by 2.5 node sizes
+    curve = Spline([(0, 0, 0), (40, 25, 0), (80, 0, 0)])
+
+    assert _screen(curve, nodes).rejected_by == CORRIDOR_DEVIATION
+
+
+def test_corridor_deviation_against_polyline():
+    corridor = _nodes((0, 0, 0), (10, 0, 0), (10, 10, 0))
+    points = [(5, 2, 0), (12, 5, 0), (10, 10, 0)]
+
+    deviation = max_corridor_deviation(
+        np.array(points, dtype=float),
+        np.array([(n.x, n.y, n.z) for n in corridor], dtype=float),
+    )
+
+    assert deviation == pytest.approx(2.0)
+
+
+def test_stats_count_saved_sweeps_per_screen():
+    stats = SplinePrescreenStats()
+    nodes = _nodes((0, 0, 0), (10, 0, 0), (10, 10, 0))
+    kinked = Spline(
+        [(0, 0, 0), (10, 0, 0), (10, 10, 0)], tangents=[(1, 0, 0), (0, -1, 0)]
+    )
+    straight = Spline([(0, 0, 0), (10, 0, 0)])
+
+    stats.record(_screen(kinked, nodes), sweep_count=3)
+    stats.record(_screen(kinked, nodes), sweep_count=2)
+    stats.record(_screen(straight, nodes[:2]), sweep_count=3)
+
+    assert stats.screened == 3
+    assert stats.rejected == {MIN_RADIUS: 2}
+    assert stats.sweeps_saved == {MIN_RADIUS: 5}
@@ -0,0 +1,245 @@
+import os
+from pathlib import Path
+
+import pytest
+from build123d import (
+    BuildLine,
+    BuildPart,
+    BuildSketch,
+    Polyline,
+    Rectangle,
+    Spline,
+    Transition,
+    add,
+    sweep,
+)
+
+import config
+from cad import path_builder
+from cad.path_builder import PathBuilder, SweepJob, sweep_single_profile
+from cad.path_profile_type_shapes import create_path_profile
+from cad.path_segment import PathSegment
+from cad.sweep_cache import (
+    CachedSweepFailure,
+    SweepCache,
+    cached_check,
+    cached_sweep,
+    get_sweep_cache,
+    shape_digest,
+)
+from config import Config, PathProfileType
+from puzzle.node import Node
+
+
+@pytest.fixture
+def sweep_cache_dir(tmp_path):
+    original_enabled = Config.Path.SWEEP_CACHE_ENABLED
+    original_dir = Config.Path.SWEEP_CACHE_DIR
+    Config.Path.SWEEP_CACHE_ENABLED = True
+    Config.Path.SWEEP_CACHE_DIR = str(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        Config.Path.SWEEP_CACHE_ENABLED = original_enabled
+        Config.Path.SWEEP_CACHE_DIR = original_dir
+
+
+def make_path():
+    return Spline([(0, 0, 0), (10, 5, 0), (20, 0, 3)], tangents=[(1, 0, 0), (0, 1, 0)])
+
+
+def make_body(path, width: float = 2) -> BuildPart:
+    with BuildPart() as body:
+        with BuildLine() as path_line:
+            add(path)
+        with BuildSketch(path_line.line ^ 0):
+            Rectangle(width, 3)
+        sweep()
+    return body
+
+
+def test_digest_ignores_builder_usage():
+    path = make_path()
+    digest = shape_digest(path)
+
+    # Adding the path to builders changes its shape flags, not its geometry
+    make_body(path)
+
+    assert shape_digest(path) == digest
+    assert shape_digest(make_path()) == digest
+
+
+def test_store_and_lookup_round_trip(tmp_path):
+    cache = SweepCache(tmp_path, max_size_bytes=10 * 1024 * 1024)
+    body = make_body(make_path())
+    key = cache.key("single_profile", "path", "profile")
+
+    assert cache.lookup(key) == (False, None)
+    cache.store(key, body)
+    found, cached_body = cache.lookup(key)
+
+    assert found
+    assert cached_body.part.volume == pytest.approx(body.part.volume)
+    assert shape_digest(cached_body.part) == shape_digest(body.part)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_key_depends_on_every_input(tmp_path):
+    cache = SweepCache(tmp_path, max_size_bytes=1024)
+    key = cache.key("single_profile", "path", "profile", False)
+
+    assert cache.key("single_profile", "path", "profile", False) == key
+    assert cache.key("single_profile", "path", "profile", True) != key
+    assert cache.key("multisection", "path", "profile", False) != key
+
+
+def test_eviction_keeps_cache_within_size_bound(tmp_path):
+    body = make_body(make_path())
+    probe = SweepCache(tmp_path / "probe", max_size_bytes=10 * 1024 * 1024)
+    probe.store("probe", body)
+    body_size = (tmp_path / "probe" / "probe.brep").stat().st_size
+
+    # Room for two bodies
+    cache = SweepCache(tmp_path / "bounded", max_size_bytes=int(body_size * 2.5))
+    for index in range(4):
+        cache.store(f"body-{index}", body)
+        # Distinct modification times, oldest first
+        os.utime(tmp_path / "bounded" / f"body-{index}.brep", (index, index))
+
+    stored = sorted(entry.name for entry in (tmp_path / "bounded").iterdir())
+    assert cache.evictions == 2
+    assert len(stored) == 2
+    assert "body-3.brep" in stored
+
+
+def test_failed_sweeps_are_cached(sweep_cache_dir):
+    calls = []
+
+    def failing_sweep():
+        calls.append(1)
+        raise ValueError("sweep failed")
+
+    with pytest.raises(ValueError):
+        cached_sweep("multisection", ("inputs",), failing_sweep)
+    with pytest.raises(CachedSweepFailure):
+        cached_sweep("multisection", ("inputs",), failing_sweep)
+    assert cached_sweep(
+        "multisection", ("inputs",), failing_sweep, raise_on_failure=False
+    ) is None
+
+    assert len(calls) == 1
+
+
+def test_transient_errors_are_not_cached(sweep_cache_dir):
+    calls = []
+
+    def sweep_out_of_memory():
+        calls.append(1)
+        raise MemoryError()
+
+    for _ in range(2):
+        with pytest.raises(MemoryError):
+            cached_sweep("multisection", ("inputs",), sweep_out_of_memory)
+
+    assert len(calls) == 2
+    assert list(sweep_cache_dir.iterdir()) == []
+
+
+def make_o_shape_sweep_job() -> SweepJob:
+    points = [(0, 0, 0), (20, 0, 0), (20, 20, 0)]
+    segment = PathSegment([Node(*p) for p in points], main_index=0)
+    segment.path = Polyline(points)
+    segment.path_profile_type = PathProfileType.O_SHAPE
+    segment.transition_type = Transition.RIGHT
+    profile = create_path_profile(
+        PathProfileType.O_SHAPE,
+        Config.Path.PATH_PROFILE_TYPE_PARAMETERS.get(PathProfileType.O_SHAPE.value, {}),
+    )
+    return SweepJob(segment, profile, "path_body", "Path")
+
+
+def failing_sweeps(monkeypatch, error: Exception, failures: int) -> list[int]:
+    """Make the first sweeps of the path builder raise error."""
+    calls = []
+
+    def flaky_sweep(*args, **kwargs):
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return sweep(*args, **kwargs)
+
+    monkeypatch.setattr(path_builder, "sweep", flaky_sweep)
+    return calls
+
+
+def test_o_shape_sweep_retries_any_error(sweep_cache_dir, monkeypatch):
+    job = make_o_shape_sweep_job()
+    calls = failing_sweeps(monkeypatch, RuntimeError("seam"), failures=1)
+
+    body = sweep_single_profile(job.segment, job.profile, Transition.RIGHT)
+
+    assert body is not None and body.part.volume > 0
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("error, cached", [(ValueError(), True), (OSError(), False)])
+def test_failed_profile_sweeps_return_none(sweep_cache_dir, monkeypatch, error, cached):
+    job = make_o_shape_sweep_job()
+    calls = failing_sweeps(monkeypatch, error, failures=100)
+
+    for _ in range(2):
+        assert sweep_single_profile(job.segment, job.profile, Transition.RIGHT) is None
+
+    # Every rotation is tried, a known failure is not tried again
+    assert len(calls) == (4 if cached else 8)
+
+
+@pytest.mark.parametrize("error, cached", [(ValueError(), True), (OSError(), False)])
+def test_failed_sweep_jobs_in_workers_return_none(
+    sweep_cache_dir, monkeypatch, error, cached
+):
+    monkeypatch.setattr(Config.Path, "SWEEP_WORKERS", 2)
+    failing_sweeps(monkeypatch, error, failures=100)
+    builder = PathBuilder.__new__(PathBuilder)
+    jobs = [make_o_shape_sweep_job(), make_o_shape_sweep_job()]
+
+    builder._run_sweep_jobs(jobs)
+
+    assert [job.segment.path_body for job in jobs] == [None, None]
+    stored = [entry.name for entry in sweep_cache_dir.iterdir()]
+    assert len(stored) == (1 if cached else 0)
+
+
+def test_sweeps_and_checks_hit_on_second_run(sweep_cache_dir):
+    path = make_path()
+    sweeps = []
+    checks = []
+
+    def sweep_body():
+        sweeps.append(1)
+        return make_body(path)
+
+    def check(part):
+        checks.append(1)
+        return False
+
+    for _ in range(2):
+        body = cached_sweep("single_profile", (shape_digest(path),), sweep_body)
+        assert not cached_check("faces_intersect", body.part, check, 1)
+
+    assert len(sweeps) == 1
+    assert len(checks) == 1
+
+    # A new version of the check does not reuse the old verdicts
+    assert not cached_check("faces_intersect", body.part, check, 2)
+    assert len(checks) == 2
+
+
+def test_relative_cache_dir_is_taken_from_project_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config.Path, "SWEEP_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config.Path, "SWEEP_CACHE_DIR", "sweeps")
+    monkeypatch.chdir(tmp_path)
+
+    project_root = Path(config.__file__).resolve().parent
+    assert get_sweep_cache().cache_dir == project_root / "sweeps"
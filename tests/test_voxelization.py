@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from build123d import Axis, Box, Cylinder, Pos
+
+from cad.mesh_intersection import tessellate_faces
+from cad.voxelization import cell_fill_fractions, surface_cells
+
+
+def _triangles(shape) -> np.ndarray:
+    triangles, _ = tessellate_faces(shape, shape.faces(), 0.01, 0.1)
+    return triangles
+
+
+def _lattice(count: int) -> list[float]:
+    return [float(value) for value in range(-count, count + 1)]
+
+
+def test_fill_fractions_of_offset_box():
+    # Box from 0.25 to 2.25 on every axis, on a lattice of unit cells
+    triangles = _triangles(Pos(1.25, 1.25, 1.25) * Box(2, 2, 2))
+    values = _lattice(3)
+
+    fractions, unreliable = cell_fill_fractions(
+        triangles, values, values, values, 1.0, samples=8
+    )
+
+    assert not unreliable.any()
+    assert fractions.sum() == pytest.approx(8.0, rel=1e-6)
+    # Cells centred on 0, 1 and 2 are filled a quarter, fully and three quarters
+    coverage = np.array([0.25, 1.0, 0.75])
+    expected = np.zeros(fractions.shape)
+    expected[3:6, 3:6, 3:6] = np.einsum("i,j,k->ijk", coverage, coverage, coverage)
+    assert np.abs(fractions - expected).max() < 1 / 8
+
+
+def test_fill_fractions_of_cylinder():
+    triangles = _triangles(Cylinder(2.3, 4))
+    values = _lattice(3)
+
+    fractions, unreliable = cell_fill_fractions(
+        triangles, values, values, values, 1.0, samples=16
+    )
+
+    assert not unreliable.any()
+    assert fractions.sum() == pytest.approx(np.pi * 2.3**2 * 4, rel=1e-2)
+    assert fractions[3, 3, 3] == pytest.approx(1.0)
+    assert fractions[0, 0, 3] == pytest.approx(0.0)
+
+
+def test_open_mesh_is_unreliable():
+    # The top face alone has a single crossing per column
+    triangles = _triangles(Box(2, 2, 2).faces().sort_by(Axis.Z)[-1])
+    values = _lattice(2)
+
+    _, unreliable = cell_fill_fractions(triangles, values, values, values, 1.0)
+
+    assert unreliable.any()
+
+
+def test_surface_cells_of_box():
+    triangles = _triangles(Pos(1.25, 1.25, 1.25) * Box(2, 2, 2))
+    values = _lattice(3)
+
+    mask = surface_cells(triangles, values, values, values, 1.0)
+
+    # The shell of the 3 x 3 x 3 block of cells the box touches
+    expected = np.zeros(mask.shape, dtype=bool)
+    expected[3:6, 3:6, 3:6] = True
+    expected[4, 4, 4] = False
+    assert (mask == expected).all()